@@ -168,7 +168,9 @@ def write_run_json(root: Path, run_log_path: Path | None, args: argparse.Namespa
 
 
 def run(cmd: list[str], cwd: Path, label: str, log: logging.Logger) -> bool:
+    from src.trader.logging_config import flush_logging
     log.info("--- %s ---", label)
+    flush_logging()  # the subprocess appends to the same log file
     r = subprocess.run(cmd, cwd=cwd)
     if r.returncode != 0:
         log.error("Fout bij: %s (exit %d)", label, r.returncode)
@@ -357,7 +357,7 @@ def _evaluate_signals(self) -> None:
             # H1 gate
             if self.strategy_cfg.get("structure_use_h1_gate", False) and not self.candle_buffer_1h.empty:
                 struct_cfg = self.sqe_cfg.get("structure_context", {"lookback": 30, "pivot_bars": 2})
-                h1_data = add_structure_context(self.candle_buffer_1h.copy(), struct_cfg)
+                h1_data = add_structure_context(self.candle_buffer_1h, struct_cfg)
                 col = "in_bullish_structure" if direction == "LONG" else "in_bearish_structure"
                 if not h1_data[col].iloc[-1]:
                     logger.debug("H1 gate blocked %s entry", direction)
@@ -445,8 +445,7 @@ def _update_orders(self) -> None:
 
         mid_price = (price_info["bid"] + price_info["ask"]) / 2
 
-        for trade_id in list(self.order_manager.managed_orders.keys()):
-            self.order_manager.update_price(trade_id, mid_price)
+        self.order_manager.update_prices({self.broker.instrument: mid_price})
 
         # Update account with prices
         self.account.update_prices({self.broker.instrument: mid_price})
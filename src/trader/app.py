@@ -37,10 +37,12 @@ def cmd_optimize(args: argparse.Namespace) -> int:
 
 
 def cmd_fetch(args: argparse.Namespace) -> int:
-    from src.trader.io.parquet_loader import ensure_data
+    from src.trader.io.parquet_loader import ensure_data, set_compression
     cfg = load_config(args.config)
     setup_logging(cfg)
-    base = Path(cfg.get("data", {}).get("base_path", "data/market_cache"))
+    data_cfg = cfg.get("data", {})
+    base = Path(data_cfg.get("base_path", "data/market_cache"))
+    set_compression(data_cfg.get("parquet_compression", "zstd"), data_cfg.get("parquet_compression_level", 3))
     symbol = args.symbol or cfg.get("symbol", "XAUUSD")
     period_days = args.days or cfg.get("backtest", {}).get("default_period_days", 60)
     if args.timeframe:
@@ -48,7 +50,7 @@ def cmd_fetch(args: argparse.Namespace) -> int:
     else:
         timeframes = cfg.get("timeframes", ["15m", "1h"])
     for tf in timeframes:
-        ensure_data(symbol=symbol, timeframe=tf, base_path=base, period_days=period_days)
+        ensure_data(symbol=symbol, timeframe=tf, base_path=base, period_days=period_days, load=False)
     return 0
 
 
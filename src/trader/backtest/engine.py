@@ -8,11 +8,12 @@
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 
 from src.trader.data.schema import Trade, calculate_rr
 from src.trader.data.sessions import session_from_timestamp, ENTRY_SESSIONS
-from src.trader.io.parquet_loader import load_parquet, ensure_data
+from src.trader.io.parquet_loader import load_parquet, ensure_data, set_compression
 from src.trader.strategies.sqe_xauusd import run_sqe_conditions, get_sqe_default_config
 from src.trader.strategy_modules.ict.structure_context import add_structure_context
 
@@ -56,6 +57,10 @@ def _apply_h1_gate(
     return filtered
 
 
+# Bars compared per vectorized step when scanning for a trade's exit
+_EXIT_SCAN_BLOCK = 256
+
+
 def _simulate_trade(
     data: pd.DataFrame,
     i: int,
@@ -64,8 +69,15 @@ def _simulate_trade(
     sl_r: float,
 ) -> dict:
     """Simulate a single trade from bar i, return trade details dict."""
-    entry_price = float(data.iloc[i]["close"])
-    atr = (data["high"] - data["low"]).iloc[max(0, i - 14): i + 1].mean()
+    high = data["high"].to_numpy(dtype=np.float64)
+    low = data["low"].to_numpy(dtype=np.float64)
+    close = data["close"].to_numpy(dtype=np.float64)
+    n = len(data)
+    entry_price = float(close[i])
+    # Mean high-low range of the last 15 bars, NaN bars skipped (as Series.mean())
+    ranges = high[max(0, i - 14): i + 1] - low[max(0, i - 14): i + 1]
+    nan = np.isnan(ranges)
+    atr = np.where(nan, 0.0, ranges).sum() / (len(ranges) - nan.sum()) if not nan.all() else np.nan
     if pd.isna(atr) or atr <= 0:
         atr = entry_price * 0.005
 
@@ -80,33 +92,30 @@ def _simulate_trade(
     exit_price = entry_price
     result = "TIMEOUT"
 
-    for j in range(i + 1, len(data)):
-        row = data.iloc[j]
-        low, high, close = row["low"], row["high"], row["close"]
-        exit_ts = data.index[j]
-
+    # Scan the following bars in blocks for the first SL/TP touch (SL wins on a bar hitting both)
+    for start in range(i + 1, n, _EXIT_SCAN_BLOCK):
+        stop = min(start + _EXIT_SCAN_BLOCK, n)
         if direction == "LONG":
-            if low <= sl:
-                exit_price = sl
-                result = "LOSS"
-                break
-            if high >= tp:
-                exit_price = tp
-                result = "WIN"
-                break
+            loss = low[start:stop] <= sl
+            win = high[start:stop] >= tp
         else:  # SHORT
-            if high >= sl:
+            loss = high[start:stop] >= sl
+            win = low[start:stop] <= tp
+        hit = loss | win
+        if hit.any():
+            k = int(np.argmax(hit))
+            exit_ts = data.index[start + k]
+            if loss[k]:
                 exit_price = sl
                 result = "LOSS"
-                break
-            if low <= tp:
+            else:
                 exit_price = tp
                 result = "WIN"
-                break
-
-        if j == len(data) - 1:
-            exit_price = close
-            result = "TIMEOUT"
+            break
+    else:
+        if i + 1 < n:  # no touch: TIMEOUT at the close of the last bar
+            exit_ts = data.index[n - 1]
+            exit_price = close[n - 1]
 
     profit_usd = (exit_price - entry_price) if direction == "LONG" else (entry_price - exit_price)
     profit_r = calculate_rr(entry_price, exit_price, sl, direction)
@@ -178,7 +187,9 @@ def run_backtest(
     symbol = cfg.get("symbol", "XAUUSD")
     timeframes = cfg.get("timeframes", ["15m"])
     tf = timeframes[0]
-    base_path = Path(cfg.get("data", {}).get("base_path", "data/market_cache"))
+    data_cfg = cfg.get("data", {})
+    base_path = Path(data_cfg.get("base_path", "data/market_cache"))
+    set_compression(data_cfg.get("parquet_compression", "zstd"), data_cfg.get("parquet_compression_level", 3))
     period_days = cfg.get("backtest", {}).get("default_period_days", 60)
     tp_r = cfg.get("backtest", {}).get("tp_r", 2.0)
     sl_r = cfg.get("backtest", {}).get("sl_r", 1.0)
@@ -288,10 +299,12 @@ def run_backtest(
 
     # --- Combine all entries (LONG + SHORT) into ordered list ---
     entry_signals = []
-    for i in range(1, len(data) - 1):
-        if long_entries.iloc[i]:
+    long_arr = long_entries.to_numpy(dtype=bool)
+    short_arr = short_entries.to_numpy(dtype=bool)
+    for i in (np.flatnonzero((long_arr | short_arr)[1:-1]) + 1).tolist():
+        if long_arr[i]:
             entry_signals.append((i, "LONG"))
-        if short_entries.iloc[i]:
+        if short_arr[i]:
             entry_signals.append((i, "SHORT"))
 
     # --- Risk management state ---
@@ -3,7 +3,7 @@
 """
 import os
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 import yaml
 from dotenv import load_dotenv
@@ -13,6 +13,28 @@
 _DEFAULT_PATH = Path(__file__).resolve().parents[2] / "configs" / "default.yaml"
 
 
+def _resolve_config_path(path: str | Path | None) -> Path:
+    cfg_path = Path(path or os.getenv("CONFIG_PATH") or _DEFAULT_PATH)
+    if not cfg_path.is_absolute():
+        base = Path(__file__).resolve().parents[2]
+        cfg_path = base / cfg_path
+    return cfg_path
+
+
+def config_sources_key(path: str | Path | None = None) -> Tuple:
+    """
+    Fingerprint of everything load_config(path) reads (file paths + mtimes, env
+    overrides); equal keys mean load_config would return the same config.
+    """
+    stamps = []
+    for p in (_DEFAULT_PATH, _resolve_config_path(path)):
+        try:
+            stamps.append((str(p), p.stat().st_mtime_ns))
+        except OSError:
+            stamps.append((str(p), None))
+    return tuple(stamps) + (os.getenv("DATA_PATH"), os.getenv("CACHE_TTL_HOURS"))
+
+
 def load_config(path: str | Path | None = None) -> Dict[str, Any]:
     """Load config from YAML; merge with default; override from env where applicable."""
     default = {}
@@ -20,11 +42,7 @@ def load_config(path: str | Path | None = None) -> Dict[str, Any]:
         with open(_DEFAULT_PATH, "r", encoding="utf-8") as f:
             default = yaml.safe_load(f) or {}
 
-    cfg_path = path or os.getenv("CONFIG_PATH") or _DEFAULT_PATH
-    cfg_path = Path(cfg_path)
-    if not cfg_path.is_absolute():
-        base = Path(__file__).resolve().parents[2]
-        cfg_path = base / cfg_path
+    cfg_path = _resolve_config_path(path)
 
     merged = dict(default)
     if cfg_path.exists():
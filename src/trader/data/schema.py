@@ -3,7 +3,7 @@
 """
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Literal, Optional
+from typing import Literal, Optional, Tuple
 
 
 @dataclass
@@ -35,3 +35,19 @@ def calculate_rr(entry: float, exit_price: float, sl: float, direction: str) ->
         risk = abs(sl - entry)
         profit = entry - exit_price
     return (profit / risk) if risk else 0.0
+
+
+def trade_profit(
+    direction_sign: float,
+    entry: float,
+    exit_price: float,
+    sl: float,
+    volume: float,
+) -> Tuple[float, float]:
+    """
+    (profit_usd, profit_r) of a closed position. direction_sign: +1.0 LONG, -1.0 SHORT.
+    Risk is the entry-to-SL distance times volume; profit_r is 0.0 when there is no risk.
+    """
+    profit_usd = direction_sign * (exit_price - entry) * volume
+    risk = abs(entry - sl) * volume
+    return profit_usd, (profit_usd / risk if risk > 0 else 0.0)
@@ -13,16 +13,28 @@
   - CNN Fear & Greed Index — broad market sentiment
 """
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Literal, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 
+from src.trader.io.jsonio import dumps
+
 logger = logging.getLogger(__name__)
 
 
+# Source names (shared by weights, readings and to_dict keys)
+SOURCE_DXY = "dxy"
+SOURCE_US10Y = "us10y"
+SOURCE_VIX = "vix"
+SOURCE_COT = "cot"
+SOURCE_ETF_FLOWS = "etf_flows"
+SOURCE_FEAR_GREED = "fear_greed"
+
+
 @dataclass
 class SentimentReading:
     """A single sentiment data point."""
@@ -46,15 +58,20 @@ def __post_init__(self):
         if self.timestamp is None:
             self.timestamp = datetime.utcnow()
 
-    def to_dict(self) -> dict:
+    def to_dict(self, rounded: bool = True) -> dict:
+        """
+        Dict view for logging/reports. rounded=False skips the per-field round()
+        calls for callers that serialize or format the floats themselves.
+        """
+        rnd = round if rounded else _keep
         return {
-            "score": round(self.score, 3),
-            "confidence": round(self.confidence, 2),
+            "score": rnd(self.score, 3),
+            "confidence": rnd(self.confidence, 2),
             "timestamp": self.timestamp.isoformat() if self.timestamp else None,
             "readings": {
                 r.source: {
-                    "value": round(r.value, 4),
-                    "normalized": round(r.normalized, 3),
+                    "value": rnd(r.value, 4),
+                    "normalized": rnd(r.normalized, 3),
                     "weight": r.weight,
                     "stale": r.stale,
                 }
@@ -62,15 +79,25 @@ def to_dict(self) -> dict:
             },
         }
 
+    def to_json_bytes(self) -> bytes:
+        """
+        Serialize unrounded to JSON bytes for logging/metrics.
+        """
+        return dumps(self.to_dict(rounded=False))
+
+
+def _keep(x: float, _ndigits: int) -> float:
+    return x
+
 
 # Default weights
 DEFAULT_WEIGHTS = {
-    "dxy": 0.25,
-    "cot": 0.25,
-    "us10y": 0.15,
-    "vix": 0.15,
-    "etf_flows": 0.10,
-    "fear_greed": 0.10,
+    SOURCE_DXY: 0.25,
+    SOURCE_COT: 0.25,
+    SOURCE_US10Y: 0.15,
+    SOURCE_VIX: 0.15,
+    SOURCE_ETF_FLOWS: 0.10,
+    SOURCE_FEAR_GREED: 0.10,
 }
 
 # Default sentiment config
@@ -84,15 +111,23 @@ def to_dict(self) -> dict:
     "contrary_block": True,  # block trades contrary to strong sentiment
     "contrary_threshold": 0.3,  # abs(score) threshold for contrary blocking
     "stale_data_hours": {
-        "dxy": 4,
-        "us10y": 4,
-        "vix": 4,
-        "cot": 168,  # weekly (7 days)
-        "etf_flows": 24,
-        "fear_greed": 24,
+        SOURCE_DXY: 4,
+        SOURCE_US10Y: 4,
+        SOURCE_VIX: 4,
+        SOURCE_COT: 168,  # weekly (7 days)
+        SOURCE_ETF_FLOWS: 24,
+        SOURCE_FEAR_GREED: 24,
     },
 }
 
+# yfinance-backed sources: (source, ticker, period, label for logging)
+YF_SOURCES = (
+    (SOURCE_DXY, "DX-Y.NYB", "6mo", "DXY"),
+    (SOURCE_US10Y, "^TNX", "6mo", "US10Y"),
+    (SOURCE_VIX, "^VIX", "6mo", "VIX"),
+    (SOURCE_ETF_FLOWS, "GLD", "3mo", "GLD"),
+)
+
 
 def _normalize_inverse(value: float, mean: float, std: float) -> float:
     """
@@ -116,6 +151,82 @@ def _normalize_direct(value: float, mean: float, std: float) -> float:
     return float(np.clip(np.tanh(z), -1.0, 1.0))
 
 
+# Integer direction codes; accepted wherever a "LONG"/"SHORT" direction is
+DIR_LONG = 1
+DIR_SHORT = -1
+_DIR_CODES = {"LONG": DIR_LONG, "SHORT": DIR_SHORT, DIR_LONG: DIR_LONG, DIR_SHORT: DIR_SHORT}
+
+Direction = Union[Literal["LONG", "SHORT"], int]
+
+
+def _direction_code(direction: Direction) -> int:
+    """Map "LONG"/"SHORT" or 1/-1 to 1/-1; anything else -> 0 (no sentiment rule applies)."""
+    return _DIR_CODES.get(direction, 0)
+
+
+ArrayLike = Union[pd.Series, np.ndarray]
+
+
+def _as_float_array(values: ArrayLike) -> np.ndarray:
+    """pd.Series or np.ndarray -> float64 ndarray (a view when no conversion is needed)."""
+    if hasattr(values, "to_numpy"):
+        values = values.to_numpy()
+    return np.asarray(values, dtype=np.float64)
+
+
+def _tail_stats(values: ArrayLike, lookback: int) -> Tuple[float, float, float]:
+    """(current, mean, std) over the last `lookback` values; NaN-skipping, sample std like pandas."""
+    arr = _as_float_array(values)
+    window = arr[-lookback:]
+    return float(arr[-1]), float(np.nanmean(window)), float(np.nanstd(window, ddof=1))
+
+
+def normalize_batch(
+    values: np.ndarray,
+    mean: np.ndarray,
+    std: np.ndarray,
+    inverse: bool = False,
+) -> np.ndarray:
+    """
+    Array version of _normalize_direct/_normalize_inverse for backtest replay.
+    Broadcasts values/mean/std; entries with std <= 0 normalize to 0.0.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    std = np.asarray(std, dtype=np.float64)
+    z = np.zeros(np.broadcast(values, mean, std).shape)
+    np.divide(values - mean, std, out=z, where=std > 0)
+    out = np.tanh(z, out=z)
+    if inverse:
+        np.negative(out, out=out)
+    return out
+
+
+def composite_score_batch(
+    normalized: np.ndarray,
+    weights: np.ndarray,
+    stale: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Batch version of SentimentEngine.composite_score for backtest replay.
+
+    normalized: (N, K) normalized readings per bar and source
+    weights:    (K,) source weights
+    stale:      (N, K) bool mask; stale readings are excluded from the score
+    Returns (scores, confidences), each of shape (N,).
+    """
+    normalized = np.asarray(normalized, dtype=np.float64)
+    stale = np.asarray(stale, dtype=bool)
+    active_w = np.where(stale, 0.0, np.asarray(weights, dtype=np.float64))
+    total_w = active_w.sum(axis=1)
+    weighted = np.where(stale, 0.0, normalized * active_w).sum(axis=1)
+
+    scores = np.zeros_like(total_w)
+    np.divide(weighted, total_w, out=scores, where=total_w > 0)
+    np.clip(scores, -1.0, 1.0, out=scores)
+    confidences = 1.0 - stale.sum(axis=1) / stale.shape[1]
+    return scores, confidences
+
+
 class SentimentEngine:
     """
     Multi-source sentiment engine for XAUUSD.
@@ -126,11 +237,29 @@ class SentimentEngine:
     def __init__(self, config: Optional[Dict] = None):
         self.config = {**DEFAULT_SENTIMENT_CONFIG, **(config or {})}
         self.weights = self.config.get("weights", DEFAULT_WEIGHTS)
+
+        # Resolved once: weights and thresholds are fixed after construction
+        self._w_dxy = self.weights.get(SOURCE_DXY, 0.25)
+        self._w_us10y = self.weights.get(SOURCE_US10Y, 0.15)
+        self._w_vix = self.weights.get(SOURCE_VIX, 0.15)
+        self._w_cot = self.weights.get(SOURCE_COT, 0.25)
+        self._w_etf_flows = self.weights.get(SOURCE_ETF_FLOWS, 0.10)
+        self._w_fear_greed = self.weights.get(SOURCE_FEAR_GREED, 0.10)
+        cfg = self.config
+        self._min_long = cfg.get("min_score_long", 0.1)
+        self._min_short = cfg.get("min_score_short", -0.1)
+        self._contrary_block = cfg.get("contrary_block", True)
+        self._contrary_thresh = cfg.get("contrary_threshold", 0.3)
+        self._boost_thresh = cfg.get("strong_signal_boost", 0.3)
+        self._boost_mult = cfg.get("strong_signal_multiplier", 1.5)
+
         self._cache: Dict[str, Tuple[float, datetime]] = {}
+        # (ticker, period, interval) -> (DataFrame, fetched_at); daily bars rarely change intra-session
+        self._dl_cache: Dict[Tuple[str, str, str], Tuple[pd.DataFrame, datetime]] = {}
 
     def compute_dxy_sentiment(
         self,
-        dxy_series: pd.Series,
+        dxy_series: ArrayLike,
         lookback: int = 50,
     ) -> SentimentReading:
         """
@@ -138,19 +267,16 @@ def compute_dxy_sentiment(
         Strong dollar = bearish for gold, weak dollar = bullish.
         """
         if dxy_series is None or len(dxy_series) < 10:
-            return SentimentReading("dxy", 0.0, 0.0, self.weights.get("dxy", 0.25), stale=True)
+            return SentimentReading(SOURCE_DXY, 0.0, 0.0, self._w_dxy, stale=True)
 
-        recent = dxy_series.tail(lookback)
-        current = float(dxy_series.iloc[-1])
-        mean = float(recent.mean())
-        std = float(recent.std())
+        current, mean, std = _tail_stats(dxy_series, lookback)
 
         normalized = _normalize_inverse(current, mean, std)
-        return SentimentReading("dxy", current, normalized, self.weights.get("dxy", 0.25))
+        return SentimentReading(SOURCE_DXY, current, normalized, self._w_dxy)
 
     def compute_us10y_sentiment(
         self,
-        yield_series: pd.Series,
+        yield_series: ArrayLike,
         lookback: int = 50,
     ) -> SentimentReading:
         """
@@ -158,19 +284,16 @@ def compute_us10y_sentiment(
         Higher yields = bearish (opportunity cost), lower yields = bullish.
         """
         if yield_series is None or len(yield_series) < 10:
-            return SentimentReading("us10y", 0.0, 0.0, self.weights.get("us10y", 0.15), stale=True)
+            return SentimentReading(SOURCE_US10Y, 0.0, 0.0, self._w_us10y, stale=True)
 
-        recent = yield_series.tail(lookback)
-        current = float(yield_series.iloc[-1])
-        mean = float(recent.mean())
-        std = float(recent.std())
+        current, mean, std = _tail_stats(yield_series, lookback)
 
         normalized = _normalize_inverse(current, mean, std)
-        return SentimentReading("us10y", current, normalized, self.weights.get("us10y", 0.15))
+        return SentimentReading(SOURCE_US10Y, current, normalized, self._w_us10y)
 
     def compute_vix_sentiment(
         self,
-        vix_series: pd.Series,
+        vix_series: ArrayLike,
         lookback: int = 50,
     ) -> SentimentReading:
         """
@@ -178,19 +301,16 @@ def compute_vix_sentiment(
         Higher VIX = more fear = bullish for gold.
         """
         if vix_series is None or len(vix_series) < 10:
-            return SentimentReading("vix", 0.0, 0.0, self.weights.get("vix", 0.15), stale=True)
+            return SentimentReading(SOURCE_VIX, 0.0, 0.0, self._w_vix, stale=True)
 
-        recent = vix_series.tail(lookback)
-        current = float(vix_series.iloc[-1])
-        mean = float(recent.mean())
-        std = float(recent.std())
+        current, mean, std = _tail_stats(vix_series, lookback)
 
         normalized = _normalize_direct(current, mean, std)
-        return SentimentReading("vix", current, normalized, self.weights.get("vix", 0.15))
+        return SentimentReading(SOURCE_VIX, current, normalized, self._w_vix)
 
     def compute_cot_sentiment(
         self,
-        net_long_series: pd.Series,
+        net_long_series: ArrayLike,
         lookback: int = 26,  # ~6 months of weekly data
     ) -> SentimentReading:
         """
@@ -198,20 +318,17 @@ def compute_cot_sentiment(
         Higher net long = bullish institutional positioning.
         """
         if net_long_series is None or len(net_long_series) < 5:
-            return SentimentReading("cot", 0.0, 0.0, self.weights.get("cot", 0.25), stale=True)
+            return SentimentReading(SOURCE_COT, 0.0, 0.0, self._w_cot, stale=True)
 
-        recent = net_long_series.tail(lookback)
-        current = float(net_long_series.iloc[-1])
-        mean = float(recent.mean())
-        std = float(recent.std())
+        current, mean, std = _tail_stats(net_long_series, lookback)
 
         normalized = _normalize_direct(current, mean, std)
-        return SentimentReading("cot", current, normalized, self.weights.get("cot", 0.25))
+        return SentimentReading(SOURCE_COT, current, normalized, self._w_cot)
 
     def compute_etf_flow_sentiment(
         self,
-        volume_series: pd.Series,
-        price_series: pd.Series,
+        volume_series: ArrayLike,
+        price_series: ArrayLike,
         lookback: int = 20,
     ) -> SentimentReading:
         """
@@ -219,18 +336,20 @@ def compute_etf_flow_sentiment(
         High volume + rising price = bullish institutional demand.
         """
         if volume_series is None or price_series is None or len(volume_series) < 10:
-            return SentimentReading("etf_flows", 0.0, 0.0, self.weights.get("etf_flows", 0.10), stale=True)
+            return SentimentReading(SOURCE_ETF_FLOWS, 0.0, 0.0, self._w_etf_flows, stale=True)
 
         # Dollar volume flow = volume * daily return direction
-        returns = price_series.pct_change()
-        flow = volume_series * returns.apply(lambda x: 1 if x > 0 else -1 if x < 0 else 0)
-        recent = flow.tail(lookback)
-        current = float(recent.sum())  # cumulative flow over lookback
-        mean = float(recent.mean())
-        std = float(recent.std())
+        prices = _as_float_array(price_series)
+        direction = np.zeros_like(prices)
+        direction[1:] = np.nan_to_num(np.sign(np.diff(prices)))
+        flow = _as_float_array(volume_series) * direction
+        recent = flow[-lookback:]
+        current = float(np.nansum(recent))  # cumulative flow over lookback
+        mean = float(np.nanmean(recent))
+        std = float(np.nanstd(recent, ddof=1))
 
         normalized = _normalize_direct(current, mean, std) if std > 0 else 0.0
-        return SentimentReading("etf_flows", current, normalized, self.weights.get("etf_flows", 0.10))
+        return SentimentReading(SOURCE_ETF_FLOWS, current, normalized, self._w_etf_flows)
 
     def compute_fear_greed_sentiment(
         self,
@@ -243,7 +362,17 @@ def compute_fear_greed_sentiment(
         """
         # Normalize: 0 = extreme fear (+1.0 for gold), 100 = extreme greed (-1.0)
         normalized = float(np.clip(-(fg_value - 50) / 50.0, -1.0, 1.0))
-        return SentimentReading("fear_greed", fg_value, normalized, self.weights.get("fear_greed", 0.10))
+        return SentimentReading(SOURCE_FEAR_GREED, fg_value, normalized, self._w_fear_greed)
+
+    def compute_fear_greed_series(self, fg_values: ArrayLike) -> np.ndarray:
+        """
+        Normalized Fear & Greed for a whole series (backtest replay).
+        Same mapping as compute_fear_greed_sentiment, broadcast over the array.
+        """
+        out = _as_float_array(fg_values) - 50.0
+        out *= -1.0 / 50.0
+        np.clip(out, -1.0, 1.0, out=out)
+        return out
 
     def composite_score(self, readings: List[SentimentReading]) -> CompositeSentiment:
         """
@@ -252,19 +381,13 @@ def composite_score(self, readings: List[SentimentReading]) -> CompositeSentimen
         if not readings:
             return CompositeSentiment(score=0.0, confidence=0.0, readings=[])
 
-        total_weight = 0.0
-        weighted_sum = 0.0
-        stale_count = 0
-
-        for r in readings:
-            if r.stale:
-                stale_count += 1
-                continue
-            weighted_sum += r.normalized * r.weight
-            total_weight += r.weight
+        active = [r for r in readings if not r.stale]
+        norms = np.fromiter((r.normalized for r in active), dtype=np.float64, count=len(active))
+        weights = np.fromiter((r.weight for r in active), dtype=np.float64, count=len(active))
 
-        score = weighted_sum / total_weight if total_weight > 0 else 0.0
-        confidence = 1.0 - (stale_count / len(readings)) if readings else 0.0
+        total_weight = weights.sum()
+        score = float(norms @ weights / total_weight) if total_weight > 0 else 0.0
+        confidence = 1.0 - (len(readings) - len(active)) / len(readings)
 
         return CompositeSentiment(
             score=float(np.clip(score, -1.0, 1.0)),
@@ -275,100 +398,95 @@ def composite_score(self, readings: List[SentimentReading]) -> CompositeSentimen
     def should_allow_trade(
         self,
         sentiment: CompositeSentiment,
-        direction: str,
+        direction: Direction,
     ) -> bool:
         """
         Check if a trade should be allowed based on sentiment.
+        direction: "LONG"/"SHORT" or DIR_LONG/DIR_SHORT.
         Returns True if trade is allowed.
         """
-        cfg = self.config
-        score = sentiment.score
-
-        min_long = cfg.get("min_score_long", 0.1)
-        min_short = cfg.get("min_score_short", -0.1)
-        contrary_block = cfg.get("contrary_block", True)
-        contrary_thresh = cfg.get("contrary_threshold", 0.3)
-
-        if direction == "LONG":
-            # Block if sentiment is too bearish
-            if contrary_block and score < -contrary_thresh:
-                return False
-            # Need minimum bullish sentiment
-            if score < min_long:
-                return False
-        elif direction == "SHORT":
-            # Block if sentiment is too bullish
-            if contrary_block and score > contrary_thresh:
-                return False
-            # Need minimum bearish sentiment
-            if score > min_short:
-                return False
-
-        return True
-
-    def get_size_multiplier(self, sentiment: CompositeSentiment, direction: str) -> float:
+        d = _direction_code(direction)
+        if d == 0:
+            return True
+        # Score signed towards the trade direction: positive = aligned sentiment
+        aligned = sentiment.score * d
+        # Block if sentiment is too contrary
+        if self._contrary_block and aligned < -self._contrary_thresh:
+            return False
+        # Need minimum aligned sentiment (min_score_short is a ceiling on the raw score)
+        min_aligned = self._min_long if d == DIR_LONG else -self._min_short
+        return aligned >= min_aligned
+
+    def get_size_multiplier(self, sentiment: CompositeSentiment, direction: Direction) -> float:
         """
         Get position size multiplier based on sentiment strength.
         Returns 1.0 for normal, up to strong_signal_multiplier for strong alignment.
         """
-        cfg = self.config
-        score = sentiment.score
-        boost_thresh = cfg.get("strong_signal_boost", 0.3)
-        boost_mult = cfg.get("strong_signal_multiplier", 1.5)
-
-        if direction == "LONG" and score > boost_thresh:
-            return boost_mult
-        elif direction == "SHORT" and score < -boost_thresh:
-            return boost_mult
-
+        d = _direction_code(direction)
+        if d and sentiment.score * d > self._boost_thresh:
+            return self._boost_mult
         return 1.0
 
+    def _cached_download(
+        self,
+        yf,
+        ticker: str,
+        period: str,
+        interval: str,
+        ttl_hours: float,
+    ) -> pd.DataFrame:
+        """
+        Ticker(ticker).history with a TTL cache keyed on (ticker, period, interval).
+        Within ttl_hours the network is skipped entirely; empty results are not cached.
+        Ticker objects keep their own state, so this is safe from the download pool
+        (yf.download shares module-global result dicts between concurrent calls).
+        """
+        key = (ticker, period, interval)
+        now = datetime.utcnow()
+        cached = self._dl_cache.get(key)
+        if cached is not None and now - cached[1] < timedelta(hours=ttl_hours):
+            return cached[0]
+        df = yf.Ticker(ticker).history(period=period, interval=interval)
+        if not df.empty:
+            self._dl_cache[key] = (df, now)
+        return df
+
+    def _reading_from_download(self, source: str, df: pd.DataFrame) -> SentimentReading:
+        """Map a downloaded yfinance frame to the matching compute_*_sentiment call."""
+        if source == SOURCE_DXY:
+            return self.compute_dxy_sentiment(df["Close"].squeeze())
+        if source == SOURCE_US10Y:
+            return self.compute_us10y_sentiment(df["Close"].squeeze())
+        if source == SOURCE_VIX:
+            return self.compute_vix_sentiment(df["Close"].squeeze())
+        return self.compute_etf_flow_sentiment(df["Volume"].squeeze(), df["Close"].squeeze())
+
     def fetch_all_data(self) -> CompositeSentiment:
         """
         Fetch all sentiment data from available sources and compute composite.
         Uses yfinance for market data (DXY, US10Y, VIX, GLD).
+        Downloads run concurrently and are cached for stale_data_hours per source.
         """
         readings = []
 
         try:
             import yfinance as yf
 
-            # DXY
-            try:
-                dxy = yf.download("DX-Y.NYB", period="6mo", interval="1d", progress=False)
-                if not dxy.empty:
-                    readings.append(self.compute_dxy_sentiment(dxy["Close"].squeeze()))
-            except Exception as e:
-                logger.warning("Failed to fetch DXY: %s", e)
-                readings.append(SentimentReading("dxy", 0.0, 0.0, self.weights["dxy"], stale=True))
-
-            # US10Y
-            try:
-                us10y = yf.download("^TNX", period="6mo", interval="1d", progress=False)
-                if not us10y.empty:
-                    readings.append(self.compute_us10y_sentiment(us10y["Close"].squeeze()))
-            except Exception as e:
-                logger.warning("Failed to fetch US10Y: %s", e)
-                readings.append(SentimentReading("us10y", 0.0, 0.0, self.weights["us10y"], stale=True))
-
-            # VIX
-            try:
-                vix = yf.download("^VIX", period="6mo", interval="1d", progress=False)
-                if not vix.empty:
-                    readings.append(self.compute_vix_sentiment(vix["Close"].squeeze()))
-            except Exception as e:
-                logger.warning("Failed to fetch VIX: %s", e)
-                readings.append(SentimentReading("vix", 0.0, 0.0, self.weights["vix"], stale=True))
-
-            # GLD ETF flows
-            try:
-                gld = yf.download("GLD", period="3mo", interval="1d", progress=False)
-                if not gld.empty:
-                    readings.append(self.compute_etf_flow_sentiment(
-                        gld["Volume"].squeeze(), gld["Close"].squeeze()))
-            except Exception as e:
-                logger.warning("Failed to fetch GLD: %s", e)
-                readings.append(SentimentReading("etf_flows", 0.0, 0.0, self.weights["etf_flows"], stale=True))
+            stale_hours = self.config.get("stale_data_hours", DEFAULT_SENTIMENT_CONFIG["stale_data_hours"])
+            with ThreadPoolExecutor(max_workers=len(YF_SOURCES)) as pool:
+                futures = [
+                    (source, label, pool.submit(
+                        self._cached_download, yf, ticker, period, "1d", stale_hours.get(source, 4)))
+                    for source, ticker, period, label in YF_SOURCES
+                ]
+                for source, label, fut in futures:
+                    try:
+                        df = fut.result()
+                        if not df.empty:
+                            readings.append(self._reading_from_download(source, df))
+                    except Exception as e:
+                        logger.warning("Failed to fetch %s: %s", label, e)
+                        readings.append(SentimentReading(source, 0.0, 0.0, self.weights[source], stale=True))
 
         except ImportError:
             logger.warning("yfinance not installed. Sentiment data unavailable.")
@@ -377,9 +495,9 @@ def fetch_all_data(self) -> CompositeSentiment:
 
         # COT and Fear & Greed would require separate API calls
         # Add stale placeholders for now
-        if not any(r.source == "cot" for r in readings):
-            readings.append(SentimentReading("cot", 0.0, 0.0, self.weights.get("cot", 0.25), stale=True))
-        if not any(r.source == "fear_greed" for r in readings):
-            readings.append(SentimentReading("fear_greed", 50.0, 0.0, self.weights.get("fear_greed", 0.10), stale=True))
+        if not any(r.source == SOURCE_COT for r in readings):
+            readings.append(SentimentReading(SOURCE_COT, 0.0, 0.0, self._w_cot, stale=True))
+        if not any(r.source == SOURCE_FEAR_GREED for r in readings):
+            readings.append(SentimentReading(SOURCE_FEAR_GREED, 50.0, 0.0, self._w_fear_greed, stale=True))
 
         return self.composite_score(readings)
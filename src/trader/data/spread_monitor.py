@@ -9,12 +9,35 @@
 XAUUSD typical spread: 2-5 pips normal, 20-50+ during NFP/FOMC.
 """
 import logging
-from collections import deque
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+_EPOCH = datetime(1970, 1, 1)
+_NS_PER_MINUTE = 60_000_000_000
+
+
+def _datetime_to_ns(ts: datetime) -> int:
+    """Datetime -> int64 epoch nanoseconds. Naive datetimes are treated as UTC."""
+    if ts.tzinfo is not None:
+        ts = ts.replace(tzinfo=None) - ts.utcoffset()
+    return (ts - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
+@dataclass(slots=True)
+class SpreadStatus:
+    """Result of SpreadMonitor.update for one tick."""
+    spread: float
+    spread_pips: float
+    ok: bool
+    warning: bool
+    blocked: bool
+
 
 class SpreadMonitor:
     """
@@ -29,30 +52,43 @@ def __init__(
     ):
         self.max_spread_pips = max_spread_pips
         self.warning_spread_pips = warning_spread_pips
-        self.history: deque = deque(maxlen=history_size)
+        # History as a struct-of-arrays ring buffer, normally in time order
+        self.history_size = history_size
+        self._ts_ns = np.zeros(history_size, dtype=np.int64)
+        self._spread_pips = np.zeros(history_size, dtype=np.float64)
+        self._head = 0  # next slot to write
+        self._count = 0
+        self._ticks = 0  # ticks written so far
+        # The buffer holds an out-of-order pair while _ticks <= _unsorted_until
+        self._unsorted_until = -1
         self.current_spread: float = 0.0
-        self.last_update: Optional[datetime] = None
+        self._last_update_ns: Optional[int] = None
 
         # Statistics
         self.blocked_count: int = 0
         self.warning_count: int = 0
 
-    def update(self, bid: float, ask: float, timestamp: Optional[datetime] = None) -> Dict:
+    def update(self, bid: float, ask: float, timestamp: Optional[datetime] = None) -> SpreadStatus:
         """
         Update with new tick data.
-        Returns status dict with: spread, spread_pips, ok, warning, blocked.
+        Returns SpreadStatus with: spread, spread_pips, ok, warning, blocked.
         """
         spread = ask - bid
         spread_pips = spread * 100  # XAUUSD: 1 pip = 0.01
 
         self.current_spread = spread_pips
-        self.last_update = timestamp or datetime.utcnow()
-        self.history.append({
-            "timestamp": self.last_update,
-            "spread_pips": spread_pips,
-            "bid": bid,
-            "ask": ask,
-        })
+        ts_ns = _datetime_to_ns(timestamp) if timestamp is not None else time.time_ns()
+        if self._last_update_ns is not None and ts_ns < self._last_update_ns:
+            # Backfilled tick: its predecessor leaves the buffer history_size ticks later
+            self._unsorted_until = self._ticks - 1 + self.history_size
+        self._ticks += 1
+        self._last_update_ns = ts_ns
+        i = self._head
+        self._ts_ns[i] = ts_ns
+        self._spread_pips[i] = spread_pips
+        self._head = (i + 1) % self.history_size
+        if self._count < self.history_size:
+            self._count += 1
 
         blocked = spread_pips > self.max_spread_pips
         warning = spread_pips > self.warning_spread_pips
@@ -64,33 +100,50 @@ def update(self, bid: float, ask: float, timestamp: Optional[datetime] = None) -
             self.warning_count += 1
             logger.info("Spread WARNING: %.1f pips (warning: %.1f)", spread_pips, self.warning_spread_pips)
 
-        return {
-            "spread": spread,
-            "spread_pips": spread_pips,
-            "ok": not blocked,
-            "warning": warning,
-            "blocked": blocked,
-        }
+        return SpreadStatus(spread, spread_pips, not blocked, warning, blocked)
+
+    @property
+    def last_update(self) -> Optional[datetime]:
+        """Time of the last tick (naive UTC); only materialized as datetime on access."""
+        if self._last_update_ns is None:
+            return None
+        return _EPOCH + timedelta(microseconds=self._last_update_ns // 1000)
 
     def is_tradeable(self) -> bool:
         """Check if current spread allows trading."""
         return self.current_spread <= self.max_spread_pips
 
+    def _recent_spreads(self, minutes: int) -> np.ndarray:
+        """
+        Spreads (pips) of ticks in the last N minutes: a binary search on time while
+        the buffer is in time order, a mask while it holds an out-of-order tick.
+        """
+        if self._count < self.history_size:
+            ts = self._ts_ns[:self._count]
+            spreads = self._spread_pips[:self._count]
+        else:
+            # Buffer has wrapped: unwrap into chronological order
+            h = self._head
+            ts = np.concatenate((self._ts_ns[h:], self._ts_ns[:h]))
+            spreads = np.concatenate((self._spread_pips[h:], self._spread_pips[:h]))
+        cutoff_ns = time.time_ns() - minutes * _NS_PER_MINUTE
+        if self._ticks <= self._unsorted_until:
+            return spreads[ts >= cutoff_ns]
+        return spreads[np.searchsorted(ts, cutoff_ns, side="left"):]
+
     def get_average_spread(self, minutes: int = 15) -> float:
         """Get average spread over last N minutes."""
-        if not self.history:
+        if not self._count:
             return 0.0
-        cutoff = datetime.utcnow() - timedelta(minutes=minutes)
-        recent = [h["spread_pips"] for h in self.history if h["timestamp"] >= cutoff]
-        return sum(recent) / len(recent) if recent else 0.0
+        recent = self._recent_spreads(minutes)
+        return float(recent.mean()) if recent.size else 0.0
 
     def get_max_spread(self, minutes: int = 15) -> float:
         """Get max spread over last N minutes."""
-        if not self.history:
+        if not self._count:
             return 0.0
-        cutoff = datetime.utcnow() - timedelta(minutes=minutes)
-        recent = [h["spread_pips"] for h in self.history if h["timestamp"] >= cutoff]
-        return max(recent) if recent else 0.0
+        recent = self._recent_spreads(minutes)
+        return float(recent.max()) if recent.size else 0.0
 
     def summary(self) -> Dict:
         """Get spread monitoring summary."""
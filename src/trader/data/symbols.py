@@ -1,15 +1,19 @@
 """
 Supported symbols and timeframe conventions.
 """
+from functools import lru_cache
 
 DEFAULT_SYMBOL = "XAUUSD"
 SUPPORTED_SYMBOLS = ["XAUUSD", "EURUSD", "GBPUSD"]
 DEFAULT_TIMEFRAMES = ["15m", "1h"]
 
+_SUPPORTED = frozenset(SUPPORTED_SYMBOLS)
 
+
+@lru_cache(maxsize=64)
 def normalize_symbol(s: str) -> str:
     return s.upper().strip()
 
 
 def is_supported(symbol: str) -> bool:
-    return normalize_symbol(symbol) in SUPPORTED_SYMBOLS
+    return normalize_symbol(symbol) in _SUPPORTED
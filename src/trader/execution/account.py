@@ -2,14 +2,28 @@
 Account and equity tracking for live and backtest trading.
 Tracks balance, equity, realized/unrealized P&L, margin, and equity curve.
 """
+import time
+from collections import defaultdict
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Dict, List, Literal, Optional
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Literal, Optional, Union
+
+import numpy as np
 
 from src.trader.data.schema import Trade
 
 
-@dataclass
+DayKey = Union[str, int]
+
+
+def _day_ordinal(date: DayKey) -> int:
+    """Date string (YYYY-MM-DD) -> date ordinal used as daily bookkeeping key; ints pass through."""
+    if isinstance(date, int):
+        return date
+    return datetime.strptime(date, "%Y-%m-%d").toordinal()
+
+
+@dataclass(slots=True)
 class AccountSnapshot:
     """Point-in-time snapshot of account state."""
     timestamp: datetime
@@ -22,9 +36,111 @@ class AccountSnapshot:
     peak_equity: float
 
 
-@dataclass
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _datetime_to_ns(ts: datetime) -> int:
+    """Datetime -> epoch nanoseconds. Naive datetimes are stored as-is (wall clock), aware ones as UTC."""
+    if ts.tzinfo is not None:
+        ts = ts.replace(tzinfo=None) - ts.utcoffset()
+    return (ts - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
+Timestamp = Union[datetime, int]  # datetime or epoch nanoseconds
+
+
+def _timestamp_ns(timestamp: Optional[Timestamp]) -> int:
+    """Epoch ns for the equity curve; None -> current wall clock, without building a datetime."""
+    if timestamp is None:
+        return time.time_ns()
+    if isinstance(timestamp, (int, np.integer)):
+        return int(timestamp)
+    return _datetime_to_ns(timestamp)
+
+
+def _ns_to_datetime(ns: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=int(ns) // 1000)
+
+
+class EquityCurveBuffer:
+    """
+    Columnar equity curve: int64 epoch-ns timestamps plus one float64 column per
+    AccountSnapshot field, grown geometrically. Indexing/iterating yields
+    AccountSnapshot objects (timestamps as naive datetimes); rows() yields plain
+    tuples, and analytics should use column() / timestamps_ns on the arrays directly.
+    """
+
+    COLUMNS = ("balance", "equity", "unrealized_pnl", "margin_used", "free_margin", "drawdown_pct", "peak_equity")
+
+    def __init__(self, capacity: int = 1024):
+        self._size = 0
+        self._ts_ns = np.zeros(capacity, dtype=np.int64)
+        self._values = np.zeros((capacity, len(self.COLUMNS)), dtype=np.float64)
+
+    def append(
+        self,
+        timestamp_ns: int,
+        balance: float,
+        equity: float,
+        unrealized_pnl: float,
+        margin_used: float,
+        free_margin: float,
+        drawdown_pct: float,
+        peak_equity: float,
+    ) -> None:
+        i = self._size
+        if i == len(self._ts_ns):
+            cap = 2 * i
+            self._ts_ns = np.resize(self._ts_ns, cap)
+            self._values = np.resize(self._values, (cap, len(self.COLUMNS)))
+        self._ts_ns[i] = timestamp_ns
+        self._values[i] = (balance, equity, unrealized_pnl, margin_used, free_margin, drawdown_pct, peak_equity)
+        self._size = i + 1
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, i: int) -> AccountSnapshot:
+        if i < 0:
+            i += self._size
+        if not 0 <= i < self._size:
+            raise IndexError("equity curve index out of range")
+        return AccountSnapshot(_ns_to_datetime(self._ts_ns[i]), *self._values[i].tolist())
+
+    def __iter__(self) -> Iterator[AccountSnapshot]:
+        for ts_ns, *values in self.rows():
+            yield AccountSnapshot(_ns_to_datetime(ts_ns), *values)
+
+    def rows(self) -> Iterator[tuple]:
+        """Plain (timestamp_ns, balance, equity, ...) tuples, no AccountSnapshot per step."""
+        n = self._size
+        return zip(self._ts_ns[:n].tolist(), *self._values[:n].T.tolist())
+
+    @property
+    def timestamps_ns(self) -> np.ndarray:
+        return self._ts_ns[:self._size]
+
+    def column(self, name: str) -> np.ndarray:
+        """View of one field over the recorded steps, e.g. column("equity")."""
+        return self._values[:self._size, self.COLUMNS.index(name)]
+
+    def to_dataframe(self):
+        """pandas DataFrame indexed by timestamp, one column per field."""
+        import pandas as pd
+        return pd.DataFrame(
+            self._values[:self._size],
+            columns=list(self.COLUMNS),
+            index=pd.to_datetime(self.timestamps_ns, unit="ns").rename("timestamp"),
+        )
+
+
+@dataclass(slots=True)
 class Position:
-    """Open position tracker."""
+    """
+    Open position tracker. While the position is open, current_price and
+    unrealized_pnl read its row of the tracker's position arrays (marked per
+    tick without touching this object); on close the last values are kept.
+    """
     ticket: str
     symbol: str
     direction: Literal["LONG", "SHORT"]
@@ -33,8 +149,190 @@ class Position:
     sl: float
     tp: float
     open_time: datetime
-    current_price: float = 0.0
-    unrealized_pnl: float = 0.0
+    sign: float = 1.0  # +1 LONG, -1 SHORT; fixed at open
+    risk_usd: float = 0.0  # |entry - sl| * volume; fixed at open
+    _book: Optional["_PositionArrays"] = field(default=None, repr=False, compare=False)
+    _price: float = field(default=0.0, repr=False)  # current_price / unrealized_pnl when not in _book
+    _pnl: float = field(default=0.0, repr=False)
+
+    @property
+    def current_price(self) -> float:
+        book = self._book
+        return self._price if book is None else float(book.current[book.row(self.ticket)])
+
+    @property
+    def unrealized_pnl(self) -> float:
+        book = self._book
+        return self._pnl if book is None else float(book.unrealized[book.row(self.ticket)])
+
+
+class _PositionArrays:
+    """
+    Struct-of-arrays mirror of the open positions, so mark-to-market is a few
+    vector ops instead of a Python loop over Position objects.
+    Rows are kept dense: closing a position moves the last row into its slot.
+    """
+
+    def __init__(self, capacity: int = 16):
+        self.n = 0
+        self.entry = np.zeros(capacity, dtype=np.float64)
+        self.volume = np.zeros(capacity, dtype=np.float64)
+        self.sign = np.zeros(capacity, dtype=np.float64)  # +1 LONG, -1 SHORT
+        self.weight = np.zeros(capacity, dtype=np.float64)  # sign * volume
+        self.symbol_idx = np.zeros(capacity, dtype=np.intp)
+        self.current = np.zeros(capacity, dtype=np.float64)
+        self.unrealized = np.zeros(capacity, dtype=np.float64)
+        self.tickets: List[str] = []
+        self.positions: List["Position"] = []  # Position object of each row
+        self._row: Dict[str, int] = {}
+        self.symbols: List[str] = []
+        self._symbol_index: Dict[str, int] = {}
+
+    def _grow(self) -> None:
+        cap = 2 * len(self.entry)
+        for name in ("entry", "volume", "sign", "weight", "symbol_idx", "current", "unrealized"):
+            setattr(self, name, np.resize(getattr(self, name), cap))
+
+    def add(self, pos: "Position") -> None:
+        if self.n == len(self.entry):
+            self._grow()
+        j = self._symbol_index.get(pos.symbol)
+        if j is None:
+            j = self._symbol_index[pos.symbol] = len(self.symbols)
+            self.symbols.append(pos.symbol)
+        i = self.n
+        self.entry[i] = pos.entry_price
+        self.volume[i] = pos.volume
+        self.sign[i] = pos.sign
+        self.weight[i] = pos.sign * pos.volume
+        self.symbol_idx[i] = j
+        self.current[i] = pos.current_price
+        self.unrealized[i] = 0.0
+        self.tickets.append(pos.ticket)
+        self.positions.append(pos)
+        self._row[pos.ticket] = i
+        self.n += 1
+        pos._book = self
+
+    def remove(self, ticket: str) -> None:
+        i = self._row[ticket]
+        # Detach: the Position keeps its last marked price/P&L
+        pos = self.positions[i]
+        pos._price = float(self.current[i])
+        pos._pnl = float(self.unrealized[i])
+        pos._book = None
+        del self._row[ticket]
+        last = self.n - 1
+        if i != last:
+            for arr in (self.entry, self.volume, self.sign, self.weight, self.symbol_idx,
+                        self.current, self.unrealized):
+                arr[i] = arr[last]
+            moved = self.tickets[last]
+            self.tickets[i] = moved
+            self.positions[i] = self.positions[last]
+            self._row[moved] = i
+        self.tickets.pop()
+        self.positions.pop()
+        self.n = last
+
+    def row(self, ticket: str) -> int:
+        return self._row[ticket]
+
+    def mark_to_market(self, prices: Dict[str, float]) -> float:
+        """
+        Apply new prices and recompute per-row unrealized P&L.
+        Returns the total unrealized P&L of positions whose symbol is in prices.
+        """
+        n = self.n
+        if n == 0:
+            return 0.0
+        cur = self.current[:n]
+        unreal = self.unrealized[:n]
+
+        if len(self.symbols) == 1:
+            # Single-instrument account (the XAUUSD case): no gather needed
+            px = prices.get(self.symbols[0])
+            if px is None:
+                return 0.0
+            cur.fill(px)
+            np.subtract(cur, self.entry[:n], out=unreal)
+            unreal *= self.weight[:n]
+            return float(unreal.sum())
+
+        price_vec = np.empty(len(self.symbols), dtype=np.float64)
+        priced = np.zeros(len(self.symbols), dtype=bool)
+        for sym, px in prices.items():
+            j = self._symbol_index.get(sym)
+            if j is not None:
+                price_vec[j] = px
+                priced[j] = True
+
+        idx = self.symbol_idx[:n]
+        rows = priced[idx]
+        if not rows.any():
+            return 0.0
+        cur[rows] = price_vec[idx[rows]]
+        np.subtract(cur, self.entry[:n], out=unreal)
+        unreal *= self.weight[:n]
+        return float(unreal[rows].sum())
+
+
+def build_equity_curve(
+    balances: np.ndarray,
+    unrealized: np.ndarray,
+    margin_used: np.ndarray,
+    peak_init: float,
+) -> Dict[str, np.ndarray]:
+    """
+    Derive the equity-curve columns from raw per-step balance/unrealized/margin
+    arrays in one vectorized pass (same values _update_equity records per step).
+    Returns dict with equity, peak_equity, drawdown_pct and free_margin arrays.
+    """
+    equity = np.asarray(balances, dtype=np.float64) + np.asarray(unrealized, dtype=np.float64)
+    peak = np.maximum.accumulate(np.maximum(equity, peak_init))
+    drawdown_pct = np.zeros_like(equity)
+    np.divide((peak - equity) * 100.0, peak, out=drawdown_pct, where=peak > 0)
+    free_margin = np.maximum(equity - np.asarray(margin_used, dtype=np.float64), 0.0)
+    return {
+        "equity": equity,
+        "peak_equity": peak,
+        "drawdown_pct": drawdown_pct,
+        "free_margin": free_margin,
+    }
+
+
+def equity_curve_stats(
+    equity: np.ndarray,
+    periods_per_year: Optional[float] = None,
+) -> Dict[str, float]:
+    """
+    Summary stats of an equity series in single NumPy passes (no per-step loop):
+    return_pct, max_drawdown_pct, sharpe (per step, annualized when periods_per_year
+    is given, e.g. 252 * 24 for hourly steps) and calmar (return_pct / max_drawdown_pct).
+    """
+    eq = np.asarray(equity, dtype=np.float64)
+    if len(eq) == 0:
+        return {"return_pct": 0.0, "max_drawdown_pct": 0.0, "sharpe": 0.0, "calmar": 0.0}
+    peak = np.maximum.accumulate(eq)
+    dd = np.zeros_like(eq)
+    np.divide(peak - eq, peak, out=dd, where=peak > 0)
+    max_dd_pct = float(dd.max()) * 100.0
+    return_pct = (eq[-1] / eq[0] - 1.0) * 100.0 if eq[0] > 0 else 0.0
+
+    sharpe = 0.0
+    if len(eq) > 2:
+        returns = np.diff(eq) / eq[:-1]
+        std = returns.std()
+        if std > 0:
+            sharpe = float(returns.mean() / std)
+            if periods_per_year:
+                sharpe *= float(np.sqrt(periods_per_year))
+    return {
+        "return_pct": float(return_pct),
+        "max_drawdown_pct": max_dd_pct,
+        "sharpe": sharpe,
+        "calmar": float(return_pct / max_dd_pct) if max_dd_pct > 0 else 0.0,
+    }
 
 
 class AccountTracker:
@@ -49,7 +347,12 @@ def __init__(
         leverage: float = 100.0,
         margin_rate: float = 0.05,  # 5% margin for XAUUSD (Oanda typical)
         risk_pct_per_r: float = 0.01,  # 1% per R
+        record_snapshots: bool = True,
+        record_every_n: int = 1,
+        skip_unchanged_prices: bool = False,
     ):
+        if record_every_n < 1:
+            raise ValueError("record_every_n must be >= 1")
         self.initial_balance = initial_balance
         self.balance = initial_balance
         self.leverage = leverage
@@ -62,12 +365,23 @@ def __init__(
         self.margin_used = 0.0
 
         self.positions: Dict[str, Position] = {}
+        self._pos_arrays = _PositionArrays()
         self.closed_trades: List[Trade] = []
-        self.equity_curve: List[AccountSnapshot] = []
+        self.equity_curve = EquityCurveBuffer()
+        # Sweeps only need final equity: record_snapshots=False skips the curve,
+        # record_every_n > 1 keeps every Nth step for memory-bounded long runs
+        self.record_snapshots = record_snapshots
+        self.record_every_n = record_every_n
+        self._equity_updates = 0
+        # Opt-in: an update_prices call with the same prices as the previous one (and no
+        # open/close in between) changes nothing, so it is skipped without a snapshot
+        self.skip_unchanged_prices = skip_unchanged_prices
+        self._last_prices: Optional[Dict[str, float]] = None
 
         # Daily tracking
-        self._daily_pnl_r: Dict[str, float] = {}  # "YYYY-MM-DD" -> cumR
-        self._daily_trade_count: Dict[str, int] = {}
+        # Written via += only; reads use .get() so lookups never insert keys
+        self._daily_pnl_r: Dict[int, float] = defaultdict(float)  # date ordinal -> cumR
+        self._daily_trade_count: Dict[int, int] = defaultdict(int)
 
         # Ticket counter
         self._ticket_counter = 0
@@ -111,10 +425,14 @@ def open_position(
             volume=volume,
             sl=sl,
             tp=tp,
-            open_time=timestamp or datetime.now(),
-            current_price=entry_price,
+            open_time=timestamp if timestamp is not None else datetime.now(),
+            sign=1.0 if direction == "LONG" else -1.0,
+            risk_usd=abs(entry_price - sl) * volume,
+            _price=entry_price,
         )
         self.positions[ticket] = pos
+        self._pos_arrays.add(pos)
+        self._last_prices = None
 
         # Calculate margin
         notional = entry_price * volume
@@ -134,17 +452,16 @@ def close_position(
             return None
 
         pos = self.positions.pop(ticket)
+        self._pos_arrays.remove(ticket)
+        self._last_prices = None
+        pos._price = exit_price
 
-        if pos.direction == "LONG":
-            profit_usd = (exit_price - pos.entry_price) * pos.volume
-        else:
-            profit_usd = (pos.entry_price - exit_price) * pos.volume
-
-        risk = abs(pos.entry_price - pos.sl) * pos.volume
-        profit_r = profit_usd / risk if risk > 0 else 0.0
+        # Same math as schema.trade_profit, with sign/risk precomputed at open
+        profit_usd = pos.sign * (exit_price - pos.entry_price) * pos.volume
+        profit_r = profit_usd / pos.risk_usd if pos.risk_usd > 0 else 0.0
         result: Literal["WIN", "LOSS", "TIMEOUT"] = "WIN" if profit_usd > 0 else "LOSS"
 
-        close_time = timestamp or datetime.now()
+        close_time = timestamp if timestamp is not None else datetime.now()
         trade = Trade(
             timestamp_open=pos.open_time,
             timestamp_close=close_time,
@@ -169,37 +486,67 @@ def close_position(
         self.margin_used = max(0.0, self.margin_used - margin)
 
         # Update daily tracking
-        day_key = close_time.strftime("%Y-%m-%d")
-        self._daily_pnl_r[day_key] = self._daily_pnl_r.get(day_key, 0.0) + profit_r
-        self._daily_trade_count[day_key] = self._daily_trade_count.get(day_key, 0) + 1
+        day_key = close_time.toordinal()
+        self._daily_pnl_r[day_key] += profit_r
+        self._daily_trade_count[day_key] += 1
 
         # Update equity and peak
         self._update_equity()
 
         return trade
 
-    def update_prices(self, prices: Dict[str, float], timestamp: Optional[datetime] = None) -> None:
-        """Update current prices for all open positions."""
-        self.unrealized_pnl = 0.0
-        for pos in self.positions.values():
-            if pos.symbol in prices:
-                pos.current_price = prices[pos.symbol]
-                if pos.direction == "LONG":
-                    pos.unrealized_pnl = (pos.current_price - pos.entry_price) * pos.volume
-                else:
-                    pos.unrealized_pnl = (pos.entry_price - pos.current_price) * pos.volume
-                self.unrealized_pnl += pos.unrealized_pnl
-
+    def update_prices(self, prices: Dict[str, float], timestamp: Optional[Timestamp] = None) -> None:
+        """
+        Update current prices for all open positions.
+        timestamp: datetime or epoch nanoseconds; defaults to now (UTC).
+        P&L is marked on the position arrays only; the open Position objects read
+        their current_price/unrealized_pnl from there.
+        With skip_unchanged_prices, a repeat of the previous prices is a no-op.
+        """
+        if self.skip_unchanged_prices:
+            if prices == self._last_prices:
+                return
+            self._last_prices = dict(prices)
+        self.unrealized_pnl = self._pos_arrays.mark_to_market(prices)
         self._update_equity(timestamp)
 
-    def _update_equity(self, timestamp: Optional[datetime] = None) -> None:
+    def _update_equity(self, timestamp: Optional[Timestamp] = None) -> None:
         """Recalculate equity and update peak/curve."""
-        self.equity = self.balance + self.unrealized_pnl
-        if self.equity > self.peak_equity:
-            self.peak_equity = self.equity
+        equity = self.balance + self.unrealized_pnl
+        peak = self.peak_equity
+        if equity > peak:
+            peak = equity
+        self.equity = equity
+        self.peak_equity = peak
+
+        if not self.record_snapshots:
+            return
+        step = self._equity_updates
+        self._equity_updates = step + 1
+        if step % self.record_every_n:
+            return
+
+        # Same as the free_margin/drawdown_pct properties, computed inline from locals
+        free_margin = equity - self.margin_used
+        if free_margin < 0.0:
+            free_margin = 0.0
+        drawdown_pct = ((peak - equity) / peak) * 100.0 if peak > 0 else 0.0
+
+        self.equity_curve.append(
+            _timestamp_ns(timestamp),
+            self.balance,
+            equity,
+            self.unrealized_pnl,
+            self.margin_used,
+            free_margin,
+            drawdown_pct,
+            peak,
+        )
 
-        snapshot = AccountSnapshot(
-            timestamp=timestamp or datetime.now(),
+    def final_snapshot(self, timestamp: Optional[datetime] = None) -> AccountSnapshot:
+        """Build a single snapshot of the current state (for runs without a curve)."""
+        return AccountSnapshot(
+            timestamp=timestamp if timestamp is not None else datetime.now(),
             balance=self.balance,
             equity=self.equity,
             unrealized_pnl=self.unrealized_pnl,
@@ -208,22 +555,36 @@ def _update_equity(self, timestamp: Optional[datetime] = None) -> None:
             drawdown_pct=self.drawdown_pct,
             peak_equity=self.peak_equity,
         )
-        self.equity_curve.append(snapshot)
 
-    def get_daily_pnl_r(self, date_str: str) -> float:
-        """Get cumulative P&L in R for a specific date."""
-        return self._daily_pnl_r.get(date_str, 0.0)
+    def get_daily_pnl_r(self, date: DayKey) -> float:
+        """Get cumulative P&L in R for a specific date ("YYYY-MM-DD" or date ordinal)."""
+        return self._daily_pnl_r.get(_day_ordinal(date), 0.0)
 
-    def get_daily_trade_count(self, date_str: str) -> int:
-        """Get trade count for a specific date."""
-        return self._daily_trade_count.get(date_str, 0)
+    def get_daily_trade_count(self, date: DayKey) -> int:
+        """Get trade count for a specific date ("YYYY-MM-DD" or date ordinal)."""
+        return self._daily_trade_count.get(_day_ordinal(date), 0)
 
-    def can_trade(self, date_str: str, max_daily_loss_r: float = 3.0, max_daily_trades: int = 10) -> bool:
+    def can_trade(self, date: DayKey, max_daily_loss_r: float = 3.0, max_daily_trades: int = 10) -> bool:
         """Check if trading is allowed based on daily limits."""
-        day_r = self.get_daily_pnl_r(date_str)
-        day_count = self.get_daily_trade_count(date_str)
+        day = _day_ordinal(date)
+        day_r = self._daily_pnl_r.get(day, 0.0)
+        day_count = self._daily_trade_count.get(day, 0)
         return day_r > -max_daily_loss_r and day_count < max_daily_trades
 
+    def stats(self, periods_per_year: Optional[float] = None) -> Dict[str, float]:
+        """
+        Vectorized performance stats over the recorded equity curve plus closed trades
+        (see equity_curve_stats). Curve stats are 0.0 when snapshots are not recorded.
+        """
+        out = equity_curve_stats(self.equity_curve.column("equity"), periods_per_year)
+        n = len(self.closed_trades)
+        profit_r = np.fromiter((t.profit_r for t in self.closed_trades), dtype=np.float64, count=n)
+        out["total_trades"] = n
+        wins = sum(1 for t in self.closed_trades if t.result == "WIN")
+        out["win_rate"] = 100.0 * wins / n if n else 0.0
+        out["total_profit_r"] = float(profit_r.sum())
+        return out
+
     def lot_size_for_risk(
         self,
         sl_distance: float,
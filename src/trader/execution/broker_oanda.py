@@ -10,21 +10,30 @@
 Requires: pip install oandapyV20
 Config: broker section in configs/xauusd.yaml + .env for credentials.
 """
+import inspect
 import json
 import logging
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Literal, Optional
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 ROOT = Path(__file__).resolve().parents[3]
 
+# v20 streaming hosts (stream_prices_async talks to these directly)
+STREAM_URLS = {
+    "practice": "https://stream-fxpractice.oanda.com",
+    "live": "https://stream-fxtrade.oanda.com",
+}
+STREAM_READ_TIMEOUT = 20.0  # Oanda sends a heartbeat every 5s
 
-@dataclass
+
+@dataclass(slots=True)
 class OrderResult:
     """Result of an order submission."""
     success: bool
@@ -35,7 +44,7 @@ class OrderResult:
     raw_response: Optional[dict] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OandaPosition:
     """Open position from Oanda."""
     trade_id: str
@@ -50,7 +59,7 @@ class OandaPosition:
     open_time: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AccountInfo:
     """Oanda account information."""
     account_id: str
@@ -63,6 +72,26 @@ class AccountInfo:
     currency: str = "USD"
 
 
+def _price_tick(msg: Dict, default_instrument: str) -> Optional[Dict]:
+    """
+    Decoded pricing-stream message -> tick dict, or None if it is not a PRICE message.
+    tick: {"instrument", "bid", "ask", "time", "spread"}
+    """
+    if msg.get("type") != "PRICE":
+        return None
+    bids = msg.get("bids")
+    asks = msg.get("asks")
+    bid = float(bids[0]["price"]) if bids else 0
+    ask = float(asks[0]["price"]) if asks else 0
+    return {
+        "instrument": msg.get("instrument", default_instrument),
+        "bid": bid,
+        "ask": ask,
+        "time": msg.get("time", ""),
+        "spread": ask - bid,
+    }
+
+
 class OandaBroker:
     """
     Oanda v20 REST API broker for XAUUSD live trading.
@@ -73,6 +102,9 @@ class OandaBroker:
         result = broker.submit_market_order("XAU_USD", "BUY", 1.0, sl=1900.0, tp=1950.0)
     """
 
+    # Constant part of every market order; copied per order
+    _MARKET_ORDER = {"type": "MARKET", "timeInForce": "FOK"}  # Fill or Kill
+
     def __init__(
         self,
         account_id: Optional[str] = None,
@@ -99,7 +131,9 @@ def connect(self) -> bool:
                 access_token=self.token,
                 environment=self.environment,
             )
-            # Test connection by fetching account info
+            self._configure_session()
+            # Test connection by fetching account info (also warms the keep-alive pool,
+            # so the first order does not pay the TCP+TLS handshake)
             info = self.get_account_info()
             if info:
                 self._connected = True
@@ -119,6 +153,23 @@ def connect(self) -> bool:
             logger.error("Failed to connect to Oanda: %s", e)
             return False
 
+    def _configure_session(self) -> None:
+        """
+        Tune the requests.Session that oandapyV20 keeps on API.client: a pooled
+        keep-alive adapter so every REST call reuses the TLS connection, plus a
+        small retry on connection errors for GETs only (orders/closes are never replayed).
+        """
+        session = getattr(self._client, "client", None)
+        if session is None or not hasattr(session, "mount"):
+            return
+        try:
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+        except ImportError:
+            return
+        retry = Retry(total=2, backoff_factor=0.1, allowed_methods=frozenset({"GET"}))
+        session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+
     @property
     def is_connected(self) -> bool:
         return self._connected and self._client is not None
@@ -194,27 +245,14 @@ def submit_market_order(
         # Oanda uses negative units for SELL
         order_units = abs(units) if direction.upper() == "BUY" else -abs(units)
 
-        order_data: Dict[str, Any] = {
-            "order": {
-                "type": "MARKET",
-                "instrument": inst,
-                "units": str(order_units),
-                "timeInForce": "FOK",  # Fill or Kill
-            }
-        }
-
+        order = {**self._MARKET_ORDER, "instrument": inst, "units": str(order_units)}
         if sl is not None:
-            order_data["order"]["stopLossOnFill"] = {
-                "price": f"{sl:.5f}",
-                "timeInForce": "GTC",
-            }
+            order["stopLossOnFill"] = {"price": "%.5f" % sl, "timeInForce": "GTC"}
         if tp is not None:
-            order_data["order"]["takeProfitOnFill"] = {
-                "price": f"{tp:.5f}",
-                "timeInForce": "GTC",
-            }
+            order["takeProfitOnFill"] = {"price": "%.5f" % tp, "timeInForce": "GTC"}
         if comment:
-            order_data["order"]["clientExtensions"] = {"comment": comment[:128]}
+            order["clientExtensions"] = {"comment": comment[:128]}
+        order_data: Dict[str, Any] = {"order": order}
 
         try:
             from oandapyV20.endpoints.orders import OrderCreate
@@ -256,9 +294,9 @@ def modify_trade(
 
         data: Dict[str, Any] = {}
         if sl is not None:
-            data["stopLoss"] = {"price": f"{sl:.5f}", "timeInForce": "GTC"}
+            data["stopLoss"] = {"price": "%.5f" % sl, "timeInForce": "GTC"}
         if tp is not None:
-            data["takeProfit"] = {"price": f"{tp:.5f}", "timeInForce": "GTC"}
+            data["takeProfit"] = {"price": "%.5f" % tp, "timeInForce": "GTC"}
 
         if not data:
             return True  # Nothing to modify
@@ -273,6 +311,22 @@ def modify_trade(
             logger.error("Failed to modify trade %s: %s", trade_id, e)
             return False
 
+    def modify_trades_bulk(
+        self,
+        mods: List[Tuple[str, Optional[float], Optional[float]]],
+    ) -> int:
+        """
+        Modify SL/TP of several trades: mods = [(trade_id, sl, tp), ...].
+        v20 has no batch TradeCRCDO, so requests are issued concurrently over the
+        pooled session (wall time ~ one RTT for a small basket). Returns count modified.
+        """
+        if not self.is_connected or not mods:
+            return 0
+        if len(mods) == 1:
+            return int(self.modify_trade(*mods[0]))
+        with ThreadPoolExecutor(max_workers=min(8, len(mods))) as pool:
+            return sum(pool.map(lambda m: self.modify_trade(*m), mods))
+
     def close_trade(self, trade_id: str, units: Optional[float] = None) -> bool:
         """
         Close a trade entirely or partially.
@@ -329,14 +383,67 @@ def get_open_trades(self, instrument: Optional[str] = None) -> List[OandaPositio
             logger.error("Failed to get open trades: %s", e)
             return []
 
-    def close_all_positions(self, instrument: Optional[str] = None) -> int:
-        """Close all open positions. Returns count of closed trades."""
+    def close_position(self, instrument: str, long: bool = True, short: bool = True) -> bool:
+        """
+        Close the whole long and/or short position of an instrument in one request.
+        Only request sides that are actually open; Oanda rejects "ALL" for an empty side.
+        """
+        if not self.is_connected:
+            return False
+
+        data = {}
+        if long:
+            data["longUnits"] = "ALL"
+        if short:
+            data["shortUnits"] = "ALL"
+        if not data:
+            return True  # Nothing to close
+
+        try:
+            from oandapyV20.endpoints.positions import PositionClose
+            r = PositionClose(accountID=self.account_id, instrument=instrument, data=data)
+            self._client.request(r)
+            logger.info("Closed position %s (%s)", instrument, ", ".join(data))
+            return True
+        except Exception as e:
+            logger.error("Failed to close position %s: %s", instrument, e)
+            return False
+
+    def close_all_positions(
+        self,
+        instrument: Optional[str] = None,
+        mode: Literal["position", "parallel", "serial"] = "position",
+    ) -> int:
+        """
+        Close all open positions. Returns count of closed trades.
+        mode="position": one PositionClose per instrument instead of one request per trade
+                         (falls back to per-trade closes for an instrument if that fails).
+        mode="parallel": TradeClose per trade, issued concurrently.
+        mode="serial":   TradeClose per trade, one after another.
+        """
         trades = self.get_open_trades(instrument or self.instrument)
-        closed = 0
-        for t in trades:
-            if self.close_trade(t.trade_id):
-                closed += 1
-        return closed
+        if not trades:
+            return 0
+
+        if mode == "position":
+            by_instrument: Dict[str, List[OandaPosition]] = {}
+            for t in trades:
+                by_instrument.setdefault(t.instrument, []).append(t)
+            closed = 0
+            for inst, inst_trades in by_instrument.items():
+                has_long = any(t.direction == "LONG" for t in inst_trades)
+                has_short = any(t.direction == "SHORT" for t in inst_trades)
+                if self.close_position(inst, long=has_long, short=has_short):
+                    closed += len(inst_trades)
+                else:
+                    closed += sum(1 for t in inst_trades if self.close_trade(t.trade_id))
+            return closed
+
+        trade_ids = [t.trade_id for t in trades]
+        if mode == "parallel":
+            with ThreadPoolExecutor(max_workers=min(8, len(trade_ids))) as pool:
+                return sum(pool.map(self.close_trade, trade_ids))
+        return sum(1 for tid in trade_ids if self.close_trade(tid))
 
     def stream_prices(
         self,
@@ -364,16 +471,9 @@ def stream_prices(
                 if stop_event and stop_event.is_set():
                     break
 
-                if msg.get("type") == "PRICE":
-                    tick = {
-                        "instrument": msg.get("instrument", inst),
-                        "bid": float(msg["bids"][0]["price"]) if msg.get("bids") else 0,
-                        "ask": float(msg["asks"][0]["price"]) if msg.get("asks") else 0,
-                        "time": msg.get("time", ""),
-                    }
-                    tick["spread"] = tick["ask"] - tick["bid"]
+                tick = _price_tick(msg, inst)
+                if tick is not None:
                     callback(tick)
-
                 elif msg.get("type") == "HEARTBEAT":
                     logger.debug("Oanda heartbeat: %s", msg.get("time", ""))
 
@@ -383,6 +483,66 @@ def stream_prices(
                 logger.info("Will attempt reconnect...")
                 raise  # Let caller handle reconnect
 
+    async def stream_prices_async(
+        self,
+        callback: Callable[[Dict], Any],
+        instrument: Optional[str] = None,
+        stop_event=None,
+        max_backoff: float = 30.0,
+    ) -> None:
+        """
+        Async variant of stream_prices on aiohttp: many instruments/streams can share
+        one event loop thread instead of one blocking thread each.
+        callback may be a plain function or a coroutine function (awaited per tick).
+        stop_event: asyncio.Event or threading.Event; reconnects with exponential backoff
+        until it is set. Requires: pip install aiohttp
+        """
+        import asyncio
+        try:
+            import aiohttp
+        except ImportError:
+            logger.error("aiohttp not installed. Run: pip install aiohttp")
+            return
+
+        inst = instrument or self.instrument
+        url = "%s/v3/accounts/%s/pricing/stream" % (
+            STREAM_URLS.get(self.environment, STREAM_URLS["practice"]), self.account_id,
+        )
+        headers = {"Authorization": "Bearer %s" % self.token}
+        timeout = aiohttp.ClientTimeout(total=None, sock_read=STREAM_READ_TIMEOUT)
+        is_async_cb = inspect.iscoroutinefunction(callback)
+        backoff = 1.0
+
+        async with aiohttp.ClientSession(headers=headers, timeout=timeout) as session:
+            while not (stop_event and stop_event.is_set()):
+                try:
+                    async with session.get(url, params={"instruments": inst}) as resp:
+                        resp.raise_for_status()
+                        backoff = 1.0
+                        async for line in resp.content:
+                            if stop_event and stop_event.is_set():
+                                return
+                            if not line.strip():
+                                continue
+                            msg = json.loads(line)
+                            tick = _price_tick(msg, inst)
+                            if tick is not None:
+                                if is_async_cb:
+                                    await callback(tick)
+                                else:
+                                    callback(tick)
+                            elif msg.get("type") == "HEARTBEAT":
+                                logger.debug("Oanda heartbeat: %s", msg.get("time", ""))
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error("Price stream error: %s", e)
+                if stop_event and stop_event.is_set():
+                    return
+                logger.info("Reconnecting price stream in %.0fs...", backoff)
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, max_backoff)
+
     def disconnect(self) -> None:
         """Disconnect from Oanda."""
         self._connected = False
@@ -5,7 +5,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderRequest:
     symbol: str
     direction: Literal["BUY", "SELL"]
@@ -7,20 +7,33 @@
   - Partial close (e.g. 50% at 1R, rest trailing)
   - Order timeout (cancel if not filled)
   - Slippage tracking
-  - State persistence for recovery
+  - State persistence for recovery (state.json snapshot + write-ahead log)
 """
-import json
+import copy
 import logging
+import os
+import threading
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Literal, Optional
+from typing import Any, Callable, Deque, Dict, List, Literal, Optional
+
+import numpy as np
+
+from src.trader.io.jsonio import dumps, loads
 
 logger = logging.getLogger(__name__)
 
 ROOT = Path(__file__).resolve().parents[3]
 STATE_FILE = ROOT / "data" / "state.json"
+SAVE_MIN_INTERVAL = 0.5  # seconds; snapshot requests within this window coalesce into one write
+WAL_SNAPSHOT_EVERY = 200  # WAL events before a full state.json snapshot is taken
+CALLBACK_QUEUE_SIZE = 1024  # pending events for the async callback dispatcher
+# SL updates: when the callback buffer is full, a queued one is superseded by a later
+# SL update of the same trade (callbacks still get the latest SL); others are never dropped
+SL_EVENTS = frozenset({"BREAK_EVEN", "TRAILING_STOP"})
 
 
 @dataclass
@@ -46,6 +59,98 @@ class ManagedOrder:
     # Metadata
     slippage: float = 0.0
     requested_price: float = 0.0
+    # Derived at construction (fixed for the trade's life): direction sign and 1R in price
+    sign: float = field(init=False, repr=False)
+    risk: float = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.sign = 1.0 if self.direction == "LONG" else -1.0
+        self.risk = abs(self.entry_price - self.original_sl)
+
+
+def _order_to_dict(order: ManagedOrder) -> Dict[str, Any]:
+    """Persisted fields of a ManagedOrder (state.json / WAL record)."""
+    return {
+        "trade_id": order.trade_id,
+        "instrument": order.instrument,
+        "direction": order.direction,
+        "entry_price": order.entry_price,
+        "units": order.units,
+        "original_sl": order.original_sl,
+        "original_tp": order.original_tp,
+        "current_sl": order.current_sl,
+        "current_tp": order.current_tp,
+        "open_time": order.open_time.isoformat(),
+        "atr_at_entry": order.atr_at_entry,
+        "regime_at_entry": order.regime_at_entry,
+        "partial_closed": order.partial_closed,
+        "break_even_set": order.break_even_set,
+        "trailing_active": order.trailing_active,
+        "peak_price": order.peak_price,
+        "slippage": order.slippage,
+    }
+
+
+def _order_from_dict(data: Dict[str, Any]) -> ManagedOrder:
+    return ManagedOrder(
+        trade_id=data["trade_id"],
+        instrument=data["instrument"],
+        direction=data["direction"],
+        entry_price=data["entry_price"],
+        units=data["units"],
+        original_sl=data["original_sl"],
+        original_tp=data["original_tp"],
+        current_sl=data["current_sl"],
+        current_tp=data["current_tp"],
+        open_time=datetime.fromisoformat(data["open_time"]),
+        atr_at_entry=data.get("atr_at_entry", 0),
+        regime_at_entry=data.get("regime_at_entry", ""),
+        partial_closed=data.get("partial_closed", False),
+        break_even_set=data.get("break_even_set", False),
+        trailing_active=data.get("trailing_active", False),
+        peak_price=data.get("peak_price", data["entry_price"]),
+        slippage=data.get("slippage", 0),
+    )
+
+
+class _OrderArrays:
+    """
+    Struct-of-arrays view of the managed orders (dict order) for update_prices:
+    per-order constants plus a mirror of peak_price. Rebuilt whenever orders are
+    added or removed; update_price keeps the peak mirror in sync.
+    """
+
+    def __init__(self, orders: List[ManagedOrder]):
+        n = len(orders)
+        self.trade_ids = [o.trade_id for o in orders]
+        self.row = {tid: i for i, tid in enumerate(self.trade_ids)}
+        self.instruments = [o.instrument for o in orders]
+        self._instrument_code: Dict[str, int] = {}
+        for inst in self.instruments:
+            self._instrument_code.setdefault(inst, len(self._instrument_code))
+        self.instrument_idx = np.fromiter(
+            (self._instrument_code[inst] for inst in self.instruments), dtype=np.intp, count=n)
+        self.entry = np.fromiter((o.entry_price for o in orders), dtype=np.float64, count=n)
+        self.sign = np.fromiter((o.sign for o in orders), dtype=np.float64, count=n)
+        self.risk = np.fromiter((o.risk for o in orders), dtype=np.float64, count=n)
+        self.peak = np.fromiter((o.peak_price for o in orders), dtype=np.float64, count=n)
+
+    def __len__(self) -> int:
+        return len(self.trade_ids)
+
+    def price_vector(self, prices: Dict[str, float]) -> np.ndarray:
+        """Price per row from an instrument -> price dict; NaN for unpriced rows."""
+        px = np.full(len(self.trade_ids), np.nan)
+        if len(self._instrument_code) == 1:
+            price = prices.get(self.instruments[0]) if self.instruments else None
+            if price is not None:
+                px.fill(price)
+            return px
+        for inst, price in prices.items():
+            code = self._instrument_code.get(inst)
+            if code is not None:
+                px[self.instrument_idx == code] = price
+        return px
 
 
 # Default order management config
@@ -82,24 +187,155 @@ def __init__(
         self,
         broker=None,
         config: Optional[Dict] = None,
+        state_file: Optional[Path] = None,
+        save_interval: float = SAVE_MIN_INTERVAL,
+        snapshot_every: int = WAL_SNAPSHOT_EVERY,
+        wal_fsync: bool = False,
+        async_callbacks: bool = False,
+        pretty_state: bool = False,
     ):
         self.broker = broker
         self.config = {**DEFAULT_ORDER_CONFIG, **(config or {})}
         self.managed_orders: Dict[str, ManagedOrder] = {}
         self._callbacks: List[Callable] = []
 
+        # Order-management thresholds, resolved once for the per-tick update_price
+        be_cfg = self.config.get("break_even", {})
+        self._be_enabled = be_cfg.get("enabled", True)
+        self._be_trigger_r = be_cfg.get("trigger_r", 1.0)
+        self._be_offset = be_cfg.get("offset_pips", 2) * 0.01  # Convert pips to price
+        pc_cfg = self.config.get("partial_close", {})
+        self._pc_enabled = pc_cfg.get("enabled", True)
+        self._pc_trigger_r = pc_cfg.get("trigger_r", 1.0)
+        self._pc_close_pct = pc_cfg.get("close_pct", 50)
+        ts_cfg = self.config.get("trailing_stop", {})
+        self._ts_enabled = ts_cfg.get("enabled", True)
+        self._ts_activation_r = ts_cfg.get("activation_r", 1.5)
+        self._ts_trail_r = ts_cfg.get("trail_distance_r", 1.0)
+        # Below the lowest enabled trigger, a tick can only move the peak price
+        triggers = [r for enabled, r in ((self._be_enabled, self._be_trigger_r),
+                                         (self._pc_enabled, self._pc_trigger_r),
+                                         (self._ts_enabled, self._ts_activation_r)) if enabled]
+        self._min_trigger_r = min(triggers) if triggers else float("inf")
+        self._arrays: Optional[_OrderArrays] = None  # built lazily by update_prices
+
+        # State persistence: every order event is appended to a write-ahead log
+        # (state.wal, one JSON line each); state.json is a full snapshot taken every
+        # snapshot_every events (atomic, coalesced), after which the WAL is truncated.
+        self.state_file = Path(state_file) if state_file is not None else STATE_FILE
+        self.pretty_state = pretty_state  # indent state.json for manual inspection
+        self.wal_file = self.state_file.with_suffix(".wal")
+        self.save_interval = save_interval
+        self.snapshot_every = snapshot_every
+        self.wal_fsync = wal_fsync
+        self._wal = None
+        self._wal_events = 0
+        self._save_lock = threading.Lock()
+        self._save_timer: Optional[threading.Timer] = None
+        self._dirty = False
+        self._last_save_ts = 0.0
+
+        # async_callbacks: _notify only appends (event, order copy, details) to a bounded
+        # buffer (CALLBACK_QUEUE_SIZE); a daemon thread runs the callbacks, so slow
+        # subscribers do not stall update_price
+        self.coalesced_events = 0  # SL updates superseded while the buffer was full
+        self._events: Optional[Deque[Optional[tuple]]] = None
+        self._events_cond = threading.Condition()
+        self._dispatching = False  # the dispatcher is running callbacks for an event
+        self._dispatcher: Optional[threading.Thread] = None
+        if async_callbacks:
+            self._events = deque()
+            self._dispatcher = threading.Thread(
+                target=self._dispatch_loop, name="order-callbacks", daemon=True)
+            self._dispatcher.start()
+
     def add_callback(self, callback: Callable[[str, ManagedOrder, Dict], None]) -> None:
         """Add callback for order events (fill, close, modify, etc.)."""
         self._callbacks.append(callback)
 
     def _notify(self, event: str, order: ManagedOrder, details: Dict = None) -> None:
-        """Notify all callbacks of an order event."""
+        """Log the event to the WAL, then notify all callbacks (inline or via the dispatcher)."""
+        self._log_event(event, order)
+        if not self._callbacks:
+            return
+        if self._events is None:
+            self._run_callbacks(event, order, details or {})
+            return
+        # Copy: the dispatcher may run after update_price has mutated the order again
+        item = (event, copy.copy(order), details or {})
+        with self._events_cond:
+            events = self._events
+            if len(events) >= CALLBACK_QUEUE_SIZE:
+                self._supersede_sl_updates(item)
+            while len(events) >= CALLBACK_QUEUE_SIZE:
+                # Nothing left to supersede: wait for the dispatcher, never lose an event
+                self._events_cond.wait()
+            events.append(item)
+            self._events_cond.notify_all()
+
+    def _supersede_sl_updates(self, incoming: tuple) -> None:
+        """Full buffer: keep only the latest SL update per trade (counting incoming). Caller holds the lock."""
+        events = self._events
+        latest = {incoming[1].trade_id} if incoming[0] in SL_EVENTS else set()
+        kept: Deque[Optional[tuple]] = deque()
+        for pending in reversed(events):
+            if pending is not None and pending[0] in SL_EVENTS:
+                trade_id = pending[1].trade_id
+                if trade_id in latest:
+                    continue
+                latest.add(trade_id)
+            kept.appendleft(pending)
+        superseded = len(events) - len(kept)
+        if superseded:
+            self.coalesced_events += superseded
+            logger.warning("Callback buffer full, superseded %d queued SL updates", superseded)
+            events.clear()
+            events.extend(kept)
+
+    def _run_callbacks(self, event: str, order: ManagedOrder, details: Dict) -> None:
         for cb in self._callbacks:
             try:
-                cb(event, order, details or {})
+                cb(event, order, details)
             except Exception as e:
                 logger.warning("Callback error: %s", e)
 
+    def _dispatch_loop(self) -> None:
+        cond = self._events_cond
+        events = self._events
+        while True:
+            with cond:
+                while not events:
+                    cond.wait()
+                item = events.popleft()
+                self._dispatching = item is not None
+                cond.notify_all()  # room for a waiting _notify
+            if item is None:
+                return
+            try:
+                self._run_callbacks(*item)
+            finally:
+                with cond:
+                    self._dispatching = False
+                    cond.notify_all()
+
+    def flush_callbacks(self) -> None:
+        """Block until the dispatcher has run every queued event (no-op when synchronous)."""
+        if self._events is None:
+            return
+        with self._events_cond:
+            while self._events or self._dispatching:
+                self._events_cond.wait()
+
+    def stop_callbacks(self) -> None:
+        """Run the remaining queued events, then stop the dispatcher thread."""
+        if self._dispatcher is not None:
+            with self._events_cond:
+                self._events.append(None)  # sentinel, may exceed the bound
+                self._events_cond.notify_all()
+            self._dispatcher.join()
+            self._dispatcher = None
+            self._events = None
+
     def register_trade(
         self,
         trade_id: str,
@@ -134,8 +370,8 @@ def register_trade(
             requested_price=requested_price,
         )
         self.managed_orders[trade_id] = order
+        self._arrays = None
         self._notify("REGISTERED", order)
-        self.save_state()
         logger.info("Registered trade %s: %s %s @ %.2f sl=%.2f tp=%.2f",
                      trade_id, direction, instrument, entry_price, sl, tp)
         return order
@@ -149,29 +385,28 @@ def update_price(self, trade_id: str, current_price: float) -> None:
         if not order:
             return
 
-        cfg = self.config
-        risk = abs(order.entry_price - order.original_sl)
+        risk = order.risk
         if risk <= 0:
             return
+        long = order.sign > 0
+        entry = order.entry_price
+        current_r = (current_price - entry) * order.sign / risk
 
         # Update peak price
-        if order.direction == "LONG":
-            current_r = (current_price - order.entry_price) / risk
+        if long:
             if current_price > order.peak_price:
                 order.peak_price = current_price
-        else:
-            current_r = (order.entry_price - current_price) / risk
-            if current_price < order.peak_price or order.peak_price == order.entry_price:
-                order.peak_price = current_price
+        elif current_price < order.peak_price or order.peak_price == entry:
+            order.peak_price = current_price
+        arrays = self._arrays
+        if arrays is not None:
+            i = arrays.row.get(trade_id)
+            if i is not None:
+                arrays.peak[i] = order.peak_price
 
         # --- Break-even ---
-        be_cfg = cfg.get("break_even", {})
-        if be_cfg.get("enabled", True) and not order.break_even_set and current_r >= be_cfg.get("trigger_r", 1.0):
-            offset = be_cfg.get("offset_pips", 2) * 0.01  # Convert pips to price
-            if order.direction == "LONG":
-                new_sl = order.entry_price + offset
-            else:
-                new_sl = order.entry_price - offset
+        if self._be_enabled and not order.break_even_set and current_r >= self._be_trigger_r:
+            new_sl = entry + self._be_offset if long else entry - self._be_offset
 
             if self._modify_sl(trade_id, new_sl):
                 order.current_sl = new_sl
@@ -180,11 +415,8 @@ def update_price(self, trade_id: str, current_price: float) -> None:
                 logger.info("Trade %s: break-even set at %.2f (%.1fR profit)", trade_id, new_sl, current_r)
 
         # --- Partial close ---
-        pc_cfg = cfg.get("partial_close", {})
-        if (pc_cfg.get("enabled", True) and not order.partial_closed
-                and current_r >= pc_cfg.get("trigger_r", 1.0)):
-            close_pct = pc_cfg.get("close_pct", 50)
-            units_to_close = round(order.units * close_pct / 100)
+        if self._pc_enabled and not order.partial_closed and current_r >= self._pc_trigger_r:
+            units_to_close = round(order.units * self._pc_close_pct / 100)
             if units_to_close > 0 and self._partial_close(trade_id, units_to_close):
                 order.partial_closed = True
                 order.units -= units_to_close
@@ -196,25 +428,53 @@ def update_price(self, trade_id: str, current_price: float) -> None:
                 logger.info("Trade %s: partial close %d units at %.1fR", trade_id, units_to_close, current_r)
 
         # --- Trailing stop ---
-        ts_cfg = cfg.get("trailing_stop", {})
-        if ts_cfg.get("enabled", True) and current_r >= ts_cfg.get("activation_r", 1.5):
-            trail_distance = ts_cfg.get("trail_distance_r", 1.0) * risk
-            if order.direction == "LONG":
+        if self._ts_enabled and current_r >= self._ts_activation_r:
+            trail_distance = self._ts_trail_r * risk
+            if long:
                 new_sl = order.peak_price - trail_distance
-                if new_sl > order.current_sl:
-                    if self._modify_sl(trade_id, new_sl):
-                        order.current_sl = new_sl
-                        order.trailing_active = True
-                        self._notify("TRAILING_STOP", order, {"new_sl": new_sl, "profit_r": current_r})
-                        logger.debug("Trade %s: trailing stop updated to %.2f", trade_id, new_sl)
+                improved = new_sl > order.current_sl
             else:
                 new_sl = order.peak_price + trail_distance
-                if new_sl < order.current_sl:
-                    if self._modify_sl(trade_id, new_sl):
-                        order.current_sl = new_sl
-                        order.trailing_active = True
-                        self._notify("TRAILING_STOP", order, {"new_sl": new_sl, "profit_r": current_r})
-                        logger.debug("Trade %s: trailing stop updated to %.2f", trade_id, new_sl)
+                improved = new_sl < order.current_sl
+            if improved and self._modify_sl(trade_id, new_sl):
+                order.current_sl = new_sl
+                order.trailing_active = True
+                self._notify("TRAILING_STOP", order, {"new_sl": new_sl, "profit_r": current_r})
+                logger.debug("Trade %s: trailing stop updated to %.2f", trade_id, new_sl)
+
+    def update_prices(self, prices: Dict[str, float]) -> None:
+        """
+        Update all managed trades from an instrument -> price dict in one vector pass.
+        Same outcome as update_price per trade: trades below the lowest enabled R
+        trigger only get their peak price updated (vectorized); the few that reach
+        a trigger go through update_price for the broker calls and notifications.
+        """
+        arrays = self._arrays
+        if arrays is None or len(arrays) != len(self.managed_orders):
+            arrays = self._arrays = _OrderArrays(list(self.managed_orders.values()))
+        if not len(arrays):
+            return
+
+        px = arrays.price_vector(prices)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            valid = ~np.isnan(px) & (arrays.risk > 0)
+            current_r = (px - arrays.entry) * arrays.sign / arrays.risk
+            triggered = valid & (current_r >= self._min_trigger_r)
+
+        # Peak-only rows
+        quiet = valid & ~triggered
+        peak = arrays.peak
+        new_peak = np.where(arrays.sign > 0, px > peak, (px < peak) | (peak == arrays.entry))
+        moved = np.flatnonzero(quiet & new_peak)
+        if len(moved):
+            peak[moved] = px[moved]
+            orders = self.managed_orders
+            for i in moved.tolist():
+                orders[arrays.trade_ids[i]].peak_price = prices[arrays.instruments[i]]
+
+        # Rows at/above a trigger: scalar path (broker calls, callbacks)
+        for i in np.flatnonzero(triggered).tolist():
+            self.update_price(arrays.trade_ids[i], prices[arrays.instruments[i]])
 
     def _modify_sl(self, trade_id: str, new_sl: float) -> bool:
         """Modify SL via broker."""
@@ -231,67 +491,117 @@ def _partial_close(self, trade_id: str, units: float) -> bool:
     def unregister_trade(self, trade_id: str, reason: str = "closed") -> Optional[ManagedOrder]:
         """Remove a trade from management."""
         order = self.managed_orders.pop(trade_id, None)
+        self._arrays = None
         if order:
             self._notify("UNREGISTERED", order, {"reason": reason})
-            self.save_state()
             logger.info("Unregistered trade %s: %s", trade_id, reason)
         return order
 
+    def _log_event(self, event: str, order: ManagedOrder) -> None:
+        """
+        Append one WAL line: the order's full record, or just its id for UNREGISTERED.
+        O(1) per mutation; a snapshot is requested every snapshot_every events.
+        """
+        if event == "UNREGISTERED":
+            record = {"ev": event, "trade_id": order.trade_id}
+        else:
+            record = {"ev": event, "order": _order_to_dict(order)}
+        line = dumps(record) + b"\n"
+        with self._save_lock:
+            if self._wal is None:
+                self.wal_file.parent.mkdir(parents=True, exist_ok=True)
+                self._wal = open(self.wal_file, "ab")
+            self._wal.write(line)
+            self._wal.flush()
+            if self.wal_fsync:
+                os.fsync(self._wal.fileno())
+            self._wal_events += 1
+            snapshot_due = self._wal_events >= self.snapshot_every
+        if snapshot_due:
+            self._request_save()
+
+    def _request_save(self) -> None:
+        """
+        Save now, or if the last save was less than save_interval ago, mark the
+        state dirty and let a timer write it once at the end of the window.
+        """
+        with self._save_lock:
+            wait = self._last_save_ts + self.save_interval - time.monotonic()
+            if wait > 0:
+                self._dirty = True
+                if self._save_timer is None:
+                    self._save_timer = threading.Timer(wait, self._flush_pending)
+                    self._save_timer.daemon = True
+                    self._save_timer.start()
+                return
+        self.save_state()
+
+    def _flush_pending(self) -> None:
+        with self._save_lock:
+            self._save_timer = None
+            if not self._dirty:
+                return
+        self.save_state()
+
     def save_state(self) -> None:
-        """Save current state to disk for recovery."""
-        state = {}
-        for tid, order in self.managed_orders.items():
-            state[tid] = {
-                "trade_id": order.trade_id,
-                "instrument": order.instrument,
-                "direction": order.direction,
-                "entry_price": order.entry_price,
-                "units": order.units,
-                "original_sl": order.original_sl,
-                "original_tp": order.original_tp,
-                "current_sl": order.current_sl,
-                "current_tp": order.current_tp,
-                "open_time": order.open_time.isoformat(),
-                "atr_at_entry": order.atr_at_entry,
-                "regime_at_entry": order.regime_at_entry,
-                "partial_closed": order.partial_closed,
-                "break_even_set": order.break_even_set,
-                "trailing_active": order.trailing_active,
-                "peak_price": order.peak_price,
-                "slippage": order.slippage,
-            }
-
-        STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
-        STATE_FILE.write_text(json.dumps(state, indent=2, default=str), encoding="utf-8")
+        """
+        Snapshot current state to disk for recovery (immediately; flushes any pending
+        save) and truncate the WAL, whose events the snapshot now contains.
+        """
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            self._dirty = False
+            self._last_save_ts = time.monotonic()
+            self._write_state()
+            if self._wal is not None:
+                self._wal.truncate(0)
+            elif self.wal_file.exists():
+                self.wal_file.write_bytes(b"")
+            self._wal_events = 0
+
+    def _write_state(self) -> None:
+        """Write state via a temp file + os.replace, so a crash never leaves a truncated state.json."""
+        state = {tid: _order_to_dict(order) for tid, order in list(self.managed_orders.items())}
+
+        path = self.state_file
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_bytes(dumps(state, indent=self.pretty_state))
+        os.replace(tmp, path)
 
     def load_state(self) -> int:
-        """Load state from disk. Returns number of restored orders."""
-        if not STATE_FILE.exists():
+        """Load the state.json snapshot, then replay the WAL. Returns number of restored orders."""
+        if not self.state_file.exists() and not self.wal_file.exists():
             return 0
 
         try:
-            state = json.loads(STATE_FILE.read_text(encoding="utf-8"))
-            for tid, data in state.items():
-                order = ManagedOrder(
-                    trade_id=data["trade_id"],
-                    instrument=data["instrument"],
-                    direction=data["direction"],
-                    entry_price=data["entry_price"],
-                    units=data["units"],
-                    original_sl=data["original_sl"],
-                    original_tp=data["original_tp"],
-                    current_sl=data["current_sl"],
-                    current_tp=data["current_tp"],
-                    open_time=datetime.fromisoformat(data["open_time"]),
-                    atr_at_entry=data.get("atr_at_entry", 0),
-                    regime_at_entry=data.get("regime_at_entry", ""),
-                    partial_closed=data.get("partial_closed", False),
-                    break_even_set=data.get("break_even_set", False),
-                    trailing_active=data.get("trailing_active", False),
-                    peak_price=data.get("peak_price", data["entry_price"]),
-                    slippage=data.get("slippage", 0),
-                )
-                self.managed_orders[tid] = order
+            if self.state_file.exists():
+                state = loads(self.state_file.read_bytes())
+                for tid, data in state.items():
+                    self.managed_orders[tid] = _order_from_dict(data)
+                self._arrays = None
+
+            if self.wal_file.exists():
+                replayed = 0
+                for line in self.wal_file.read_bytes().splitlines():
+                    if not line.strip():
+                        continue
+                    try:
+                        record = loads(line)
+                    except ValueError:
+                        logger.warning("Skipping torn WAL line in %s", self.wal_file)
+                        continue
+                    if record["ev"] == "UNREGISTERED":
+                        self.managed_orders.pop(record["trade_id"], None)
+                    else:
+                        order = _order_from_dict(record["order"])
+                        self.managed_orders[order.trade_id] = order
+                    self._arrays = None
+                    replayed += 1
+                if replayed:
+                    logger.info("Replayed %d WAL events", replayed)
 
             logger.info("Restored %d managed orders from state", len(self.managed_orders))
             return len(self.managed_orders)
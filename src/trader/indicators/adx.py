@@ -1,59 +1,108 @@
 """
 ADX (Average Directional Index) – trend strength measurement.
 """
+from typing import Dict, Tuple
+
 import numpy as np
 import pandas as pd
 
+from src.trader.indicators.atr import true_range
 
-def adx(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> pd.Series:
+
+def _smoothed_dm_atr(
+    high: pd.Series, low: pd.Series, close: pd.Series, period: int, raw_up_for_minus: bool = False
+) -> Tuple[pd.Series, pd.Series, pd.Series]:
     """
-    Compute the Average Directional Index (ADX).
-    ADX > 25 = trending, ADX < 20 = ranging.
+    Wilder-smoothed +DM, -DM and ATR, computed once for ADX/+DI/-DI.
+    raw_up_for_minus: compare -DM against the unmasked up-move (standalone minus_di).
     """
-    plus_dm = high.diff()
-    minus_dm = -low.diff()
-    plus_dm = plus_dm.where((plus_dm > minus_dm) & (plus_dm > 0), 0.0)
-    minus_dm = minus_dm.where((minus_dm > plus_dm) & (minus_dm > 0), 0.0)
+    up = high.diff()
+    down = -low.diff()
+    plus_dm = up.where((up > down) & (up > 0), 0.0)
+    minus_dm = down.where((down > (up if raw_up_for_minus else plus_dm)) & (down > 0), 0.0)
+
+    tr = true_range(high, low, close)
 
-    tr1 = high - low
-    tr2 = (high - close.shift(1)).abs()
-    tr3 = (low - close.shift(1)).abs()
-    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+    # One 2-D ewm pass smooths all three columns (the recurrence runs in compiled code)
+    stacked = pd.DataFrame(
+        np.column_stack((plus_dm.to_numpy(dtype=np.float64),
+                         minus_dm.to_numpy(dtype=np.float64),
+                         tr)),
+        index=high.index,
+    )
+    smoothed = stacked.ewm(alpha=1 / period, adjust=False).mean()
+    return smoothed[0], smoothed[1], smoothed[2]
 
-    atr_val = tr.ewm(alpha=1 / period, adjust=False).mean()
-    plus_di = 100 * (plus_dm.ewm(alpha=1 / period, adjust=False).mean() / atr_val)
-    minus_di = 100 * (minus_dm.ewm(alpha=1 / period, adjust=False).mean() / atr_val)
 
-    dx = (plus_di - minus_di).abs() / (plus_di + minus_di).replace(0, np.nan) * 100
+def adx_full(
+    high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14
+) -> Dict[str, pd.Series]:
+    """
+    ADX, +DI and -DI in one pass: {"adx", "plus_di", "minus_di"}.
+    Prefer this over calling adx()/plus_di()/minus_di() separately.
+    """
+    plus_dm_s, minus_dm_s, atr_val = _smoothed_dm_atr(high, low, close, period)
+    pdi = 100 * (plus_dm_s / atr_val)
+    mdi = 100 * (minus_dm_s / atr_val)
+
+    dx = (pdi - mdi).abs() / (pdi + mdi).replace(0, np.nan) * 100
     adx_val = dx.ewm(alpha=1 / period, adjust=False).mean()
-    return adx_val
+    return {"adx": adx_val, "plus_di": pdi, "minus_di": mdi}
 
 
-def plus_di(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> pd.Series:
-    """Compute +DI (positive directional indicator)."""
-    plus_dm = high.diff()
-    minus_dm = -low.diff()
-    plus_dm = plus_dm.where((plus_dm > minus_dm) & (plus_dm > 0), 0.0)
+def adx(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> pd.Series:
+    """
+    Compute the Average Directional Index (ADX).
+    ADX > 25 = trending, ADX < 20 = ranging.
+    """
+    return adx_full(high, low, close, period)["adx"]
 
-    tr1 = high - low
-    tr2 = (high - close.shift(1)).abs()
-    tr3 = (low - close.shift(1)).abs()
-    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
 
-    atr_val = tr.ewm(alpha=1 / period, adjust=False).mean()
-    return 100 * (plus_dm.ewm(alpha=1 / period, adjust=False).mean() / atr_val)
+def plus_di(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> pd.Series:
+    """Compute +DI (positive directional indicator)."""
+    plus_dm_s, _, atr_val = _smoothed_dm_atr(high, low, close, period)
+    return 100 * (plus_dm_s / atr_val)
 
 
 def minus_di(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> pd.Series:
     """Compute -DI (negative directional indicator)."""
-    plus_dm = high.diff()
-    minus_dm = -low.diff()
-    minus_dm = minus_dm.where((minus_dm > plus_dm) & (minus_dm > 0), 0.0)
+    _, minus_dm_s, atr_val = _smoothed_dm_atr(high, low, close, period, raw_up_for_minus=True)
+    return 100 * (minus_dm_s / atr_val)
+
+
+def adx_batch(
+    high: pd.DataFrame, low: pd.DataFrame, close: pd.DataFrame, period: int = 14
+) -> Dict[str, pd.DataFrame]:
+    """
+    adx_full() for many instruments at once: one column per instrument on a
+    shared index. All +DM/-DM/TR columns go through a single 2-D ewm pass and
+    the DX columns through another, so the Wilder recurrences of every
+    instrument run together in compiled code. Returns {"adx", "plus_di", "minus_di"}.
+    """
+    up = high.diff()
+    down = -low.diff()
+    plus_dm = up.where((up > down) & (up > 0), 0.0)
+    minus_dm = down.where((down > plus_dm) & (down > 0), 0.0).to_numpy(dtype=np.float64)
+    plus_dm = plus_dm.to_numpy(dtype=np.float64)
+
+    h = high.to_numpy(dtype=np.float64)
+    l = low.to_numpy(dtype=np.float64)
+    prev_close = close.shift(1).to_numpy(dtype=np.float64)
+    tr = np.fmax(np.fmax(h - l, np.abs(h - prev_close)), np.abs(l - prev_close))
 
-    tr1 = high - low
-    tr2 = (high - close.shift(1)).abs()
-    tr3 = (low - close.shift(1)).abs()
-    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+    n = h.shape[1]
+    smoothed = pd.DataFrame(np.hstack((plus_dm, minus_dm, tr)), index=high.index)
+    smoothed = smoothed.ewm(alpha=1 / period, adjust=False).mean().to_numpy()
+    atr_val = smoothed[:, 2 * n:]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        pdi = 100 * (smoothed[:, :n] / atr_val)
+        mdi = 100 * (smoothed[:, n:2 * n] / atr_val)
+        denom = pdi + mdi
+        dx = np.abs(pdi - mdi) / np.where(denom == 0, np.nan, denom) * 100
 
-    atr_val = tr.ewm(alpha=1 / period, adjust=False).mean()
-    return 100 * (minus_dm.ewm(alpha=1 / period, adjust=False).mean() / atr_val)
+    adx_val = pd.DataFrame(dx, index=high.index).ewm(alpha=1 / period, adjust=False).mean().to_numpy()
+    return {
+        "adx": pd.DataFrame(adx_val, index=high.index, columns=high.columns),
+        "plus_di": pd.DataFrame(pdi, index=high.index, columns=high.columns),
+        "minus_di": pd.DataFrame(mdi, index=high.index, columns=high.columns),
+    }
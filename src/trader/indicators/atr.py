@@ -1,12 +1,25 @@
 """
 ATR (Average True Range) – volatility.
 """
+import numpy as np
 import pandas as pd
 
 
+def true_range(high: pd.Series, low: pd.Series, close: pd.Series) -> np.ndarray:
+    """True range as a float64 array; NaN terms are skipped (first bar = high - low)."""
+    h = high.to_numpy(dtype=np.float64)
+    lo = low.to_numpy(dtype=np.float64)
+    prev_close = close.shift(1).to_numpy(dtype=np.float64)
+    return np.fmax(np.fmax(h - lo, np.abs(h - prev_close)), np.abs(lo - prev_close))
+
+
+def wilder_smooth(values: np.ndarray, period: int) -> np.ndarray:
+    """
+    Wilder smoothing (ewm alpha=1/period, adjust=False) of a raw array, returned
+    as a writable array; skips building an indexed Series around the input.
+    """
+    return pd.Series(values, copy=False).ewm(alpha=1 / period, adjust=False).mean().to_numpy(copy=True)
+
+
 def atr(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> pd.Series:
-    tr1 = high - low
-    tr2 = (high - close.shift(1)).abs()
-    tr3 = (low - close.shift(1)).abs()
-    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-    return tr.ewm(alpha=1 / period, adjust=False).mean()
+    return pd.Series(wilder_smooth(true_range(high, low, close), period), index=high.index)
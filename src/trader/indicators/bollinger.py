@@ -1,7 +1,21 @@
 """
 Bollinger Bands – volatility and range detection.
 """
+import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def _bb_arrays(close: pd.Series, period: int, std_dev: float):
+    """
+    One rolling window object for mean and std, then the band math on plain
+    float64 arrays (no per-operation index alignment). Returns sma, upper, lower.
+    """
+    roll = close.rolling(period)
+    sma = roll.mean().to_numpy()
+    std = roll.std().to_numpy()
+    band = std_dev * std
+    return sma, sma + band, sma - band
 
 
 def bollinger_bands(
@@ -13,13 +27,11 @@ def bollinger_bands(
     Compute Bollinger Bands.
     Returns DataFrame with columns: bb_upper, bb_middle, bb_lower, bb_width, bb_pct_b.
     """
-    sma = close.rolling(period).mean()
-    std = close.rolling(period).std()
-
-    upper = sma + std_dev * std
-    lower = sma - std_dev * std
-    width = (upper - lower) / sma  # Normalized width
-    pct_b = (close - lower) / (upper - lower)  # %B: 0 = at lower, 1 = at upper
+    sma, upper, lower = _bb_arrays(close, period, std_dev)
+    spread = upper - lower
+    with np.errstate(invalid="ignore", divide="ignore"):
+        width = spread / sma  # Normalized width
+        pct_b = (close.to_numpy(dtype=np.float64) - lower) / spread  # %B: 0 = at lower, 1 = at upper
 
     return pd.DataFrame({
         "bb_upper": upper,
@@ -32,11 +44,9 @@ def bollinger_bands(
 
 def bb_width(close: pd.Series, period: int = 20, std_dev: float = 2.0) -> pd.Series:
     """Compute just the Bollinger Band width (normalized)."""
-    sma = close.rolling(period).mean()
-    std = close.rolling(period).std()
-    upper = sma + std_dev * std
-    lower = sma - std_dev * std
-    return (upper - lower) / sma
+    sma, upper, lower = _bb_arrays(close, period, std_dev)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return pd.Series((upper - lower) / sma, index=close.index, name=close.name)
 
 
 def bb_squeeze(close: pd.Series, period: int = 20, squeeze_pct: float = 25.0) -> pd.Series:
@@ -45,7 +55,24 @@ def bb_squeeze(close: pd.Series, period: int = 20, squeeze_pct: float = 25.0) ->
     Returns True when BB width is in bottom `squeeze_pct`% of its range.
     """
     width = bb_width(close, period)
-    percentile = width.rolling(50, min_periods=10).apply(
-        lambda x: pd.Series(x).rank(pct=True).iloc[-1], raw=False
-    )
+    percentile = _rolling_last_pct_rank(width, 50, min_periods=10)
     return percentile < (squeeze_pct / 100.0)
+
+
+def _rolling_last_pct_rank(values: pd.Series, window: int, min_periods: int) -> pd.Series:
+    """
+    Percentile rank (pandas rank(pct=True), average ties) of each value within its
+    trailing window, vectorized over all windows at once instead of rolling().apply.
+    NaN where the value is NaN or the window has fewer than min_periods values.
+    """
+    arr = values.to_numpy(dtype=np.float64)
+    padded = np.concatenate((np.full(window - 1, np.nan), arr))
+    win = sliding_window_view(padded, window)
+    last = arr[:, None]
+    count = (~np.isnan(win)).sum(axis=1)
+    less = (win < last).sum(axis=1)
+    equal = (win == last).sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        pct = (less + (equal + 1) / 2.0) / count
+    pct[(count < min_periods) | np.isnan(arr)] = np.nan
+    return pd.Series(pct, index=values.index, name=values.name)
@@ -1,8 +1,66 @@
 """
 EMA (Exponential Moving Average).
 """
+import math
+from typing import Optional
+
 import pandas as pd
 
 
 def ema(series: pd.Series, period: int) -> pd.Series:
     return series.ewm(span=period, adjust=False).mean()
+
+
+def ema_alpha(period: int) -> float:
+    """Smoothing factor for span=period (same as pandas ewm(span=period))."""
+    return 2.0 / (period + 1.0)
+
+
+def ema_init(series: pd.Series, period: int) -> float:
+    """Seed value for incremental updates: the last ema(series, period) value."""
+    return float(ema(series, period).iloc[-1])
+
+
+def ema_step(state: float, price: float, alpha: float) -> float:
+    """One O(1) EMA update; bit-identical to the next ema() value for a non-NaN price."""
+    if price == state:
+        return state
+    old_wt = 1.0 - alpha
+    return (old_wt * state + alpha * price) / (old_wt + alpha)
+
+
+class EMAState:
+    """
+    Incremental EMA for the live path: update(price) per new bar instead of
+    re-running ema() over the whole history. Bit-identical to ema() on NaN-free
+    prices; a NaN price decays the previous weight like ewm(ignore_na=False).
+    """
+
+    __slots__ = ("alpha", "value", "_old_wt")
+
+    def __init__(self, period: int, seed: Optional[pd.Series] = None):
+        self.alpha = ema_alpha(period)
+        self.value = math.nan
+        self._old_wt = 1.0
+        if seed is not None and len(seed):
+            self.value = ema_init(seed, period)
+            # NaNs after the last valid seed price have already decayed the weight
+            for is_nan in seed.isna().to_numpy()[::-1]:
+                if not is_nan:
+                    break
+                self._old_wt *= 1.0 - self.alpha
+
+    def update(self, price: float) -> float:
+        if math.isnan(self.value):
+            if not math.isnan(price):
+                self.value = float(price)
+                self._old_wt = 1.0
+            return self.value
+        if math.isnan(price):
+            self._old_wt *= 1.0 - self.alpha
+            return self.value
+        old_wt = self._old_wt * (1.0 - self.alpha)
+        if price != self.value:
+            self.value = (old_wt * self.value + self.alpha * price) / (old_wt + self.alpha)
+        self._old_wt = 1.0
+        return self.value
@@ -3,21 +3,29 @@
 """
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def _swing_points(values: pd.Series, lookback: int, reduce: np.ufunc) -> pd.Series:
+    """
+    Bars whose value equals the reduce (fmax/fmin) of the centered window of
+    2*lookback+1 bars; NaN elsewhere and within lookback bars of either end.
+    fmax/fmin skip NaNs like pandas .max()/.min() did in the per-bar loop.
+    """
+    arr = values.to_numpy(dtype=np.float64)
+    out = np.full(len(arr), np.nan)
+    width = 2 * lookback + 1
+    if len(arr) >= width:
+        centers = arr[lookback : len(arr) - lookback]
+        extreme = reduce.reduce(sliding_window_view(arr, width), axis=1)
+        mask = centers == extreme
+        out[lookback : len(arr) - lookback][mask] = centers[mask]
+    return pd.Series(out, index=values.index)
 
 
 def swing_highs(high: pd.Series, lookback: int = 5) -> pd.Series:
-    out = pd.Series(np.nan, index=high.index)
-    for i in range(lookback, len(high) - lookback):
-        window = high.iloc[i - lookback : i + lookback + 1]
-        if high.iloc[i] == window.max():
-            out.iloc[i] = high.iloc[i]
-    return out
+    return _swing_points(high, lookback, np.fmax)
 
 
 def swing_lows(low: pd.Series, lookback: int = 5) -> pd.Series:
-    out = pd.Series(np.nan, index=low.index)
-    for i in range(lookback, len(low) - lookback):
-        window = low.iloc[i - lookback : i + lookback + 1]
-        if low.iloc[i] == window.min():
-            out.iloc[i] = low.iloc[i]
-    return out
+    return _swing_points(low, lookback, np.fmin)
@@ -1,21 +1,103 @@
 """
 Simple in-memory cache for DataFrames (symbol, timeframe, range).
 Optional TTL; used by backtest to avoid re-reading parquet every bar.
+Bounded LRU: at most _max_entries frames and (optionally) _max_bytes in total;
+the least recently used entries are evicted first (expired ones before that).
 """
+import sys
+import time
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Optional, Tuple
 
 import pandas as pd
 
 
-_cache: Dict[Tuple[str, str, Optional[datetime], Optional[datetime]], pd.DataFrame] = {}
-_meta: Dict[Tuple[str, str], datetime] = {}
+# (interned SYMBOL, interned timeframe, start bound, end bound): interned strings cache
+# their hash and compare by identity; a bound is (epoch ns, tz-aware) and hashes far
+# cheaper than a datetime. The flag keeps naive and aware bounds of the same instant
+# apart, as their frames can carry differently-localized indexes.
+Bound = Tuple[int, bool]
+CacheKey = Tuple[str, str, Optional[Bound], Optional[Bound]]
+
+_cache: "OrderedDict[CacheKey, pd.DataFrame]" = OrderedDict()
+_sizes: Dict[CacheKey, int] = {}
+_total_bytes: int = 0
+_meta: Dict[Tuple[str, str], float] = {}  # time.monotonic() of the last set
 _ttl_hours: float = 24.0
+_ttl_secs: float = _ttl_hours * 3600.0
+_max_entries: int = 128
+_max_bytes: int = 0  # 0 = no byte cap
 
 
 def set_ttl_hours(hours: float) -> None:
-    global _ttl_hours
+    global _ttl_hours, _ttl_secs
     _ttl_hours = hours
+    _ttl_secs = hours * 3600.0 if hours > 0 else 0.0
+
+
+def set_max_entries(n: int) -> None:
+    """Cap the number of cached frames (0 = unbounded)."""
+    global _max_entries
+    _max_entries = n
+    _evict()
+
+
+def set_max_bytes(n: int) -> None:
+    """Cap the total deep memory of cached frames in bytes (0 = unbounded)."""
+    global _max_bytes
+    _max_bytes = n
+    _evict()
+
+
+@lru_cache(maxsize=64)
+def _norm_symbol(symbol: str) -> str:
+    return sys.intern(symbol.upper())
+
+
+@lru_cache(maxsize=64)
+def _norm_timeframe(timeframe: str) -> str:
+    return sys.intern(timeframe)
+
+
+def _bound(dt: Optional[datetime]) -> Optional[Bound]:
+    """(nanoseconds since the epoch, tz-aware); naive datetimes count as UTC."""
+    if dt is None:
+        return None
+    if isinstance(dt, pd.Timestamp):
+        return (dt.value, dt.tzinfo is not None)
+    return (pd.Timestamp(dt).value, dt.tzinfo is not None)
+
+
+def _make_key(symbol: str, timeframe: str, start: Optional[datetime], end: Optional[datetime]) -> CacheKey:
+    return (_norm_symbol(symbol), _norm_timeframe(timeframe), _bound(start), _bound(end))
+
+
+def _drop(key: CacheKey) -> None:
+    global _total_bytes
+    _cache.pop(key, None)
+    _total_bytes -= _sizes.pop(key, 0)
+
+
+def _expired(meta_key: Tuple[str, str], now: float) -> bool:
+    stamp = _meta.get(meta_key)
+    return stamp is not None and now - stamp > _ttl_secs
+
+
+def _sweep_expired() -> None:
+    """Drop every expired entry; only run when the cache is at its entry cap."""
+    now = time.monotonic()
+    for key in [k for k in _cache if _expired((k[0], k[1]), now)]:
+        _drop(key)
+
+
+def _evict() -> None:
+    """Drop least recently used entries until both caps hold (always keeps the newest)."""
+    while len(_cache) > 1 and (
+        (_max_entries and len(_cache) > _max_entries) or (_max_bytes and _total_bytes > _max_bytes)
+    ):
+        _drop(next(iter(_cache)))
 
 
 def get(
@@ -24,16 +106,15 @@ def get(
     start: Optional[datetime] = None,
     end: Optional[datetime] = None,
 ) -> Optional[pd.DataFrame]:
-    key = (symbol.upper(), timeframe, start, end)
-    if key in _cache:
-        meta_key = (symbol.upper(), timeframe)
-        if meta_key in _meta and _ttl_hours > 0:
-            from datetime import timedelta
-            if datetime.now() - _meta[meta_key] > timedelta(hours=_ttl_hours):
-                _cache.pop(key, None)
-                return None
-        return _cache[key]
-    return None
+    key = _make_key(symbol, timeframe, start, end)
+    data = _cache.get(key)
+    if data is None:
+        return None
+    if _ttl_secs and _expired((key[0], key[1]), time.monotonic()):
+        _drop(key)
+        return None
+    _cache.move_to_end(key)
+    return data
 
 
 def set(
@@ -43,11 +124,22 @@ def set(
     start: Optional[datetime] = None,
     end: Optional[datetime] = None,
 ) -> None:
-    key = (symbol.upper(), timeframe, start, end)
+    global _total_bytes
+    key = _make_key(symbol, timeframe, start, end)
+    _drop(key)
     _cache[key] = data
-    _meta[(symbol.upper(), timeframe)] = datetime.now()
+    size = int(data.memory_usage(index=True, deep=True).sum())
+    _sizes[key] = size
+    _total_bytes += size
+    _meta[(key[0], key[1])] = time.monotonic()
+    if _ttl_secs and _max_entries and len(_cache) > _max_entries:
+        _sweep_expired()
+    _evict()
 
 
 def clear() -> None:
+    global _total_bytes
     _cache.clear()
+    _sizes.clear()
+    _total_bytes = 0
     _meta.clear()
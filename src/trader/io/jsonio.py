@@ -0,0 +1,43 @@
+"""
+JSON bytes encode/decode shared by state, WAL, knowledge-base and metrics writers.
+Uses orjson when installed (C extension, several times faster, serializes numpy
+natively), else stdlib json with the same numpy handling.
+"""
+import json
+from typing import Any
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """numpy scalars as native numbers, anything else as str()."""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return str(obj)
+
+
+# Reused encoders: compact by default (machine-read), indent=True for human-readable files
+_COMPACT_ENCODER = json.JSONEncoder(separators=(",", ":"), default=_default)
+_PRETTY_ENCODER = json.JSONEncoder(indent=2, default=_default)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to JSON bytes; compact unless indent=True (2-space indent)."""
+    if orjson is None:
+        return (_PRETTY_ENCODER if indent else _COMPACT_ENCODER).encode(obj).encode("utf-8")
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(obj, default=_default, option=option)
+
+
+def loads(raw: Any) -> Any:
+    """Parse JSON from bytes or str."""
+    if orjson is None:
+        return json.loads(raw)
+    return orjson.loads(raw)
@@ -12,10 +12,12 @@
 """
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
@@ -37,6 +39,54 @@
 # Max candles per Oanda API request
 MAX_CANDLES_PER_REQUEST = 5000
 
+# Candle length per Oanda granularity (sizes the windows of a parallel backfill)
+GRANULARITY_SECONDS = {
+    "M1": 60,
+    "M5": 300,
+    "M15": 900,
+    "M30": 1800,
+    "H1": 3600,
+    "H4": 14400,
+    "D": 86400,
+    "W": 604800,
+}
+FETCH_WORKERS = 8  # concurrent requests for a from/to backfill
+
+# compact=True: half-width columns for long histories (float32 keeps ~7 significant
+# digits, i.e. ~1e-4 at gold prices); Parquet stores and reloads the same dtypes
+COMPACT_DTYPES = {
+    "open": "float32",
+    "high": "float32",
+    "low": "float32",
+    "close": "float32",
+    "volume": "int32",
+}
+
+
+def _compact(df: pd.DataFrame) -> pd.DataFrame:
+    return df.astype({c: t for c, t in COMPACT_DTYPES.items() if c in df.columns}, copy=False)
+
+
+def _read_cache(cache_file: Path) -> pd.DataFrame:
+    """
+    Read a Parquet cache file (through a memory map unless OCLW_PARQUET_NO_MMAP=1,
+    as in parquet_loader); self_destruct frees each Arrow column as it is converted,
+    so peak memory stays near one copy of the data.
+    """
+    import pyarrow.parquet as pq
+    from src.trader.io import parquet_loader
+    table = pq.read_table(cache_file, memory_map=parquet_loader.MEMORY_MAP)
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def _write_cache(df: pd.DataFrame, cache_file: Path) -> None:
+    """Write the cache with the codec configured for parquet_loader (data.parquet_compression)."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    from src.trader.io import parquet_loader
+    table = pa.Table.from_pandas(df, preserve_index=True)
+    pq.write_table(table, cache_file, use_dictionary=True, **parquet_loader._compression_args())
+
 
 def _get_oanda_client(token: Optional[str] = None, environment: str = "practice"):
     """Create Oanda API client."""
@@ -50,6 +100,85 @@ def _get_oanda_client(token: Optional[str] = None, environment: str = "practice"
         raise ImportError("oandapyV20 not installed. Run: pip install oandapyV20")
 
 
+CANDLE_COLUMNS = ("time", "open", "high", "low", "close", "volume")
+
+
+def _candle_columns(candles: List[Dict]) -> Dict[str, np.ndarray]:
+    """
+    Complete candles of one API response -> preallocated column arrays
+    (time strings, OHLC float64, volume int64), trimmed to the complete count.
+    """
+    n = len(candles)
+    t = np.empty(n, dtype=object)
+    o = np.empty(n)
+    h = np.empty(n)
+    lo = np.empty(n)
+    cl = np.empty(n)
+    v = np.empty(n, dtype=np.int64)
+    k = 0
+    for c in candles:
+        if not c.get("complete", True):
+            continue  # Skip incomplete candles
+        mid = c.get("mid", {})
+        t[k] = c["time"]
+        o[k] = float(mid.get("o", 0))
+        h[k] = float(mid.get("h", 0))
+        lo[k] = float(mid.get("l", 0))
+        cl[k] = float(mid.get("c", 0))
+        v[k] = int(c.get("volume", 0))
+        k += 1
+    return {"time": t[:k], "open": o[:k], "high": h[:k], "low": lo[:k], "close": cl[:k], "volume": v[:k]}
+
+
+def _concat_columns(parts: List[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+    return {col: np.concatenate([p[col] for p in parts]) for col in CANDLE_COLUMNS}
+
+
+def _fmt_time(ts: datetime) -> str:
+    return ts.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _fetch_windows_parallel(
+    client,
+    instrument: str,
+    granularity: str,
+    start: datetime,
+    end: datetime,
+    max_workers: int,
+) -> Optional[List[Dict[str, np.ndarray]]]:
+    """
+    Split [start, end) into windows of at most MAX_CANDLES_PER_REQUEST candles and
+    request them concurrently (from/to per window, no count). Returns the
+    per-window column arrays in time order, or None if any window failed
+    (caller falls back to sequential paging).
+    """
+    from oandapyV20.endpoints.instruments import InstrumentsCandles
+
+    step = timedelta(seconds=GRANULARITY_SECONDS[granularity] * MAX_CANDLES_PER_REQUEST)
+    windows = []
+    ws = start
+    while ws < end:
+        we = min(ws + step, end)
+        windows.append((ws, we))
+        ws = we
+    if not windows:
+        return []
+
+    def fetch(window):
+        params = {"granularity": granularity, "price": "M",
+                  "from": _fmt_time(window[0]), "to": _fmt_time(window[1])}
+        response = client.request(InstrumentsCandles(instrument=instrument, params=params))
+        return _candle_columns(response.get("candles", []))
+
+    try:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(windows))) as pool:
+            parts = list(pool.map(fetch, windows))
+    except Exception as e:
+        logger.warning("Parallel candle fetch failed (%s), retrying sequentially", e)
+        return None
+    return parts
+
+
 def fetch_oanda_candles(
     instrument: str = "XAU_USD",
     granularity: str = "M15",
@@ -58,9 +187,14 @@ def fetch_oanda_candles(
     count: Optional[int] = None,
     token: Optional[str] = None,
     environment: str = "practice",
+    max_workers: int = FETCH_WORKERS,
+    compact: bool = False,
 ) -> pd.DataFrame:
     """
     Fetch historical candles from Oanda v20 API.
+    With both start and end, the range is fetched as concurrent windows
+    (max_workers requests in flight); otherwise pages are requested one by one.
+    compact=True returns float32 OHLC / int32 volume (see COMPACT_DTYPES).
 
     Returns DataFrame with columns: open, high, low, close, volume
     Indexed by DatetimeIndex (UTC).
@@ -69,74 +203,71 @@ def fetch_oanda_candles(
 
     from oandapyV20.endpoints.instruments import InstrumentsCandles
 
-    params: Dict = {
-        "granularity": granularity,
-        "price": "M",  # Mid prices
-    }
-
-    if start is not None:
-        params["from"] = start.strftime("%Y-%m-%dT%H:%M:%SZ")
-    if end is not None:
-        params["to"] = end.strftime("%Y-%m-%dT%H:%M:%SZ")
-    if count is not None:
-        params["count"] = min(count, MAX_CANDLES_PER_REQUEST)
-
-    all_candles = []
-
-    # Handle pagination for large date ranges
-    current_start = start
-    while True:
-        if current_start:
-            params["from"] = current_start.strftime("%Y-%m-%dT%H:%M:%SZ")
-        if end:
-            params["to"] = end.strftime("%Y-%m-%dT%H:%M:%SZ")
-        params["count"] = MAX_CANDLES_PER_REQUEST
-
-        try:
-            r = InstrumentsCandles(instrument=instrument, params=params)
-            response = client.request(r)
-            candles = response.get("candles", [])
-
-            if not candles:
-                break
-
-            for c in candles:
-                if not c.get("complete", True):
-                    continue  # Skip incomplete candles
-                mid = c.get("mid", {})
-                all_candles.append({
-                    "time": c["time"],
-                    "open": float(mid.get("o", 0)),
-                    "high": float(mid.get("h", 0)),
-                    "low": float(mid.get("l", 0)),
-                    "close": float(mid.get("c", 0)),
-                    "volume": int(c.get("volume", 0)),
-                })
-
-            # Check if we got all data
-            if len(candles) < MAX_CANDLES_PER_REQUEST:
+    parts = None
+    if start is not None and end is not None and granularity in GRANULARITY_SECONDS and max_workers > 1:
+        parts = _fetch_windows_parallel(client, instrument, granularity, start, end, max_workers)
+
+    if parts is None:
+        parts = []
+        params: Dict = {
+            "granularity": granularity,
+            "price": "M",  # Mid prices
+        }
+
+        if start is not None:
+            params["from"] = _fmt_time(start)
+        if end is not None:
+            params["to"] = _fmt_time(end)
+        if count is not None:
+            params["count"] = min(count, MAX_CANDLES_PER_REQUEST)
+
+        # Handle pagination for large date ranges
+        current_start = start
+        while True:
+            if current_start:
+                params["from"] = _fmt_time(current_start)
+            if end:
+                params["to"] = _fmt_time(end)
+            params["count"] = MAX_CANDLES_PER_REQUEST
+
+            try:
+                r = InstrumentsCandles(instrument=instrument, params=params)
+                response = client.request(r)
+                candles = response.get("candles", [])
+
+                if not candles:
+                    break
+
+                parts.append(_candle_columns(candles))
+
+                # Check if we got all data
+                if len(candles) < MAX_CANDLES_PER_REQUEST:
+                    break
+
+                # Move start forward for next batch
+                last_time = candles[-1]["time"]
+                current_start = pd.Timestamp(last_time).to_pydatetime() + timedelta(seconds=1)
+                if end and current_start >= end:
+                    break
+
+            except Exception as e:
+                logger.error("Failed to fetch Oanda candles: %s", e)
                 break
 
-            # Move start forward for next batch
-            last_time = candles[-1]["time"]
-            current_start = pd.Timestamp(last_time).to_pydatetime() + timedelta(seconds=1)
-            if end and current_start >= end:
-                break
-
-        except Exception as e:
-            logger.error("Failed to fetch Oanda candles: %s", e)
-            break
-
-    if not all_candles:
+    columns = _concat_columns(parts) if parts else None
+    if columns is None or not len(columns["time"]):
         return pd.DataFrame()
 
-    df = pd.DataFrame(all_candles)
+    df = pd.DataFrame(columns)
     df["time"] = pd.to_datetime(df["time"], utc=True)
     df = df.set_index("time")
     df = df.sort_index()
+    df = df[~df.index.duplicated(keep="last")]  # window edges may overlap
 
     # Remove timezone for compatibility with existing code
     df.index = df.index.tz_localize(None)
+    if compact:
+        df = _compact(df)
 
     logger.info("Fetched %d candles from Oanda (%s %s)", len(df), instrument, granularity)
     return df
@@ -149,10 +280,12 @@ def fetch_and_cache(
     base_path: Optional[Path] = None,
     token: Optional[str] = None,
     environment: str = "practice",
+    compact: bool = False,
 ) -> pd.DataFrame:
     """
     Fetch candles from Oanda and save to Parquet cache.
     If cache exists and is recent, appends only new data.
+    compact=True stores and returns float32 OHLC / int32 volume.
     """
     granularity = GRANULARITY_MAP.get(timeframe, timeframe.upper())
     cache_dir = (base_path or ROOT / "data" / "market_cache") / "XAUUSD"
@@ -166,7 +299,7 @@ def fetch_and_cache(
     existing_df = pd.DataFrame()
     if cache_file.exists():
         try:
-            existing_df = pd.read_parquet(cache_file)
+            existing_df = _read_cache(cache_file)
             if not existing_df.empty:
                 last_ts = existing_df.index.max()
                 if last_ts is not None:
@@ -186,6 +319,7 @@ def fetch_and_cache(
         end=end,
         token=token,
         environment=environment,
+        compact=compact,
     )
 
     # Merge with existing
@@ -197,10 +331,12 @@ def fetch_and_cache(
         df = new_df
     else:
         df = existing_df
+    if compact and not df.empty:
+        df = _compact(df)
 
     # Save to Parquet
     if not df.empty:
-        df.to_parquet(cache_file, engine="pyarrow", compression="snappy")
+        _write_cache(df, cache_file)
         logger.info("Saved %d candles to %s", len(df), cache_file)
 
     return df
@@ -213,6 +349,7 @@ def ensure_oanda_data(
     period_days: int = 90,
     token: Optional[str] = None,
     environment: str = "practice",
+    compact: bool = False,
 ) -> pd.DataFrame:
     """
     Ensure data is available, fetching from Oanda if needed.
@@ -227,4 +364,5 @@ def ensure_oanda_data(
         base_path=base_path,
         token=token,
         environment=environment,
+        compact=compact,
     )
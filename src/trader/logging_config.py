@@ -2,13 +2,21 @@
 Logging setup from config. Optionally writes to a log file (logging.file_path).
 The filename gets date and time before the extension, e.g. oclw_bot.log -> oclw_bot_2025-02-09_14-30-22.log
 If env OCLW_LOG_FILE is set, that path is used as-is (so one file per run when set by run_full_test).
+By default (logging.queue: true) the root logger only puts records on a queue; a
+QueueListener thread formats them and does the console/file writes.
 """
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+
+_queue: Optional[queue.Queue] = None
+_listener: Optional[logging.handlers.QueueListener] = None
 
 
 def log_path_with_timestamp(file_path: str) -> Path:
@@ -24,12 +32,35 @@ def log_path_with_timestamp(file_path: str) -> Path:
     return path.parent / new_name
 
 
+def _stop_listener() -> None:
+    """Drain the queue into the handlers, stop the listener thread and close its handlers."""
+    global _queue, _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _queue = None
+    _listener = None
+
+
+atexit.register(_stop_listener)
+
+
+def flush_logging() -> None:
+    """Block until every queued record is written (e.g. before a subprocess appends to the same file)."""
+    if _queue is not None:
+        _queue.join()
+
+
 def setup_logging(cfg: Dict[str, Any] | None = None) -> None:
+    global _queue, _listener
     cfg = cfg or {}
     log_cfg = cfg.get("logging", {})
     level = log_cfg.get("level", "INFO")
     fmt = log_cfg.get("format", "%(asctime)s - %(name)s - %(levelname)s - %(message)s")
     level_value = getattr(logging, level.upper(), logging.INFO)
+    _stop_listener()
 
     # Console (stdout)
     logging.basicConfig(
@@ -53,3 +84,10 @@ def setup_logging(cfg: Dict[str, Any] | None = None) -> None:
             root.addHandler(fh)
         except OSError as e:
             root.warning("Could not open log file %s: %s", path, e)
+
+    # Hand the console/file handlers to a listener thread; callers only enqueue the record
+    if log_cfg.get("queue", True):
+        _queue = queue.Queue(-1)
+        _listener = logging.handlers.QueueListener(_queue, *root.handlers, respect_handler_level=True)
+        root.handlers = [logging.handlers.QueueHandler(_queue)]
+        _listener.start()
@@ -6,10 +6,11 @@
 - config_space: Probabilistic configuration space and sampling
 - rewards: Multi-objective reward / fitness functions
 - strategy_optimizer: StrategyOptimizer (Thompson Sampling, candidate generation)
+- ucb_sampler: UCB1 candidate sampling over a binned config space
 - knowledge_base: Meta-learning (genealogy, regimes, successful configs)
 - continuous_learning: ContinuousLearningAgent and learning loop
 """
-from src.trader.ml.config_space import get_default_config_space, sample_config
+from src.trader.ml.config_space import get_default_config_space, sample_config, sample_configs
 from src.trader.ml.rewards import calculate_reward
 from src.trader.ml.strategy_optimizer import StrategyOptimizer
 from src.trader.ml.continuous_learning import (
@@ -26,6 +27,7 @@
     "calculate_reward",
     "get_default_config_space",
     "sample_config",
+    "sample_configs",
     "save_config",
     "load_config_from_path",
 ]
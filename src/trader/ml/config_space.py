@@ -5,13 +5,37 @@
 from __future__ import annotations
 
 import copy
-from typing import Any, Dict, Literal
+from typing import Any, Dict, Iterator, List, Literal, Tuple
 
 import numpy as np
 
 
 DistributionKind = Literal["uniform", "normal", "loguniform"]
 
+# Strategy params that are rounded to ints in [1, 500] after sampling
+INT_PARAMS = ("lookback_candles", "reversal_candles", "min_candles", "validity_candles", "swing_lookback")
+
+# Distribution codes of a compiled space (see _compile_space)
+_UNIFORM, _LOGUNIFORM, _NORMAL, _CHOICE, _DEFAULT = range(5)
+
+_IMMUTABLE = (str, int, float, bool, type(None))
+
+
+def clone_config(obj: Any) -> Any:
+    """
+    Deep copy of a JSON-like config (dicts, lists, tuples, scalars) without
+    deepcopy's memo/reduce machinery; other objects fall back to copy.deepcopy.
+    """
+    if isinstance(obj, _IMMUTABLE):
+        return obj
+    if isinstance(obj, dict):
+        return {k: clone_config(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [clone_config(v) for v in obj]
+    if isinstance(obj, tuple):
+        return tuple(clone_config(v) for v in obj)
+    return copy.deepcopy(obj)
+
 
 def get_default_config_space() -> Dict[str, Any]:
     """
@@ -76,19 +100,23 @@ def _sample_nested(
     space: Dict[str, Any],
     rng: np.random.Generator,
     base_cfg: Dict[str, Any] | None,
+    _cloned: bool = False,
 ) -> Dict[str, Any]:
-    """Recursively sample; leaves are distribution specs."""
-    out = {} if base_cfg is None else copy.deepcopy(base_cfg)
+    """
+    Recursively sample; leaves are distribution specs. base_cfg is cloned once at
+    the top; nested levels fill the already-cloned sub-dicts in place.
+    """
+    if base_cfg is None:
+        out = {}
+    else:
+        out = base_cfg if _cloned else clone_config(base_cfg)
     for k, v in space.items():
         if isinstance(v, dict):
             if "distribution" in v:
                 out[k] = _sample_one(v, rng)
             else:
-                out[k] = _sample_nested(
-                    v,
-                    rng,
-                    base_cfg.get(k) if isinstance(base_cfg, dict) else None,
-                )
+                sub = out.get(k) if base_cfg is not None else None
+                out[k] = _sample_nested(v, rng, sub if isinstance(sub, dict) else None, _cloned=True)
         else:
             out[k] = v
     return out
@@ -106,8 +134,12 @@ def sample_config(
     """
     rng = rng or np.random.default_rng()
     sampled = _sample_nested(config_space, rng, base_config)
+    _round_int_params(sampled)
+    return sampled
+
 
-    # Ensure numeric strategy params are valid (integers where expected)
+def _round_int_params(sampled: Dict[str, Any]) -> None:
+    """Ensure numeric strategy params are valid (integers where expected)."""
     strategy = sampled.get("strategy", {})
     for module_name, params in strategy.items():
         if module_name == "use_mss":
@@ -115,18 +147,127 @@ def sample_config(
         if not isinstance(params, dict):
             continue
         for key, val in params.items():
-            if key in ("lookback_candles", "reversal_candles", "min_candles", "validity_candles", "swing_lookback"):
+            if key in INT_PARAMS:
                 if isinstance(val, (int, float)):
                     strategy[module_name][key] = int(np.clip(round(val), 1, 500))
 
-    return sampled
+
+def _compile_space(space: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], Dict[str, np.ndarray]]:
+    """
+    Flatten the distribution leaves of a space (depth-first, dict order) into
+    parallel parameter arrays: code, lo, hi (log bounds for loguniform), mu,
+    sigma, clip_lo, clip_hi, n_choices. Returns (leaf specs, arrays).
+    """
+    specs: List[Dict[str, Any]] = []
+
+    def walk(node: Dict[str, Any]) -> None:
+        for v in node.values():
+            if isinstance(v, dict):
+                if "distribution" in v:
+                    specs.append(v)
+                else:
+                    walk(v)
+
+    walk(space)
+    k = len(specs)
+    arrays = {
+        "code": np.full(k, _DEFAULT, dtype=np.int8),
+        "lo": np.zeros(k),
+        "hi": np.zeros(k),
+        "mu": np.zeros(k),
+        "sigma": np.zeros(k),
+        "clip_lo": np.full(k, -np.inf),
+        "clip_hi": np.full(k, np.inf),
+        "n_choices": np.ones(k, dtype=np.int64),
+    }
+    for i, spec in enumerate(specs):
+        dist = spec.get("distribution", "uniform")
+        if dist == "uniform":
+            arrays["code"][i] = _UNIFORM
+            arrays["lo"][i], arrays["hi"][i] = spec["min"], spec["max"]
+        elif dist == "loguniform":
+            arrays["code"][i] = _LOGUNIFORM
+            arrays["lo"][i], arrays["hi"][i] = np.log(spec["min"]), np.log(spec["max"])
+        elif dist == "normal":
+            arrays["code"][i] = _NORMAL
+            arrays["mu"][i], arrays["sigma"][i] = spec["mu"], spec["sigma"]
+            arrays["clip_lo"][i] = spec.get("min", -np.inf)
+            arrays["clip_hi"][i] = spec.get("max", np.inf)
+        elif dist == "choice":
+            arrays["code"][i] = _CHOICE
+            arrays["n_choices"][i] = len(spec["choices"])
+    return specs, arrays
+
+
+def _fill_nested(
+    space: Dict[str, Any],
+    values: Iterator[Any],
+    base_cfg: Dict[str, Any] | None,
+    _cloned: bool = False,
+) -> Dict[str, Any]:
+    """Rebuild the nested config of _sample_nested, taking leaf values from values in walk order."""
+    if base_cfg is None:
+        out = {}
+    else:
+        out = base_cfg if _cloned else clone_config(base_cfg)
+    for k, v in space.items():
+        if isinstance(v, dict):
+            if "distribution" in v:
+                out[k] = next(values)
+            else:
+                sub = out.get(k) if base_cfg is not None else None
+                out[k] = _fill_nested(v, values, sub if isinstance(sub, dict) else None, _cloned=True)
+        else:
+            out[k] = v
+    return out
+
+
+def sample_configs(
+    config_space: Dict[str, Any],
+    n: int,
+    base_config: Dict[str, Any] | None = None,
+    rng: np.random.Generator | None = None,
+) -> List[Dict[str, Any]]:
+    """
+    Sample n configurations at once: the space is compiled to parameter arrays
+    and all leaves are drawn with two (n, K) RNG calls, instead of one scalar
+    draw per leaf per config. Same distributions and post-processing as
+    sample_config, but a different random stream for a given seed.
+    """
+    rng = rng or np.random.default_rng()
+    specs, a = _compile_space(config_space)
+    u = rng.random((n, len(specs)))
+    z = rng.standard_normal((n, len(specs)))
+    code = a["code"]
+
+    draws = a["lo"] + u * (a["hi"] - a["lo"])
+    draws = np.where(code == _LOGUNIFORM, np.exp(draws), draws)
+    draws = np.where(code == _NORMAL, np.clip(a["mu"] + a["sigma"] * z, a["clip_lo"], a["clip_hi"]), draws)
+    choice_idx = np.minimum((u * a["n_choices"]).astype(np.int64), a["n_choices"] - 1)
+
+    columns: List[List[Any]] = []
+    for i, spec in enumerate(specs):
+        if code[i] == _CHOICE:
+            choices = spec["choices"]
+            columns.append([choices[j] for j in choice_idx[:, i].tolist()])
+        elif code[i] == _DEFAULT:
+            columns.append([spec.get("default", 0.0)] * n)
+        else:
+            columns.append(draws[:, i].tolist())
+
+    configs = []
+    for row in range(n):
+        sampled = _fill_nested(config_space, (col[row] for col in columns), base_config)
+        _round_int_params(sampled)
+        configs.append(sampled)
+    return configs
 
 
 def config_to_backtest_cfg(sampled: Dict[str, Any], base: Dict[str, Any]) -> Dict[str, Any]:
     """
     Merge sampled config into a full backtest config (symbol, data, backtest, strategy).
     """
-    merged = copy.deepcopy(base)
+    merged = clone_config(base)
     if "backtest" in sampled:
         merged.setdefault("backtest", {}).update(sampled["backtest"])
     if "strategy" in sampled:
@@ -4,9 +4,9 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from src.trader.ml.config_space import config_to_backtest_cfg, get_default_config_space
+from src.trader.ml.config_space import clone_config, config_to_backtest_cfg, get_default_config_space
 from src.trader.ml.knowledge_base import StrategyKnowledgeBase
 from src.trader.ml.strategy_optimizer import StrategyOptimizer
 
@@ -62,6 +62,7 @@ def fetch_latest_data(self) -> bool:
             timeframe=self.timeframe,
             base_path=self.base_path,
             period_days=self.period_days,
+            load=False,
         )
         df = load_parquet(self.base_path, self.symbol, self.timeframe, start=start, end=end)
         return not df.empty and len(df) >= 50
@@ -82,8 +83,11 @@ def __init__(
         knowledge_base: StrategyKnowledgeBase | None = None,
         best_config_path: str | Path = "reports/latest/best_ml_config.json",
         candidates_per_cycle: int = 5,
+        max_workers: int = 1,
     ):
         self.base_config = base_config or {}
+        # (config_sources_key, loaded YAML config): re-parsed only when a file or env override changes
+        self._loaded_config: Optional[Tuple[Tuple, Dict[str, Any]]] = None
         self.config_space = config_space or get_default_config_space()
         self.data_collector = data_collector or MarketDataCollector()
         self.strategy_optimizer = strategy_optimizer or StrategyOptimizer(
@@ -93,12 +97,17 @@ def __init__(
         self.knowledge_base = knowledge_base or StrategyKnowledgeBase()
         self.best_config_path = Path(best_config_path)
         self.candidates_per_cycle = candidates_per_cycle
+        # > 1: generate the cycle's candidates up front and backtest them in parallel
+        self.max_workers = max_workers
 
     def _full_base_config(self) -> Dict[str, Any]:
         """Base config including symbol, data, backtest defaults."""
-        from src.trader.config import load_config
+        from src.trader.config import config_sources_key, load_config
 
-        cfg = load_config()
+        key = config_sources_key()
+        if self._loaded_config is None or self._loaded_config[0] != key:
+            self._loaded_config = (key, load_config())
+        cfg = clone_config(self._loaded_config[1])
         cfg.update(self.base_config)
         return cfg
 
@@ -120,18 +129,21 @@ def run_learning_cycle(self) -> Dict[str, Any]:
             return {"error": "no_data", "best_reward": None, "n_evaluated": 0}
 
         # Generate and test candidates
-        rewards: List[float] = []
-        for _ in range(self.candidates_per_cycle):
-            config = self.strategy_optimizer.generate_candidate_config()
-            reward = self.strategy_optimizer.evaluate_config(config)
-            self.strategy_optimizer.update_strategy(config, reward)
-            last = self.strategy_optimizer.historical_performance[-1]
-            self.knowledge_base.record_evaluation(
-                config=config,
-                reward=reward,
-                metrics=last["metrics"],
-            )
-            rewards.append(reward)
+        if self.max_workers > 1:
+            rewards = self._evaluate_parallel()
+        else:
+            rewards = []
+            for _ in range(self.candidates_per_cycle):
+                config = self.strategy_optimizer.generate_candidate_config()
+                reward = self.strategy_optimizer.evaluate_config(config)
+                self.strategy_optimizer.update_strategy(config, reward)
+                last = self.strategy_optimizer.historical_performance[-1]
+                self.knowledge_base.record_evaluation(
+                    config=config,
+                    reward=reward,
+                    metrics=last["metrics"],
+                )
+                rewards.append(reward)
 
         # Persist best config
         best = self.strategy_optimizer.get_best_config()
@@ -144,3 +156,21 @@ def run_learning_cycle(self) -> Dict[str, Any]:
             "rewards": rewards,
             "best_config_path": str(self.best_config_path),
         }
+
+    def _evaluate_parallel(self) -> List[float]:
+        """
+        Backtest the whole cycle's candidates in a process pool; optimizer and
+        knowledge-base updates stay in this process, in candidate order.
+        Candidates are all drawn before any update, so exploitation within a
+        cycle uses the previous cycle's best.
+        """
+        opt = self.strategy_optimizer
+        configs = [opt.generate_candidate_config() for _ in range(self.candidates_per_cycle)]
+        if not configs:
+            return []
+        rewards = opt.evaluate_configs(configs, max_workers=self.max_workers)
+        history = opt.historical_performance[-len(configs):]
+        for config, reward, entry in zip(configs, rewards, history):
+            opt.update_strategy(config, reward)
+            self.knowledge_base.record_evaluation(config=config, reward=reward, metrics=entry["metrics"])
+        return rewards
@@ -1,53 +1,105 @@
 """
 Liquidity-related features: sweep proximity, liquidity zones, volume context.
 """
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import numpy as np
 import pandas as pd
 
+from src.trader.indicators.atr import wilder_smooth
+from src.trader.ml.features.rolling import RollingCache, cached_rolling, rolling_max, rolling_min
 
-def add_liquidity_features(
-    df: pd.DataFrame,
+
+def _ffill_bfill(values: np.ndarray) -> np.ndarray:
+    """Series.ffill().bfill() on a 1-D float array (all-NaN input is returned as is)."""
+    valid = ~np.isnan(values)
+    if valid.all() or not valid.any():
+        return values
+    idx = np.where(valid, np.arange(len(values)), 0)
+    np.maximum.accumulate(idx, out=idx)
+    filled = values[idx]
+    first = int(np.argmax(valid))
+    filled[:first] = values[first]
+    return filled
+
+
+def _shift1(values: np.ndarray) -> np.ndarray:
+    out = np.empty_like(values, dtype=np.float64)
+    out[:1] = np.nan
+    out[1:] = values[:-1]
+    return out
+
+
+def liquidity_feature_arrays(
+    high: pd.Series,
+    low: pd.Series,
+    close: pd.Series,
+    volume: Optional[pd.Series],
     config: Dict[str, Any] | None = None,
-) -> pd.DataFrame:
+    rolling_cache: Optional[RollingCache] = None,
+) -> Dict[str, np.ndarray]:
     """
-    Add liquidity indicators:
-    - feat_dist_to_swing_high/low: distance to nearest swing (normalized by ATR)
-    - feat_sweep_zone: 1 if price is near a recent swing (liquidity zone)
-    - feat_volume_ma_ratio: volume relative to moving average (if volume present)
+    Column arrays of add_liquidity_features (same names, same order).
+    rolling_cache: shared window results, reused by market_structure when the lookbacks match.
     """
     cfg = config or {}
     lookback = cfg.get("lookback", 20)
     atr_period = cfg.get("atr_period", 14)
-    out = df.copy()
+    h = high.to_numpy(dtype=np.float64)
+    lo = low.to_numpy(dtype=np.float64)
+    prev_close = _shift1(close.to_numpy(dtype=np.float64))
 
-    # ATR for normalization
-    tr = np.maximum(
-        out["high"] - out["low"],
-        np.maximum(
-            (out["high"] - out["close"].shift(1)).abs(),
-            (out["low"] - out["close"].shift(1)).abs(),
-        ),
-    )
-    atr = tr.ewm(alpha=1 / atr_period, adjust=False).mean()
-    atr = atr.replace(0, np.nan).ffill().bfill()
+    # ATR for normalization (np.maximum keeps the NaN of the first bar, like before)
+    tr = np.maximum(h - lo, np.maximum(np.abs(h - prev_close), np.abs(lo - prev_close)))
+    atr = wilder_smooth(tr, atr_period)
+    atr[atr == 0] = np.nan
+    atr = _ffill_bfill(atr)
 
-    swing_high = out["high"].rolling(lookback, min_periods=1).max().shift(1)
-    swing_low = out["low"].rolling(lookback, min_periods=1).min().shift(1)
+    swing_high = _shift1(cached_rolling(rolling_cache, "high", rolling_max, h, lookback))
+    swing_low = _shift1(cached_rolling(rolling_cache, "low", rolling_min, lo, lookback))
 
-    out["feat_dist_to_swing_high"] = ((swing_high - out["high"]) / atr).fillna(0)
-    out["feat_dist_to_swing_low"] = ((out["low"] - swing_low) / atr).fillna(0)
+    feats: Dict[str, np.ndarray] = {}
+    with np.errstate(invalid="ignore", divide="ignore"):
+        dist_high = (swing_high - h) / atr
+        dist_low = (lo - swing_low) / atr
+    dist_high[np.isnan(dist_high)] = 0
+    dist_low[np.isnan(dist_low)] = 0
+    feats["feat_dist_to_swing_high"] = dist_high
+    feats["feat_dist_to_swing_low"] = dist_low
 
     # Within N ATR of swing = liquidity zone
     thresh = cfg.get("sweep_threshold_atr", 0.5)
-    out["feat_sweep_zone_high"] = (out["feat_dist_to_swing_high"].abs() <= thresh).astype(np.float64)
-    out["feat_sweep_zone_low"] = (out["feat_dist_to_swing_low"].abs() <= thresh).astype(np.float64)
+    feats["feat_sweep_zone_high"] = (np.abs(dist_high) <= thresh).astype(np.float64)
+    feats["feat_sweep_zone_low"] = (np.abs(dist_low) <= thresh).astype(np.float64)
 
-    if "volume" in out.columns and out["volume"].gt(0).any():
-        vol_ma = out["volume"].rolling(20, min_periods=1).mean()
-        out["feat_volume_ma_ratio"] = (out["volume"] / vol_ma.replace(0, np.nan)).fillna(1.0)
+    if volume is not None and volume.gt(0).any():
+        vol = volume.to_numpy(dtype=np.float64)
+        vol_ma = volume.rolling(20, min_periods=1).mean().to_numpy(dtype=np.float64, copy=True)
+        vol_ma[vol_ma == 0] = np.nan
+        with np.errstate(invalid="ignore", divide="ignore"):
+            ratio = vol / vol_ma
+        ratio[np.isnan(ratio)] = 1.0
+        feats["feat_volume_ma_ratio"] = ratio
     else:
-        out["feat_volume_ma_ratio"] = 1.0
+        feats["feat_volume_ma_ratio"] = np.ones(len(h))
+    return feats
+
 
+def add_liquidity_features(
+    df: pd.DataFrame,
+    config: Dict[str, Any] | None = None,
+    *,
+    inplace: bool = False,
+) -> pd.DataFrame:
+    """
+    Add liquidity indicators:
+    - feat_dist_to_swing_high/low: distance to nearest swing (normalized by ATR)
+    - feat_sweep_zone: 1 if price is near a recent swing (liquidity zone)
+    - feat_volume_ma_ratio: volume relative to moving average (if volume present)
+    inplace=True writes the columns into df itself (no copy) and returns it.
+    """
+    out = df if inplace else df.copy()
+    volume = out["volume"] if "volume" in out.columns else None
+    for name, values in liquidity_feature_arrays(out["high"], out["low"], out["close"], volume, config).items():
+        out[name] = values
     return out
@@ -1,47 +1,77 @@
 """
 Market structure features: swing structure, break of structure, trend context.
 """
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import numpy as np
 import pandas as pd
 
 from src.trader.indicators.swings import swing_highs, swing_lows
+from src.trader.ml.features.rolling import RollingCache, cached_rolling, rolling_max, rolling_min
 
 
-def add_market_structure_features(
-    df: pd.DataFrame,
+def market_structure_feature_arrays(
+    high: pd.Series,
+    low: pd.Series,
     config: Dict[str, Any] | None = None,
-) -> pd.DataFrame:
+    rolling_cache: Optional[RollingCache] = None,
+) -> Dict[str, np.ndarray]:
     """
-    Add market structure features:
-    - feat_swing_high / feat_swing_low (last swing levels)
-    - feat_hh_hl: higher high / higher low sequence (1) or not (0)
-    - feat_bos_bull / feat_bos_bear: break of structure (swing broken)
-    - feat_trend_strength: simple trend strength from swing sequence
+    Column arrays of add_market_structure_features (same names, same order).
+    rolling_cache: shared window results, reused by liquidity when the lookbacks match.
     """
     cfg = config or {}
     lookback = cfg.get("swing_lookback", 5)
-    out = df.copy()
+    h = high.to_numpy(dtype=np.float64)
+    lo = low.to_numpy(dtype=np.float64)
 
-    sh = swing_highs(out["high"], lookback=lookback)
-    sl = swing_lows(out["low"], lookback=lookback)
-    out["feat_swing_high"] = sh
-    out["feat_swing_low"] = sl
+    sh = swing_highs(high, lookback=lookback)
+    sl = swing_lows(low, lookback=lookback)
+    feats: Dict[str, np.ndarray] = {
+        "feat_swing_high": sh.to_numpy(),
+        "feat_swing_low": sl.to_numpy(),
+    }
 
     # Forward-fill last known swing levels
-    out["feat_last_swing_high"] = sh.ffill()
-    out["feat_last_swing_low"] = sl.ffill()
+    last_sh = sh.ffill().to_numpy()
+    last_sl = sl.ffill().to_numpy()
+    feats["feat_last_swing_high"] = last_sh
+    feats["feat_last_swing_low"] = last_sl
 
-    # Break of structure: price breaks last swing high (bull) or low (bear)
-    out["feat_bos_bull"] = (out["high"] > out["feat_last_swing_high"].shift(1)).fillna(False)
-    out["feat_bos_bear"] = (out["low"] < out["feat_last_swing_low"].shift(1)).fillna(False)
+    # Break of structure: price breaks last swing high (bull) or low (bear); NaN compares False
+    prev_sh = np.empty_like(last_sh)
+    prev_sh[:1] = np.nan
+    prev_sh[1:] = last_sh[:-1]
+    prev_sl = np.empty_like(last_sl)
+    prev_sl[:1] = np.nan
+    prev_sl[1:] = last_sl[:-1]
+    feats["feat_bos_bull"] = h > prev_sh
+    feats["feat_bos_bear"] = lo < prev_sl
 
     # Simple trend: count of recent higher highs (1) vs lower highs (-1) over small window
-    roll_high = out["high"].rolling(5, min_periods=1).max()
-    out["feat_hh"] = (out["high"] >= roll_high).astype(np.float64)
-    roll_low = out["low"].rolling(5, min_periods=1).min()
-    out["feat_hl"] = (out["low"] <= roll_low).astype(np.float64)
-    out["feat_trend_strength"] = (out["feat_hh"].rolling(10).mean() - out["feat_hl"].rolling(10).mean()).fillna(0)
+    hh = pd.Series(h >= cached_rolling(rolling_cache, "high", rolling_max, h, 5), dtype=np.float64)
+    hl = pd.Series(lo <= cached_rolling(rolling_cache, "low", rolling_min, lo, 5), dtype=np.float64)
+    feats["feat_hh"] = hh.to_numpy()
+    feats["feat_hl"] = hl.to_numpy()
+    feats["feat_trend_strength"] = (hh.rolling(10).mean() - hl.rolling(10).mean()).fillna(0).to_numpy()
+    return feats
 
+
+def add_market_structure_features(
+    df: pd.DataFrame,
+    config: Dict[str, Any] | None = None,
+    *,
+    inplace: bool = False,
+) -> pd.DataFrame:
+    """
+    Add market structure features:
+    - feat_swing_high / feat_swing_low (last swing levels)
+    - feat_hh_hl: higher high / higher low sequence (1) or not (0)
+    - feat_bos_bull / feat_bos_bear: break of structure (swing broken)
+    - feat_trend_strength: simple trend strength from swing sequence
+    inplace=True writes the columns into df itself (no copy) and returns it.
+    """
+    out = df if inplace else df.copy()
+    for name, values in market_structure_feature_arrays(out["high"], out["low"], config).items():
+        out[name] = values
     return out
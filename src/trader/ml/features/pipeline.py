@@ -1,36 +1,149 @@
 """
 Feature extraction pipeline: runs all feature modules in order.
 """
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
 from typing import Any, Dict
 
+import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 
-from src.trader.ml.features.market_structure import add_market_structure_features
-from src.trader.ml.features.liquidity import add_liquidity_features
-from src.trader.ml.features.technical import add_technical_features
-from src.trader.ml.features.statistical import add_statistical_features
+from src.trader.ml.features.market_structure import (
+    add_market_structure_features,
+    market_structure_feature_arrays,
+)
+from src.trader.ml.features.liquidity import add_liquidity_features, liquidity_feature_arrays
+from src.trader.ml.features.technical import add_technical_features, technical_feature_arrays
+from src.trader.ml.features.statistical import add_statistical_features, statistical_feature_arrays
+from src.trader.ml.features.rolling import RollingCache
+
+logger = logging.getLogger(__name__)
+
+ROOT = Path(__file__).resolve().parents[4]
+
+# Bump when a feature module changes its output, to invalidate feature cache files
+FEATURE_CACHE_VERSION = 1
+FEATURE_CACHE_DIR = ROOT / "data" / "feature_cache"
 
 
 class FeatureExtractionPipeline:
     """
     Robust feature extraction pipeline:
     market structure -> liquidity -> technical -> statistical.
+
+    fused=True (default) computes every module's feature arrays from the same
+    OHLCV columns and builds the output frame once; fused=False chains the
+    add_*_features functions (one frame copy per module). Both give the same frame.
+
+    float32=True stores the float feat_* columns as float32 (half the memory for
+    model training); features are still computed in float64.
+
+    cache_dir (e.g. FEATURE_CACHE_DIR) keeps the feature columns of each input in
+    a zstd Parquet file keyed by the config and the OHLC data, so fitting the same
+    data again (another run, another candidate) reads them instead of recomputing.
     """
 
-    def __init__(self, config: Dict[str, Any] | None = None):
+    def __init__(
+        self,
+        config: Dict[str, Any] | None = None,
+        fused: bool = True,
+        float32: bool = False,
+        cache_dir: str | Path | None = None,
+    ):
         self.config = config or {}
+        self.fused = fused
+        self.float32 = float32
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
         self._feature_columns: list[str] | None = None
 
     def fit_transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """Compute all features; store feature column names for later."""
-        out = df.copy()
-        out = add_market_structure_features(out, self.config.get("market_structure", {}))
-        out = add_liquidity_features(out, self.config.get("liquidity", {}))
-        out = add_technical_features(out, self.config.get("technical", {}))
-        out = add_statistical_features(out, self.config.get("statistical", {}))
+        if self.cache_dir is None:
+            return self._compute(df)
+        path = self.cache_dir / f"{self._cache_key(df)}.parquet"
+        if path.exists():
+            try:
+                cached = pq.read_table(path, memory_map=True).to_pandas()
+            except Exception as e:
+                logger.warning("Feature cache read failed (%s): %s", path, e)
+            else:
+                feats = {c: cached[c].to_numpy() for c in cached.columns}
+                out = self._attach(df, feats)
+                self._feature_columns = [c for c in out.columns if c.startswith("feat_")]
+                return out
+        out = self._compute(df)
+        self._save_cache(path, out[self._feature_columns])
+        return out
+
+    def _cache_key(self, df: pd.DataFrame) -> str:
+        """sha1 of config, options, input columns, index range and OHLC values."""
+        h = hashlib.sha1()
+        h.update(json.dumps(
+            [FEATURE_CACHE_VERSION, self.config, self.float32, list(map(str, df.columns)),
+             str(df.index.min()) if len(df) else None, str(df.index.max()) if len(df) else None, len(df)],
+            sort_keys=True, default=str,
+        ).encode())
+        for col in ("open", "high", "low", "close", "volume"):
+            if col in df.columns:
+                h.update(np.ascontiguousarray(df[col].to_numpy(dtype=np.float64)).tobytes())
+        return h.hexdigest()
+
+    @staticmethod
+    def _save_cache(path: Path, feats: pd.DataFrame) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp")
+            feats.to_parquet(tmp, index=False, compression="zstd")
+            os.replace(tmp, path)  # readers never see a half-written file
+        except OSError as e:
+            logger.warning("Feature cache write failed (%s): %s", path, e)
+
+    def _compute(self, df: pd.DataFrame) -> pd.DataFrame:
+        if self.fused:
+            out = self._fused_features(df)
+        else:
+            # One copy of the input; the modules then write into it in place
+            out = df.copy()
+            add_market_structure_features(out, self.config.get("market_structure", {}), inplace=True)
+            add_liquidity_features(out, self.config.get("liquidity", {}), inplace=True)
+            add_technical_features(out, self.config.get("technical", {}), inplace=True)
+            add_statistical_features(out, self.config.get("statistical", {}), inplace=True)
+            if self.float32:
+                out = out.astype({c: np.float32 for c in out.columns
+                                  if c.startswith("feat_") and out[c].dtype == np.float64})
         self._feature_columns = [c for c in out.columns if c.startswith("feat_")]
         return out
 
+    def _fused_features(self, df: pd.DataFrame) -> pd.DataFrame:
+        high, low, close = df["high"], df["low"], df["close"]
+        volume = df["volume"] if "volume" in df.columns else None
+        feats: Dict[str, np.ndarray] = {}
+        # Rolling max/min of high/low computed once per window across modules
+        rolling_cache: RollingCache = {}
+        feats.update(market_structure_feature_arrays(
+            high, low, self.config.get("market_structure", {}), rolling_cache=rolling_cache))
+        feats.update(liquidity_feature_arrays(
+            high, low, close, volume, self.config.get("liquidity", {}), rolling_cache=rolling_cache))
+        feats.update(technical_feature_arrays(high, low, close, self.config.get("technical", {})))
+        feats.update(statistical_feature_arrays(close, self.config.get("statistical", {})))
+        if self.float32:
+            feats = {k: v.astype(np.float32) if v.dtype == np.float64 else v for k, v in feats.items()}
+        return self._attach(df, feats)
+
+    @staticmethod
+    def _attach(df: pd.DataFrame, feats: Dict[str, np.ndarray]) -> pd.DataFrame:
+        # New columns are appended in one concat; columns already in df are overwritten in place
+        existing = {k: v for k, v in feats.items() if k in df.columns}
+        added = pd.DataFrame({k: v for k, v in feats.items() if k not in df.columns}, index=df.index)
+        out = pd.concat([df, added], axis=1)
+        for name, values in existing.items():
+            out[name] = values
+        return out
+
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """Apply same feature steps (e.g. on new data)."""
         return self.fit_transform(df)
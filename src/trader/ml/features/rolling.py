@@ -0,0 +1,69 @@
+"""
+Rolling window reductions for the feature modules.
+
+Uses bottleneck's move_* kernels when installed (pip install bottleneck),
+otherwise pandas rolling. Only reductions where bottleneck gives the same
+values as pandas are routed through it (max/min/median); mean/std stay on
+pandas, whose compensated sums differ from bottleneck in the last bits.
+
+A RollingCache dict lets several feature modules share one window result
+for the same input column (see FeatureExtractionPipeline).
+"""
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    import bottleneck as bn
+except ImportError:  # optional speedup
+    bn = None
+
+
+# (column name, reduction name, window) -> result; results must not be mutated
+RollingCache = Dict[Tuple[str, str, int], np.ndarray]
+
+
+def _as_array(values) -> np.ndarray:
+    return values.to_numpy(dtype=np.float64) if isinstance(values, pd.Series) else np.asarray(values, dtype=np.float64)
+
+
+def rolling_max(values, window: int, min_periods: int = 1) -> np.ndarray:
+    """Series.rolling(window, min_periods).max() as a float64 array."""
+    arr = _as_array(values)
+    if bn is not None and 1 <= min_periods <= window <= len(arr):
+        return bn.move_max(arr, window, min_count=min_periods)
+    return pd.Series(arr).rolling(window, min_periods=min_periods).max().to_numpy(copy=True)
+
+
+def rolling_min(values, window: int, min_periods: int = 1) -> np.ndarray:
+    """Series.rolling(window, min_periods).min() as a float64 array."""
+    arr = _as_array(values)
+    if bn is not None and 1 <= min_periods <= window <= len(arr):
+        return bn.move_min(arr, window, min_count=min_periods)
+    return pd.Series(arr).rolling(window, min_periods=min_periods).min().to_numpy(copy=True)
+
+
+def rolling_median(values, window: int, min_periods: int = 1) -> np.ndarray:
+    """Series.rolling(window, min_periods).median() as a float64 array."""
+    arr = _as_array(values)
+    if bn is not None and 1 <= min_periods <= window <= len(arr):
+        return bn.move_median(arr, window, min_count=min_periods)
+    return pd.Series(arr).rolling(window, min_periods=min_periods).median().to_numpy(copy=True)
+
+
+def cached_rolling(
+    cache: Optional[RollingCache],
+    column: str,
+    reduce: Callable[..., np.ndarray],
+    values,
+    window: int,
+) -> np.ndarray:
+    """reduce(values, window), memoised in cache under (column, reduce name, window)."""
+    if cache is None:
+        return reduce(values, window)
+    key = (column, reduce.__name__, window)
+    out = cache.get(key)
+    if out is None:
+        out = cache[key] = reduce(values, window)
+    return out
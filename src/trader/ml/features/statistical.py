@@ -6,10 +6,49 @@
 import numpy as np
 import pandas as pd
 
+from src.trader.ml.features.rolling import rolling_median
+
+
+def statistical_feature_arrays(
+    close: pd.Series,
+    config: Dict[str, Any] | None = None,
+) -> Dict[str, np.ndarray]:
+    """Column arrays of add_statistical_features (same names, same order)."""
+    cfg = config or {}
+    roll = cfg.get("rolling", 20)
+    c = close.to_numpy(dtype=np.float64)
+
+    feats: Dict[str, np.ndarray] = {}
+    returns = np.empty(len(c))
+    returns[:1] = np.nan
+    with np.errstate(invalid="ignore", divide="ignore"):
+        returns[1:] = np.log(c[1:] / c[:-1])
+    returns[np.isnan(returns)] = 0
+    feats["feat_returns"] = returns
+    feats["feat_volatility"] = pd.Series(returns).rolling(roll, min_periods=2).std().fillna(0).to_numpy()
+
+    # One rolling window object for mean/std of close
+    window = pd.Series(c).rolling(roll, min_periods=2)
+    roll_mean = window.mean().to_numpy()
+    roll_std = window.std().to_numpy(copy=True)
+    roll_std[roll_std == 0] = np.nan
+    roll_median = rolling_median(c, roll, min_periods=2)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        zscore = (c - roll_mean) / roll_std
+        # Simplified skew: (mean - median) / std over rolling window
+        skew_like = (roll_mean - roll_median) / roll_std
+    zscore[np.isnan(zscore)] = 0
+    skew_like[np.isnan(skew_like)] = 0
+    feats["feat_zscore"] = zscore
+    feats["feat_skew_like"] = skew_like
+    return feats
+
 
 def add_statistical_features(
     df: pd.DataFrame,
     config: Dict[str, Any] | None = None,
+    *,
+    inplace: bool = False,
 ) -> pd.DataFrame:
     """
     Add statistical features:
@@ -17,19 +56,9 @@ def add_statistical_features(
     - feat_volatility: rolling std of returns
     - feat_zscore: z-score of close relative to rolling mean/std
     - feat_skew_like: rolling skewness of returns (simplified)
+    inplace=True writes the columns into df itself (no copy) and returns it.
     """
-    cfg = config or {}
-    roll = cfg.get("rolling", 20)
-    out = df.copy()
-
-    out["feat_returns"] = np.log(out["close"] / out["close"].shift(1)).fillna(0)
-    out["feat_volatility"] = out["feat_returns"].rolling(roll, min_periods=2).std().fillna(0)
-    roll_mean = out["close"].rolling(roll, min_periods=2).mean()
-    roll_std = out["close"].rolling(roll, min_periods=2).std().replace(0, np.nan)
-    out["feat_zscore"] = ((out["close"] - roll_mean) / roll_std).fillna(0)
-
-    # Simplified skew: (mean - median) / std over rolling window
-    roll_median = out["close"].rolling(roll, min_periods=2).median()
-    out["feat_skew_like"] = ((roll_mean - roll_median) / roll_std.replace(0, np.nan)).fillna(0)
-
+    out = df if inplace else df.copy()
+    for name, values in statistical_feature_arrays(out["close"], config).items():
+        out[name] = values
     return out
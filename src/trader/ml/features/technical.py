@@ -6,46 +6,76 @@
 import numpy as np
 import pandas as pd
 
-from src.trader.indicators.atr import atr
+from src.trader.indicators.atr import true_range, wilder_smooth
 from src.trader.indicators.ema import ema
 
 
-def add_technical_features(
-    df: pd.DataFrame,
+def technical_feature_arrays(
+    high: pd.Series,
+    low: pd.Series,
+    close: pd.Series,
     config: Dict[str, Any] | None = None,
-) -> pd.DataFrame:
-    """
-    Add technical features:
-    - feat_atr_pct: ATR as % of close (volatility)
-    - feat_ema_fast, feat_ema_slow: EMAs
-    - feat_price_above_ema: 1 if close > EMA
-    - feat_momentum: short-term return (e.g. 5-bar)
-    - feat_rsi_like: RSI-like oscillator [0,1] from gains/losses
-    """
+) -> Dict[str, np.ndarray]:
+    """Column arrays of add_technical_features (same names, same order)."""
     cfg = config or {}
     atr_period = cfg.get("atr_period", 14)
     ema_fast = cfg.get("ema_fast", 9)
     ema_slow = cfg.get("ema_slow", 21)
     momentum_bars = cfg.get("momentum_bars", 5)
     rsi_period = cfg.get("rsi_period", 14)
-    out = df.copy()
+    c = close.to_numpy(dtype=np.float64)
+
+    feats: Dict[str, np.ndarray] = {}
+    atr_arr = wilder_smooth(true_range(high, low, close), atr_period)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        atr_pct = atr_arr / c
+    atr_pct[np.isnan(atr_pct)] = 0
+    feats["feat_atr_pct"] = atr_pct
+    feats["feat_atr"] = atr_arr
 
-    atr_series = atr(out["high"], out["low"], out["close"], period=atr_period)
-    out["feat_atr_pct"] = (atr_series / out["close"]).fillna(0)
-    out["feat_atr"] = atr_series
+    fast = ema(close, ema_fast).to_numpy()
+    feats["feat_ema_fast"] = fast
+    feats["feat_ema_slow"] = ema(close, ema_slow).to_numpy()
+    feats["feat_price_above_ema"] = (c > fast).astype(np.float64)
 
-    out["feat_ema_fast"] = ema(out["close"], ema_fast)
-    out["feat_ema_slow"] = ema(out["close"], ema_slow)
-    out["feat_price_above_ema"] = (out["close"] > out["feat_ema_fast"]).astype(np.float64)
+    momentum = np.full(len(c), np.nan)
+    if momentum_bars < len(c):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            momentum[momentum_bars:] = c[momentum_bars:] / c[:len(c) - momentum_bars] - 1.0
+    momentum[np.isnan(momentum)] = 0
+    feats["feat_momentum"] = momentum
 
-    out["feat_momentum"] = (out["close"] / out["close"].shift(momentum_bars) - 1.0).fillna(0)
+    delta = np.empty(len(c))
+    delta[:1] = np.nan
+    delta[1:] = np.diff(c)
+    # One 2-D ewm pass for both Wilder averages; gain/loss come straight from delta
+    avg = pd.DataFrame(np.column_stack((np.where(delta > 0, delta, 0.0), np.where(delta < 0, -delta, 0.0))))
+    avg = avg.ewm(alpha=1 / rsi_period, adjust=False).mean().to_numpy()
+    avg_gain, avg_loss = avg[:, 0], avg[:, 1]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rsi_like = 1 - 1 / (1 + avg_gain / avg_loss)
+    # No average loss (or no data yet): neutral 0.5
+    rsi_like[(avg_loss == 0) | np.isnan(rsi_like)] = 0.5
+    feats["feat_rsi_like"] = rsi_like
+    return feats
 
-    delta = out["close"].diff()
-    gain = delta.where(delta > 0, 0.0)
-    loss = (-delta).where(delta < 0, 0.0)
-    avg_gain = gain.ewm(alpha=1 / rsi_period, adjust=False).mean()
-    avg_loss = loss.ewm(alpha=1 / rsi_period, adjust=False).mean()
-    rs = avg_gain / avg_loss.replace(0, np.nan)
-    out["feat_rsi_like"] = (1 - 1 / (1 + rs)).fillna(0.5)
 
+def add_technical_features(
+    df: pd.DataFrame,
+    config: Dict[str, Any] | None = None,
+    *,
+    inplace: bool = False,
+) -> pd.DataFrame:
+    """
+    Add technical features:
+    - feat_atr_pct: ATR as % of close (volatility)
+    - feat_ema_fast, feat_ema_slow: EMAs
+    - feat_price_above_ema: 1 if close > EMA
+    - feat_momentum: short-term return (e.g. 5-bar)
+    - feat_rsi_like: RSI-like oscillator [0,1] from gains/losses
+    inplace=True writes the columns into df itself (no copy) and returns it.
+    """
+    out = df if inplace else df.copy()
+    for name, values in technical_feature_arrays(out["high"], out["low"], out["close"], config).items():
+        out[name] = values
     return out
@@ -3,10 +3,15 @@
 """
 from __future__ import annotations
 
-import json
+import bisect
+import itertools
+import os
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+
+from src.trader.io.jsonio import dumps, loads
 from src.trader.ml.config_space import sample_config
 
 
@@ -20,12 +25,20 @@ def __init__(
         self,
         storage_path: Path | str | None = None,
         max_successful: int = 100,
+        session_prefix: Optional[str] = None,
     ):
         self.storage_path = Path(storage_path) if storage_path else None
         self.max_successful = max_successful
+        # Record ids are "<prefix><counter>": the random 48-bit per-instance prefix keeps
+        # ids from different sessions sharing one storage file apart (counters restart at 0)
+        self._session_prefix = os.urandom(6).hex() if session_prefix is None else session_prefix
+        self._counter = itertools.count()
         self.genealogy: List[Dict[str, Any]] = []
         self.successful_configs: List[Dict[str, Any]] = []
         self.regime_cache: Dict[str, List[Dict[str, Any]]] = {}
+        # Rewards of regime_cache[regime] as contiguous floats (capacity grows by doubling;
+        # only the first len(regime_cache[regime]) values are used)
+        self._regime_rewards: Dict[str, np.ndarray] = {}
 
     def record_evaluation(
         self,
@@ -39,9 +52,7 @@ def record_evaluation(
         Record a configuration evaluation with optional parent (genealogy) and regime.
         Returns an id for this record.
         """
-        import uuid
-
-        record_id = str(uuid.uuid4())[:8]
+        record_id = f"{self._session_prefix}{next(self._counter):08x}"
         entry = {
             "id": record_id,
             "config": config,
@@ -52,13 +63,26 @@ def record_evaluation(
         }
         self.genealogy.append(entry)
 
-        if reward > 0 and (not self.successful_configs or reward >= min(c["reward"] for c in self.successful_configs)):
-            self.successful_configs.append({"id": record_id, "config": config, "reward": reward, "metrics": metrics})
-            self.successful_configs.sort(key=lambda x: x["reward"], reverse=True)
-            self.successful_configs = self.successful_configs[: self.max_successful]
+        # successful_configs is kept sorted by reward (descending): the minimum is the last
+        # entry, and a new one is inserted after all entries with an equal or higher reward
+        top = self.successful_configs
+        if reward > 0 and (not top or reward >= top[-1]["reward"]):
+            pos = bisect.bisect_right(top, -reward, key=lambda c: -c["reward"])
+            if pos < self.max_successful:
+                top.insert(pos, {"id": record_id, "config": config, "reward": reward, "metrics": metrics})
+                del top[self.max_successful:]
 
         if regime:
-            self.regime_cache.setdefault(regime, []).append(entry)
+            entries = self.regime_cache.setdefault(regime, [])
+            entries.append(entry)
+            rewards = self._regime_rewards.get(regime)
+            n = len(entries)
+            if rewards is None or n > len(rewards):
+                grown = np.empty(max(16, 2 * n), dtype=np.float64)
+                if rewards is not None:
+                    grown[: len(rewards)] = rewards
+                rewards = self._regime_rewards[regime] = grown
+            rewards[n - 1] = reward
 
         return record_id
 
@@ -67,7 +91,7 @@ def get_best_for_regime(self, regime: str) -> Dict[str, Any] | None:
         entries = self.regime_cache.get(regime, [])
         if not entries:
             return None
-        best = max(entries, key=lambda x: x["reward"])
+        best = entries[int(np.argmax(self._regime_rewards[regime][: len(entries)]))]
         return best.get("config")
 
     def get_top_configs(self, n: int = 5) -> List[Dict[str, Any]]:
@@ -86,14 +110,12 @@ def save(self, path: Path | str | None = None) -> None:
             "successful_configs": self.successful_configs,
             "regimes": list(self.regime_cache.keys()),
         }
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, default=str)
+        path.write_bytes(dumps(data, indent=True))
 
     def load(self, path: Path | str | None = None) -> None:
         """Load from JSON (successful_configs and regime keys; genealogy not fully restored)."""
         path = path or self.storage_path
         if not path or not Path(path).exists():
             return
-        with open(path, encoding="utf-8") as f:
-            data = json.load(f)
+        data = loads(Path(path).read_bytes())
         self.successful_configs = data.get("successful_configs", [])
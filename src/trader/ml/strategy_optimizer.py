@@ -4,7 +4,8 @@
 """
 from __future__ import annotations
 
-import copy
+import pickle
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any, Callable, Dict, List, Optional
 
 import numpy as np
@@ -12,11 +13,14 @@
 from src.trader.backtest.engine import run_backtest
 from src.trader.backtest.metrics import compute_metrics
 from src.trader.ml.config_space import (
+    INT_PARAMS,
+    clone_config,
     config_to_backtest_cfg,
     get_default_config_space,
     sample_config,
 )
 from src.trader.ml.rewards import calculate_reward
+from src.trader.ml.ucb_sampler import UCBConfigSampler
 
 
 def _default_backtest_fn(cfg: Dict[str, Any]) -> list:
@@ -24,6 +28,11 @@ def _default_backtest_fn(cfg: Dict[str, Any]) -> list:
     return run_backtest(cfg)
 
 
+def _backtest_metrics(backtest_fn: Callable[[Dict[str, Any]], list], cfg: Dict[str, Any]) -> Dict[str, Any]:
+    """Worker: run one backtest and reduce its trades to metrics (small to send back)."""
+    return compute_metrics(backtest_fn(cfg))
+
+
 class StrategyOptimizer:
     """
     Uses intelligent sampling (Thompson Sampling style) over a probabilistic
@@ -37,6 +46,9 @@ def __init__(
         backtest_fn: Callable[[Dict[str, Any]], list] | None = None,
         reward_weights: Dict[str, float] | None = None,
         seed: int | None = None,
+        sampler: str = "epsilon_greedy",
+        ucb_bins: int = 5,
+        ucb_c: float = 1.0,
     ):
         self.config_space = config_space or get_default_config_space()
         self.base_config = base_config or {}
@@ -49,12 +61,30 @@ def __init__(
         # Thompson Sampling: maintain running mean reward per "arm" (we use continuous arms;
         # we approximate by keeping best-so-far and biasing toward it)
         self._best_sampled: Dict[str, Any] | None = None
+        # sampler="ucb1": per-parameter UCB1 over ucb_bins cells (fewer backtests to converge)
+        if sampler not in ("epsilon_greedy", "ucb1"):
+            raise ValueError(f"Unknown sampler: {sampler}")
+        self._ucb = UCBConfigSampler(self.config_space, n_bins=ucb_bins, c=ucb_c) if sampler == "ucb1" else None
+
+    def spawn_rngs(self, n: int) -> List[np.random.Generator]:
+        """
+        n independent child generators of self._rng, for sampling in parallel
+        workers: pass these instead of integer seeds (building a generator per
+        draw is far slower than reusing one). Deterministic for a seeded optimizer.
+        """
+        if hasattr(self._rng, "spawn"):  # NumPy >= 1.25
+            return self._rng.spawn(n)
+        seq = np.random.SeedSequence(int(self._rng.integers(2**63)))
+        return [np.random.default_rng(child) for child in seq.spawn(n)]
 
     def generate_candidate_config(self) -> Dict[str, Any]:
         """
         Generate a new configuration variation.
         With probability epsilon, sample uniformly; else bias toward best-so-far (exploitation).
+        With sampler="ucb1", take the best-UCB bin of every parameter instead.
         """
+        if self._ucb is not None:
+            return self._ucb.sample(self._rng)
         if self._best_sampled is not None and self._rng.uniform(0, 1) < 0.3:
             # Exploit: perturb around best
             candidate = self._perturb_config(self._best_sampled)
@@ -63,35 +93,27 @@ def generate_candidate_config(self) -> Dict[str, Any]:
         return candidate
 
     def _perturb_config(self, config: Dict[str, Any], scale: float = 0.2) -> Dict[str, Any]:
-        """Perturb numeric values in config for local search."""
-        out = copy.deepcopy(config)
+        """Perturb numeric values in config for local search (one RNG draw for all values)."""
+        out = clone_config(config)
         strategy = out.get("strategy", {})
-        for module_name, params in list(strategy.items()):
-            if module_name == "use_mss" or not isinstance(params, dict):
-                continue
-            for key, val in params.items():
-                if isinstance(val, (int, float)):
-                    delta = self._rng.uniform(-scale * abs(val) - 0.1, scale * abs(val) + 0.1)
-                    new_val = val + delta
-                    if key in (
-                        "lookback_candles",
-                        "reversal_candles",
-                        "min_candles",
-                        "validity_candles",
-                        "swing_lookback",
-                    ):
-                        new_val = int(np.clip(round(new_val), 1, 500))
-                    strategy[module_name][key] = new_val
+        leaves = [
+            (params, key, val)
+            for module_name, params in strategy.items()
+            if module_name != "use_mss" and isinstance(params, dict)
+            for key, val in params.items()
+            if isinstance(val, (int, float))
+        ]
         backtest = out.get("backtest", {})
-        for key in ("tp_r", "sl_r"):
-            if key in backtest and isinstance(backtest[key], (int, float)):
-                backtest[key] = float(
-                    np.clip(
-                        backtest[key] + self._rng.uniform(-0.2, 0.2),
-                        0.5,
-                        5.0,
-                    )
-                )
+        bt_keys = [k for k in ("tp_r", "sl_r") if k in backtest and isinstance(backtest[k], (int, float))]
+        # u in [-1, 1): u * w has the distribution of uniform(-w, w)
+        u = self._rng.uniform(-1.0, 1.0, size=len(leaves) + len(bt_keys))
+        for (params, key, val), ui in zip(leaves, u):
+            new_val = val + float(ui) * (scale * abs(val) + 0.1)
+            if key in INT_PARAMS:
+                new_val = int(np.clip(round(new_val), 1, 500))
+            params[key] = new_val
+        for key, ui in zip(bt_keys, u[len(leaves):]):
+            backtest[key] = float(np.clip(backtest[key] + float(ui) * 0.2, 0.5, 5.0))
         return out
 
     def evaluate_config(self, config: Dict[str, Any]) -> float:
@@ -103,23 +125,49 @@ def evaluate_config(self, config: Dict[str, Any]) -> float:
         metrics = compute_metrics(trades)
         reward = calculate_reward(metrics, self.reward_weights)
         self.historical_performance.append(
-            {"config": copy.deepcopy(config), "metrics": metrics, "reward": reward}
+            {"config": clone_config(config), "metrics": metrics, "reward": reward}
         )
         return reward
 
+    def evaluate_configs(self, configs: List[Dict[str, Any]], max_workers: int | None = None) -> List[float]:
+        """
+        Evaluate several configs, running the backtests in a process pool.
+        History entries and rewards are recorded in the order of configs, as
+        repeated evaluate_config calls would. Falls back to sequential
+        evaluation for one worker or a backtest_fn that cannot be pickled.
+        """
+        if max_workers == 1 or len(configs) < 2 or not _picklable(self.backtest_fn):
+            return [self.evaluate_config(c) for c in configs]
+        full_cfgs = [config_to_backtest_cfg(c, self.base_config) for c in configs]
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(_backtest_metrics, self.backtest_fn, cfg) for cfg in full_cfgs]
+            all_metrics = [f.result() for f in futures]
+        rewards: List[float] = []
+        for config, metrics in zip(configs, all_metrics):
+            reward = calculate_reward(metrics, self.reward_weights)
+            self.historical_performance.append(
+                {"config": clone_config(config), "metrics": metrics, "reward": reward}
+            )
+            rewards.append(reward)
+        return rewards
+
     def update_strategy(self, config: Dict[str, Any], reward: float) -> None:
         """
         Update strategy based on performance (Thompson Sampling style:
         keep best config for exploitation).
         """
+        if self._ucb is not None:
+            self._ucb.update(config, reward)
         if reward > self.best_reward:
             self.best_reward = reward
-            self.best_config = copy.deepcopy(config)
-            self._best_sampled = copy.deepcopy(config)
+            # One snapshot serves both: neither is mutated in place (_perturb_config and
+            # get_best_config clone before handing anything out)
+            self.best_config = clone_config(config)
+            self._best_sampled = self.best_config
 
     def get_best_config(self) -> Dict[str, Any] | None:
         """Return best configuration found so far."""
-        return copy.deepcopy(self.best_config) if self.best_config else None
+        return clone_config(self.best_config) if self.best_config else None
 
     def run_optimization_step(self) -> float:
         """
@@ -137,3 +185,11 @@ def run_n_steps(self, n: int) -> List[float]:
             r = self.run_optimization_step()
             rewards.append(r)
         return rewards
+
+
+def _picklable(obj: Any) -> bool:
+    try:
+        pickle.dumps(obj)
+    except Exception:
+        return False
+    return True
@@ -0,0 +1,121 @@
+"""
+UCB1 candidate sampling over a discretized config space.
+
+Every distribution leaf of the space is split into bins (uniform/loguniform
+ranges into n_bins equal cells, normal leaves over mu +/- 3 sigma within their
+clip bounds, choice leaves into one bin per choice). Each bin keeps its pull
+count and reward sum; a candidate takes, per parameter, the bin with the
+highest mean + c * sqrt(2 ln(total) / n) (unpulled bins first) and a uniform
+value inside that cell, so continuous search only refines the winning cells.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, List
+
+import numpy as np
+
+from src.trader.ml.config_space import (
+    _CHOICE,
+    _DEFAULT,
+    _LOGUNIFORM,
+    _NORMAL,
+    _compile_space,
+    _fill_nested,
+    _round_int_params,
+)
+
+
+def _leaf_values(space: Dict[str, Any], cfg: Any) -> Iterator[Any]:
+    """Values of cfg at the distribution leaves of space, in _compile_space order (None if missing)."""
+    for k, v in space.items():
+        if isinstance(v, dict):
+            sub = cfg.get(k) if isinstance(cfg, dict) else None
+            if "distribution" in v:
+                yield sub
+            else:
+                yield from _leaf_values(v, sub)
+
+
+class UCBConfigSampler:
+    """Per-parameter UCB1 bandit over binned config values (see module docstring)."""
+
+    def __init__(self, config_space: Dict[str, Any], n_bins: int = 5, c: float = 1.0):
+        self.config_space = config_space
+        self.n_bins = n_bins
+        self.c = c
+        self._specs, a = _compile_space(config_space)
+        code = a["code"]
+        lo, hi = a["lo"].copy(), a["hi"].copy()
+        normal = code == _NORMAL
+        lo[normal] = np.maximum(a["clip_lo"][normal], a["mu"][normal] - 3 * a["sigma"][normal])
+        hi[normal] = np.minimum(a["clip_hi"][normal], a["mu"][normal] + 3 * a["sigma"][normal])
+        self._code = code
+        self._lo = lo
+        self._n = np.where(code == _CHOICE, a["n_choices"], np.where(code == _DEFAULT, 1, n_bins))
+        self._width = (hi - lo) / self._n
+        k_max = int(self._n.max()) if len(self._n) else 1
+        self.pulls = np.zeros((len(self._specs), k_max))
+        self.reward_sums = np.zeros((len(self._specs), k_max))
+        self.total_pulls = 0
+        # Bins beyond a leaf's own bin count never win
+        self._invalid = np.arange(k_max)[None, :] >= self._n[:, None]
+
+    def scores(self) -> np.ndarray:
+        """UCB1 score per (parameter, bin): +inf for unpulled bins, -inf for padding."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = self.reward_sums / self.pulls
+            bonus = self.c * np.sqrt(2.0 * np.log(max(self.total_pulls, 1)) / self.pulls)
+        score = np.where(self.pulls > 0, mean + bonus, np.inf)
+        score[self._invalid] = -np.inf
+        return score
+
+    def sample(self, rng: np.random.Generator, base_config: Dict[str, Any] | None = None) -> Dict[str, Any]:
+        """Candidate config from the current best-UCB bin of every parameter (random tie-break)."""
+        score = self.scores()
+        ties = score == score.max(axis=1, keepdims=True)
+        bins = np.argmax(np.where(ties, rng.random(score.shape), -1.0), axis=1)
+        t = self._lo + (bins + rng.random(len(bins))) * self._width
+        t = np.where(self._code == _LOGUNIFORM, np.exp(t), t)
+
+        values: List[Any] = []
+        for i, spec in enumerate(self._specs):
+            if self._code[i] == _CHOICE:
+                values.append(spec["choices"][bins[i]])
+            elif self._code[i] == _DEFAULT:
+                values.append(spec.get("default", 0.0))
+            else:
+                values.append(float(t[i]))
+        sampled = _fill_nested(self.config_space, iter(values), base_config)
+        _round_int_params(sampled)
+        return sampled
+
+    def bins_of(self, config: Dict[str, Any]) -> np.ndarray:
+        """Bin index of each parameter value in config (-1 where missing or not in the space)."""
+        bins = np.full(len(self._specs), -1, dtype=np.int64)
+        for i, value in enumerate(_leaf_values(self.config_space, config)):
+            code = self._code[i]
+            if code == _CHOICE:
+                choices = self._specs[i]["choices"]
+                if value in choices:
+                    bins[i] = choices.index(value)
+            elif code == _DEFAULT:
+                bins[i] = 0
+            elif isinstance(value, (int, float)):
+                if code == _LOGUNIFORM:
+                    if value <= 0:
+                        continue
+                    value = np.log(value)
+                width = self._width[i]
+                pos = (value - self._lo[i]) / width if width > 0 else 0.0
+                bins[i] = int(np.clip(np.floor(pos), 0, self._n[i] - 1))
+        return bins
+
+    def update(self, config: Dict[str, Any], reward: float) -> None:
+        """Credit reward to the bin of every parameter of config (non-finite rewards are skipped)."""
+        if not np.isfinite(reward):
+            return
+        bins = self.bins_of(config)
+        rows = np.flatnonzero(bins >= 0)
+        self.pulls[rows, bins[rows]] += 1
+        self.reward_sums[rows, bins[rows]] += reward
+        self.total_pulls += 1
@@ -6,7 +6,13 @@
   2. Liquidity/levels – are we at a level / did we sweep liquidity?
   3. Entry timing     – trigger: when do we actually enter?
 """
-from typing import Dict, Any, List
+import json
+import weakref
+import zlib
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
+import numpy as np
 import pandas as pd
 
 from src.trader.strategy_modules.ict.liquidity_sweep import LiquiditySweepModule
@@ -25,6 +31,20 @@
     "structure_context": {"lookback": 30, "pivot_bars": 2},
 }
 
+# The ICT modules are stateless: one shared instance each
+_SWEEP = LiquiditySweepModule()
+_DISPLACEMENT = DisplacementModule()
+_FVG = FairValueGapModule()
+_MSS = MarketStructureShiftModule()
+
+# Module outputs of the last few (data, module config) pairs, so the LONG and SHORT
+# calls on the same frame compute the ICT columns once. Entries hold a weak reference
+# to the input frame (an entry is dropped when its frame is collected, so its id is
+# never reused while cached) plus a signature of its index and OHLC contents.
+FEATURE_CACHE_SIZE = 4
+_feature_cache: "OrderedDict[Tuple[int, str], Tuple[weakref.ref, Tuple, pd.DataFrame]]" = OrderedDict()
+_OHLC = ("open", "high", "low", "close")
+
 
 def get_sqe_default_config() -> Dict[str, Any]:
     """Default config: 3 pillars + module params. Pillars define what feeds each bucket."""
@@ -51,41 +71,103 @@ def get_sqe_default_config() -> Dict[str, Any]:
     }
 
 
-def _get_signal_series(df: pd.DataFrame, module: str, direction: str) -> pd.Series:
-    """Map module name to boolean series for the given direction."""
-    if direction == "LONG":
-        key = {
-            "liquidity_sweep": "bullish_sweep",
-            "displacement": "bullish_disp",
-            "fair_value_gaps": "in_bullish_fvg",
-            "market_structure_shift": "bullish_mss",
-        }.get(module)
-    else:
-        key = {
-            "liquidity_sweep": "bearish_sweep",
-            "displacement": "bearish_disp",
-            "fair_value_gaps": "in_bearish_fvg",
-            "market_structure_shift": "bearish_mss",
-        }.get(module)
+# Built once for run_sqe_conditions' fallbacks; read only (get_sqe_default_config() returns a fresh dict)
+_DEFAULT_SQE_CFG = get_sqe_default_config()
+
+
+# Module name -> signal column, per direction
+_LONG_KEYS = {
+    "liquidity_sweep": "bullish_sweep",
+    "displacement": "bullish_disp",
+    "fair_value_gaps": "in_bullish_fvg",
+    "market_structure_shift": "bullish_mss",
+}
+_SHORT_KEYS = {
+    "liquidity_sweep": "bearish_sweep",
+    "displacement": "bearish_disp",
+    "fair_value_gaps": "in_bearish_fvg",
+    "market_structure_shift": "bearish_mss",
+}
+
+
+def _get_signal(df: pd.DataFrame, module: str, direction: str) -> np.ndarray:
+    """Map module name to a boolean array for the given direction (False where missing/NaN)."""
+    key = (_LONG_KEYS if direction == "LONG" else _SHORT_KEYS).get(module)
     if key and key in df.columns:
-        return df[key].fillna(False)
-    return pd.Series(False, index=df.index)
-
-
-def _combine_pillar(df: pd.DataFrame, modules: List[str], require_all: bool, direction: str) -> pd.Series:
-    """Combine multiple modules into one pillar (AND or OR)."""
-    if not modules:
-        return pd.Series(True, index=df.index)
-    series = [_get_signal_series(df, m, direction) for m in modules]
-    if require_all:
-        out = series[0]
-        for s in series[1:]:
-            out = out & s
-        return out
-    out = series[0]
-    for s in series[1:]:
-        out = out | s
-    return out
+        return df[key].fillna(False).to_numpy(dtype=bool)
+    return np.zeros(len(df), dtype=bool)
+
+
+@lru_cache(maxsize=64)
+def _pillar_columns(modules: Tuple[str, ...], direction: str) -> Tuple[Optional[str], ...]:
+    """Signal columns of a pillar's modules; resolved once per (modules, direction)."""
+    keys = _LONG_KEYS if direction == "LONG" else _SHORT_KEYS
+    return tuple(keys.get(m) for m in modules)
+
+
+def _combine_pillar(
+    columns: Tuple[Optional[str], ...], require_all: bool, signal: Callable[[Optional[str]], np.ndarray], n: int
+) -> np.ndarray:
+    """Combine the pillar's signal columns (AND or OR); signal(col) gives the gathered array."""
+    if not columns:
+        return np.ones(n, dtype=bool)
+    return (np.logical_and if require_all else np.logical_or).reduce([signal(c) for c in columns])
+
+
+def _recent_at(signal: np.ndarray, window: int, idx: np.ndarray) -> np.ndarray:
+    """At bar positions idx: did signal fire within the last window bars (incl. the bar itself)?"""
+    counts = np.zeros(len(signal) + 1, dtype=np.int64)
+    np.cumsum(signal, out=counts[1:])
+    return counts[idx + 1] - counts[np.maximum(idx + 1 - window, 0)] > 0
+
+
+def clear_feature_cache() -> None:
+    _feature_cache.clear()
+
+
+def _frame_signature(data: pd.DataFrame) -> Tuple:
+    """Length, end points and a CRC of the OHLC values (~2 ms per 100k bars), so
+    in-place edits such as updating the forming bar invalidate a cached entry."""
+    if data.empty:
+        return (0,)
+    crc = 0
+    for col in _OHLC:
+        if col in data.columns:
+            crc = zlib.crc32(np.ascontiguousarray(data[col].to_numpy(dtype=np.float64)), crc)
+    return (len(data), data.index[0], data.index[-1], crc)
+
+
+def _forget(key: Tuple[int, str]) -> Callable[[weakref.ref], None]:
+    def drop(ref: weakref.ref) -> None:
+        hit = _feature_cache.get(key)
+        if hit is not None and hit[0] is ref:
+            del _feature_cache[key]
+    return drop
+
+
+def _module_features(data: pd.DataFrame, cfg: Dict[str, Any]) -> pd.DataFrame:
+    """data plus all ICT module and structure-context columns (memoized; do not mutate)."""
+    module_cfg = {k: cfg.get(k) for k in ("liquidity_sweep", "displacement", "fair_value_gaps",
+                                          "market_structure_shift", "structure_context")}
+    key = (id(data), json.dumps(module_cfg, sort_keys=True, default=str))
+    signature = _frame_signature(data)
+    hit = _feature_cache.get(key)
+    if hit is not None and hit[0]() is data and hit[1] == signature:
+        _feature_cache.move_to_end(key)
+        return hit[2]
+
+    # One copy of the input; the modules then write into it in place
+    df = data.copy()
+    _SWEEP.calculate(df, cfg.get("liquidity_sweep", {}), inplace=True)
+    _DISPLACEMENT.calculate(df, cfg.get("displacement", {}), inplace=True)
+    _FVG.calculate(df, cfg.get("fair_value_gaps", {}), inplace=True)
+    _MSS.calculate(df, cfg.get("market_structure_shift", {}), inplace=True)
+    add_structure_context(df, cfg.get("structure_context", {"lookback": 30, "pivot_bars": 2}), inplace=True)
+
+    _feature_cache[key] = (weakref.ref(data, _forget(key)), signature, df)
+    while len(_feature_cache) > FEATURE_CACHE_SIZE:
+        _feature_cache.popitem(last=False)
+    return df
 
 
 def run_sqe_conditions(
@@ -96,74 +178,73 @@ def run_sqe_conditions(
     """
     Run the 3-pillar model: Trend context + Liquidity/levels + Entry trigger.
     Returns a boolean series True where all three pillars align (entry valid).
+    The ICT columns are cached per (frame, module config) and revalidated against the
+    frame's length, end points and OHLC values, so editing data in place (e.g. the
+    forming bar) recomputes them; the cache never keeps data itself alive.
     """
-    cfg = config or get_sqe_default_config()
-    df = data.copy()
-
-    # Run all ICT modules (same params as before)
-    sweep_mod = LiquiditySweepModule()
-    df = sweep_mod.calculate(df, cfg.get("liquidity_sweep", {}))
-    disp_mod = DisplacementModule()
-    df = disp_mod.calculate(df, cfg.get("displacement", {}))
-    fvg_mod = FairValueGapModule()
-    df = fvg_mod.calculate(df, cfg.get("fair_value_gaps", {}))
-    mss_mod = MarketStructureShiftModule()
-    df = mss_mod.calculate(df, cfg.get("market_structure_shift", {}))
+    cfg = config or _DEFAULT_SQE_CFG
+    # Run all ICT modules (same params as before) + explicit market structure (HH/HL or LH/LL)
+    df = _module_features(data, cfg)
 
     # ---- Expliciete marktstructuur (HH/HL of LH/LL); RANGE = no trade ----
-    df = add_structure_context(df, cfg.get("structure_context", {"lookback": 30, "pivot_bars": 2}))
+    # Structure is the strictest filter: the other signals are only combined at the
+    # bars that pass it (idx), entries elsewhere are False anyway
     if cfg.get("require_structure", True):
-        structure_ok = df["in_bullish_structure"] if direction == "LONG" else df["in_bearish_structure"]
+        col = "in_bullish_structure" if direction == "LONG" else "in_bearish_structure"
+        idx = np.flatnonzero(df[col].to_numpy(dtype=bool))
     else:
-        structure_ok = pd.Series(True, index=df.index)
-
-    # ---- 1) Trend context ----
-    tc_cfg = cfg.get("trend_context") or get_sqe_default_config()["trend_context"]
-    trend_modules = tc_cfg.get("modules", ["market_structure_shift", "displacement"])
-    trend_require_all = tc_cfg.get("require_all", False)
-    trend_ok = _combine_pillar(df, trend_modules, trend_require_all, direction)
-
-    # ---- 2) Liquidity / levels ----
-    liq_cfg = cfg.get("liquidity_levels") or get_sqe_default_config()["liquidity_levels"]
-    liq_modules = liq_cfg.get("modules", ["liquidity_sweep", "fair_value_gaps"])
-    liq_require_all = liq_cfg.get("require_all", True)
-    liquidity_ok = _combine_pillar(df, liq_modules, liq_require_all, direction)
-
-    # ---- 3) Entry timing (trigger) ----
-    trig_cfg = cfg.get("entry_trigger") or get_sqe_default_config()["entry_trigger"]
-    trigger_module = trig_cfg.get("module", "displacement")
-    trigger_ok = _get_signal_series(df, trigger_module, direction)
+        idx = np.arange(len(df))
 
     # Stap 2: entry = structure + sweep + displacement + FVG (liquidity alleen als target)
     if cfg.get("entry_require_sweep_displacement_fvg", False):
-        sweep_ok = _get_signal_series(df, "liquidity_sweep", direction)
-        disp_ok = _get_signal_series(df, "displacement", direction)
-        fvg_ok = _get_signal_series(df, "fair_value_gaps", direction)
+        sweep_ok = _get_signal(df, "liquidity_sweep", direction)
+        disp_ok = _get_signal(df, "displacement", direction)
+        fvg_ok = _get_signal(df, "fair_value_gaps", direction)
         lookback = max(0, int(cfg.get("entry_sweep_disp_fvg_lookback_bars", 0)))
         min_count = max(1, min(3, int(cfg.get("entry_sweep_disp_fvg_min_count", 3))))  # 1–3
-        if lookback > 0:
-            window = lookback
-            # rolling().max() geeft float; expliciet bool voor &/|
-            sweep_recent = sweep_ok.rolling(window=window, min_periods=1).max().fillna(0).astype(bool)
-            disp_recent = disp_ok.rolling(window=window, min_periods=1).max().fillna(0).astype(bool)
-            fvg_recent = fvg_ok.rolling(window=window, min_periods=1).max().fillna(0).astype(bool)
-            if min_count >= 3:
-                combined = structure_ok & sweep_recent & disp_recent & fvg_recent
-            elif min_count == 2:
-                # Minstens 2 van 3 in het venster (soepeler)
-                two_of_three = (sweep_recent & disp_recent) | (sweep_recent & fvg_recent) | (disp_recent & fvg_recent)
-                combined = structure_ok & two_of_three
-            else:
-                combined = structure_ok & (sweep_recent | disp_recent | fvg_recent)
+        if lookback > 1:
+            # Binnen het venster van lookback bars
+            sweep_ok, disp_ok, fvg_ok = (_recent_at(x, lookback, idx) for x in (sweep_ok, disp_ok, fvg_ok))
         else:
-            if min_count >= 3:
-                combined = structure_ok & sweep_ok & disp_ok & fvg_ok
-            elif min_count == 2:
-                two_of_three = (sweep_ok & disp_ok) | (sweep_ok & fvg_ok) | (disp_ok & fvg_ok)
-                combined = structure_ok & two_of_three
-            else:
-                combined = structure_ok & (sweep_ok | disp_ok | fvg_ok)
+            # A window of 0 or 1 bars is the bar itself
+            sweep_ok, disp_ok, fvg_ok = sweep_ok[idx], disp_ok[idx], fvg_ok[idx]
+        if min_count >= 3:
+            combined = sweep_ok & disp_ok & fvg_ok
+        elif min_count == 2:
+            # Minstens 2 van 3 (soepeler)
+            combined = (sweep_ok & disp_ok) | (sweep_ok & fvg_ok) | (disp_ok & fvg_ok)
+        else:
+            combined = sweep_ok | disp_ok | fvg_ok
     else:
-        combined = trend_ok & liquidity_ok & trigger_ok & structure_ok
-
-    return combined.fillna(False)
+        # Each signal column is read and gathered at idx once, whichever pillars use it
+        gathered: Dict[Optional[str], np.ndarray] = {}
+
+        def signal(col: Optional[str]) -> np.ndarray:
+            if col not in gathered:
+                if col and col in df.columns:
+                    gathered[col] = df[col].fillna(False).to_numpy(dtype=bool)[idx]
+                else:
+                    gathered[col] = np.zeros(len(idx), dtype=bool)
+            return gathered[col]
+
+        # ---- 1) Trend context ----
+        tc_cfg = cfg.get("trend_context") or _DEFAULT_SQE_CFG["trend_context"]
+        trend_modules = tuple(tc_cfg.get("modules", ["market_structure_shift", "displacement"]))
+        trend_ok = _combine_pillar(
+            _pillar_columns(trend_modules, direction), tc_cfg.get("require_all", False), signal, len(idx))
+
+        # ---- 2) Liquidity / levels ----
+        liq_cfg = cfg.get("liquidity_levels") or _DEFAULT_SQE_CFG["liquidity_levels"]
+        liq_modules = tuple(liq_cfg.get("modules", ["liquidity_sweep", "fair_value_gaps"]))
+        liquidity_ok = _combine_pillar(
+            _pillar_columns(liq_modules, direction), liq_cfg.get("require_all", True), signal, len(idx))
+
+        # ---- 3) Entry timing (trigger) ----
+        trig_cfg = cfg.get("entry_trigger") or _DEFAULT_SQE_CFG["entry_trigger"]
+        trigger_ok = signal(_pillar_columns((trig_cfg.get("module", "displacement"),), direction)[0])
+
+        combined = trend_ok & liquidity_ok & trigger_ok
+
+    entries = np.zeros(len(df), dtype=bool)
+    entries[idx] = combined
+    return pd.Series(entries, index=df.index)
@@ -1,11 +1,16 @@
 """Abstract base for strategy modules (ICT, indicators, etc.)."""
+import weakref
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 
 class BaseModule(ABC):
+    # (weakref to frame, {column: ndarray}) of the last frame seen by _flag_at
+    _flag_cache: Optional[Tuple[weakref.ref, Dict[str, Optional[np.ndarray]]]] = None
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -26,7 +31,13 @@ def get_config_schema(self) -> Dict[str, Any]:
         pass
 
     @abstractmethod
-    def calculate(self, data: pd.DataFrame, config: Dict[str, Any]) -> pd.DataFrame:
+    def calculate(self, data: pd.DataFrame, config: Dict[str, Any], *, inplace: bool = False) -> pd.DataFrame:
+        """
+        Return data with the module's columns added. By default data is left
+        untouched and a new frame is returned; inplace=True writes the columns
+        into data itself and returns it (the caller owns the frame, e.g. one
+        copy shared by a chain of modules).
+        """
         pass
 
     @abstractmethod
@@ -38,3 +49,47 @@ def check_entry_condition(
         direction: str,
     ) -> bool:
         pass
+
+    def _with_columns(self, data: pd.DataFrame, columns: Dict[str, Any], inplace: bool) -> pd.DataFrame:
+        """
+        data with columns set (in order): written into data when inplace, else via
+        data.assign, which under copy-on-write does not copy the input columns.
+        """
+        if not inplace:
+            return data.assign(**columns)
+        # The flag columns of data are rewritten: drop arrays cached by _flag_at
+        self._flag_cache = None
+        for name, values in columns.items():
+            data[name] = values
+        return data
+
+    def _forget_frame(self, ref: weakref.ref) -> None:
+        """weakref callback: release the cached arrays once their frame is collected."""
+        if self._flag_cache is not None and self._flag_cache[0] is ref:
+            self._flag_cache = None
+
+    def _flag_at(self, data: pd.DataFrame, index: int, direction: str, long_col: str, short_col: str) -> bool:
+        """
+        bool(data[long_col or short_col] at row index) for check_entry_condition,
+        False for an unknown direction, a missing column or index >= len(data).
+        Columns are fetched as ndarrays once per frame (data.iloc[index] built a
+        row Series on every call). The frame is only weakly referenced, and an
+        in-place calculate() on it drops the cache; other writes to the flag
+        columns between calls are not seen.
+        """
+        if index >= len(data):
+            return False
+        if direction == "LONG":
+            column = long_col
+        elif direction == "SHORT":
+            column = short_col
+        else:
+            return False
+        cached = self._flag_cache
+        if cached is None or cached[0]() is not data:
+            cached = self._flag_cache = (weakref.ref(data, self._forget_frame), {})
+        arrays = cached[1]
+        if column not in arrays:
+            arrays[column] = data[column].to_numpy() if column in data.columns else None
+        arr = arrays[column]
+        return False if arr is None else bool(arr[index])
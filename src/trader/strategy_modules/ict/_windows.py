@@ -0,0 +1,20 @@
+"""
+Trailing window max/min for the ICT modules.
+
+Uses bottleneck's move_max/move_min when installed (pip install bottleneck),
+otherwise pandas rolling; both give identical values.
+"""
+import numpy as np
+import pandas as pd
+
+try:
+    import bottleneck as bn
+except ImportError:  # optional speedup
+    bn = None
+
+
+def trailing_extreme(values: np.ndarray, window: int, reduce: str) -> np.ndarray:
+    """pd.Series(values).rolling(window).max() / .min() (reduce "max"/"min") as a float64 array."""
+    if bn is not None and 1 <= window <= len(values):
+        return bn.move_max(values, window) if reduce == "max" else bn.move_min(values, window)
+    return getattr(pd.Series(values).rolling(window), reduce)().to_numpy()
@@ -28,33 +28,19 @@ def get_config_schema(self) -> Dict:
             ]
         }
 
-    def calculate(self, data: pd.DataFrame, config: Dict) -> pd.DataFrame:
-        df = data.copy()
+    def calculate(self, data: pd.DataFrame, config: Dict, *, inplace: bool = False) -> pd.DataFrame:
         validity = config.get("breaker_validity_candles", 50)
-        df["bullish_breaker"] = False
-        df["bearish_breaker"] = False
-        df["in_bullish_breaker"] = False
-        df["in_bearish_breaker"] = False
         # Simplified: treat as OB that got broken (placeholder logic)
-        df["bullish_breaker"] = df["close"].rolling(5).min().shift(1) > df["high"]
-        df["bearish_breaker"] = df["close"].rolling(5).max().shift(1) < df["low"]
-        for i in range(len(df)):
-            for j in range(max(0, i - validity), i + 1):
-                if df.iloc[j].get("bullish_breaker", False):
-                    df.iloc[i, df.columns.get_loc("in_bullish_breaker")] = True
-                    break
-            for j in range(max(0, i - validity), i + 1):
-                if df.iloc[j].get("bearish_breaker", False):
-                    df.iloc[i, df.columns.get_loc("in_bearish_breaker")] = True
-                    break
-        return df
+        bull = data["close"].rolling(5).min().shift(1) > data["high"]
+        bear = data["close"].rolling(5).max().shift(1) < data["low"]
+        # "In breaker": a breaker within the last validity candles (window of validity + 1 incl. current)
+        in_bull, in_bear = (sig.rolling(validity + 1, min_periods=1).max().to_numpy() > 0 for sig in (bull, bear))
+        return self._with_columns(data, {
+            "bullish_breaker": bull,
+            "bearish_breaker": bear,
+            "in_bullish_breaker": in_bull,
+            "in_bearish_breaker": in_bear,
+        }, inplace)
 
     def check_entry_condition(self, data: pd.DataFrame, index: int, config: Dict, direction: str) -> bool:
-        if index >= len(data):
-            return False
-        row = data.iloc[index]
-        if direction == "LONG":
-            return bool(row.get("in_bullish_breaker", False))
-        if direction == "SHORT":
-            return bool(row.get("in_bearish_breaker", False))
-        return False
+        return self._flag_at(data, index, direction, "in_bullish_breaker", "in_bearish_breaker")
@@ -6,6 +6,16 @@
 from src.trader.strategy_modules.base import BaseModule
 
 
+def _all_last_n(mask: np.ndarray, n: int) -> np.ndarray:
+    """True where mask holds on all of the last n bars (rolling(n).sum() >= n; False before bar n-1)."""
+    out = np.zeros(len(mask), dtype=bool)
+    if 1 <= n <= len(mask):
+        counts = np.zeros(len(mask) + 1, dtype=np.int64)
+        np.cumsum(mask, out=counts[1:])
+        out[n - 1:] = counts[n:] - counts[:len(mask) + 1 - n] >= n
+    return out
+
+
 class DisplacementModule(BaseModule):
     @property
     def name(self) -> str:
@@ -28,26 +38,20 @@ def get_config_schema(self) -> Dict:
             ]
         }
 
-    def calculate(self, data: pd.DataFrame, config: Dict) -> pd.DataFrame:
-        df = data.copy()
+    def calculate(self, data: pd.DataFrame, config: Dict, *, inplace: bool = False) -> pd.DataFrame:
         body_pct = config.get("min_body_pct", 70) / 100.0
         n_c = config.get("min_candles", 3)
         move_pct = config.get("min_move_pct", 1.5) / 100.0
-        body = (df["close"] - df["open"]).abs()
-        rng = df["high"] - df["low"]
-        rng = rng.replace(0, np.nan)
-        strong_bull = (df["close"] > df["open"]) & (body >= rng * body_pct)
-        strong_bear = (df["close"] < df["open"]) & (body >= rng * body_pct)
-        df["bullish_disp"] = strong_bull.rolling(n_c).sum() >= n_c
-        df["bearish_disp"] = strong_bear.rolling(n_c).sum() >= n_c
-        return df
+        o = data["open"].to_numpy(dtype=np.float64)
+        c = data["close"].to_numpy(dtype=np.float64)
+        rng = data["high"].to_numpy(dtype=np.float64) - data["low"].to_numpy(dtype=np.float64)
+        # Strong body: |close - open| >= range * body_pct on a non-zero range (NaN compares False)
+        strong = np.abs(c - o) >= rng * body_pct
+        strong &= rng != 0
+        return self._with_columns(data, {
+            "bullish_disp": _all_last_n(strong & (c > o), n_c),
+            "bearish_disp": _all_last_n(strong & (c < o), n_c),
+        }, inplace)
 
     def check_entry_condition(self, data: pd.DataFrame, index: int, config: Dict, direction: str) -> bool:
-        if index >= len(data):
-            return False
-        row = data.iloc[index]
-        if direction == "LONG":
-            return bool(row.get("bullish_disp", False))
-        if direction == "SHORT":
-            return bool(row.get("bearish_disp", False))
-        return False
+        return self._flag_at(data, index, direction, "bullish_disp", "bearish_disp")
@@ -27,42 +27,29 @@ def get_config_schema(self) -> Dict:
             ]
         }
 
-    def calculate(self, data: pd.DataFrame, config: Dict) -> pd.DataFrame:
-        df = data.copy()
+    def calculate(self, data: pd.DataFrame, config: Dict, *, inplace: bool = False) -> pd.DataFrame:
         min_gap = config.get("min_gap_pct", 0.5) / 100.0
         validity = config.get("validity_candles", 50)
-        df["bullish_fvg"] = False
-        df["bearish_fvg"] = False
-        df["in_bullish_fvg"] = False
-        df["in_bearish_fvg"] = False
-        for i in range(2, len(df)):
-            prev_prev_high = df.iloc[i - 2]["high"]
-            prev_prev_low = df.iloc[i - 2]["low"]
-            curr_low = df.iloc[i]["low"]
-            curr_high = df.iloc[i]["high"]
-            if curr_low > prev_prev_high:
-                gap_pct = (curr_low - prev_prev_high) / prev_prev_high
-                if gap_pct >= min_gap:
-                    df.iloc[i - 1, df.columns.get_loc("bullish_fvg")] = True
-            if curr_high < prev_prev_low:
-                gap_pct = (prev_prev_low - curr_high) / prev_prev_low
-                if gap_pct >= min_gap:
-                    df.iloc[i - 1, df.columns.get_loc("bearish_fvg")] = True
-        # Simple propagation for "in FVG" (last N candles)
-        for col, sig in [("in_bullish_fvg", "bullish_fvg"), ("in_bearish_fvg", "bearish_fvg")]:
-            for i in range(len(df)):
-                for j in range(max(0, i - validity), i + 1):
-                    if df.iloc[j][sig]:
-                        df.iloc[i, df.columns.get_loc(col)] = True
-                        break
-        return df
+        high = data["high"].to_numpy(dtype=np.float64)
+        low = data["low"].to_numpy(dtype=np.float64)
+        bull = np.zeros(len(data), dtype=bool)
+        bear = np.zeros(len(data), dtype=bool)
+        if len(data) > 2:
+            # Candle i vs candle i-2; the gap is flagged on the middle candle i-1
+            pp_high, pp_low = high[:-2], low[:-2]
+            curr_high, curr_low = high[2:], low[2:]
+            with np.errstate(invalid="ignore", divide="ignore"):
+                bull[1:-1] = (curr_low > pp_high) & ((curr_low - pp_high) / pp_high >= min_gap)
+                bear[1:-1] = (curr_high < pp_low) & ((pp_low - curr_high) / pp_low >= min_gap)
+        # "In FVG": a gap within the last validity candles (window of validity + 1 incl. current)
+        in_bull, in_bear = (pd.Series(sig).rolling(validity + 1, min_periods=1).max().to_numpy() > 0
+                            for sig in (bull, bear))
+        return self._with_columns(data, {
+            "bullish_fvg": bull,
+            "bearish_fvg": bear,
+            "in_bullish_fvg": in_bull,
+            "in_bearish_fvg": in_bear,
+        }, inplace)
 
     def check_entry_condition(self, data: pd.DataFrame, index: int, config: Dict, direction: str) -> bool:
-        if index >= len(data):
-            return False
-        row = data.iloc[index]
-        if direction == "LONG":
-            return bool(row.get("in_bullish_fvg", False))
-        if direction == "SHORT":
-            return bool(row.get("in_bearish_fvg", False))
-        return False
+        return self._flag_at(data, index, direction, "in_bullish_fvg", "in_bearish_fvg")
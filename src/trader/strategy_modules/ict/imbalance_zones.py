@@ -27,36 +27,26 @@ def get_config_schema(self) -> Dict:
             ]
         }
 
-    def calculate(self, data: pd.DataFrame, config: Dict) -> pd.DataFrame:
-        df = data.copy()
+    def calculate(self, data: pd.DataFrame, config: Dict, *, inplace: bool = False) -> pd.DataFrame:
         min_gap = config.get("min_gap_size", 0.5)
         validity = config.get("validity_candles", 50)
-        df["bullish_imbalance"] = False
-        df["bearish_imbalance"] = False
-        df["in_bullish_imbalance"] = False
-        df["in_bearish_imbalance"] = False
-        for i in range(2, len(df)):
-            if df.iloc[i]["low"] > df.iloc[i - 2]["high"] + min_gap:
-                df.iloc[i - 1, df.columns.get_loc("bullish_imbalance")] = True
-            if df.iloc[i]["high"] < df.iloc[i - 2]["low"] - min_gap:
-                df.iloc[i - 1, df.columns.get_loc("bearish_imbalance")] = True
-        for i in range(len(df)):
-            for j in range(max(0, i - validity), i + 1):
-                if df.iloc[j].get("bullish_imbalance", False):
-                    df.iloc[i, df.columns.get_loc("in_bullish_imbalance")] = True
-                    break
-            for j in range(max(0, i - validity), i + 1):
-                if df.iloc[j].get("bearish_imbalance", False):
-                    df.iloc[i, df.columns.get_loc("in_bearish_imbalance")] = True
-                    break
-        return df
+        high = data["high"].to_numpy(dtype=np.float64)
+        low = data["low"].to_numpy(dtype=np.float64)
+        bull = np.zeros(len(data), dtype=bool)
+        bear = np.zeros(len(data), dtype=bool)
+        if len(data) > 2:
+            # Candle i vs candle i-2; the imbalance is flagged on the middle candle i-1
+            bull[1:-1] = low[2:] > high[:-2] + min_gap
+            bear[1:-1] = high[2:] < low[:-2] - min_gap
+        # "In imbalance": one within the last validity candles (window of validity + 1 incl. current)
+        in_bull, in_bear = (pd.Series(sig).rolling(validity + 1, min_periods=1).max().to_numpy() > 0
+                            for sig in (bull, bear))
+        return self._with_columns(data, {
+            "bullish_imbalance": bull,
+            "bearish_imbalance": bear,
+            "in_bullish_imbalance": in_bull,
+            "in_bearish_imbalance": in_bear,
+        }, inplace)
 
     def check_entry_condition(self, data: pd.DataFrame, index: int, config: Dict, direction: str) -> bool:
-        if index >= len(data):
-            return False
-        row = data.iloc[index]
-        if direction == "LONG":
-            return bool(row.get("in_bullish_imbalance", False))
-        if direction == "SHORT":
-            return bool(row.get("in_bearish_imbalance", False))
-        return False
+        return self._flag_at(data, index, direction, "in_bullish_imbalance", "in_bearish_imbalance")
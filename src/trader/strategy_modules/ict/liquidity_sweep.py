@@ -4,6 +4,7 @@
 from typing import Dict
 
 from src.trader.strategy_modules.base import BaseModule
+from src.trader.strategy_modules.ict._windows import trailing_extreme
 
 
 class LiquiditySweepModule(BaseModule):
@@ -28,43 +29,44 @@ def get_config_schema(self) -> Dict:
             ]
         }
 
-    def calculate(self, data: pd.DataFrame, config: Dict) -> pd.DataFrame:
-        df = data.copy()
+    def calculate(self, data: pd.DataFrame, config: Dict, *, inplace: bool = False) -> pd.DataFrame:
         lookback = config.get("lookback_candles", 20)
         thresh = config.get("sweep_threshold_pct", 0.2) / 100.0
         rev_n = config.get("reversal_candles", 3)
-        df["swing_high"] = df["high"].rolling(lookback, center=False).max().shift(1)
-        df["swing_low"] = df["low"].rolling(lookback, center=False).min().shift(1)
-        df["bullish_sweep"] = False
-        df["bearish_sweep"] = False
-        # Swept levels: the exact structure point that was swept (for SL anchoring)
-        df["swept_low"] = np.nan
-        df["swept_high"] = np.nan
-        for i in range(lookback + rev_n, len(df)):
-            sh, sl = df.iloc[i - 1]["swing_high"], df.iloc[i - 1]["swing_low"]
-            if pd.isna(sh) or pd.isna(sl):
-                continue
-            h, l_ = df.iloc[i]["high"], df.iloc[i]["low"]
-            if l_ <= sl * (1 - thresh):
-                for j in range(i, min(i + rev_n + 1, len(df))):
-                    if df.iloc[j]["high"] >= sl * (1 + thresh):
-                        df.iloc[i, df.columns.get_loc("bullish_sweep")] = True
-                        df.iloc[i, df.columns.get_loc("swept_low")] = sl
-                        break
-            if h >= sh * (1 + thresh):
-                for j in range(i, min(i + rev_n + 1, len(df))):
-                    if df.iloc[j]["low"] <= sh * (1 - thresh):
-                        df.iloc[i, df.columns.get_loc("bearish_sweep")] = True
-                        df.iloc[i, df.columns.get_loc("swept_high")] = sh
-                        break
-        return df
+        n = len(data)
+        high = data["high"].to_numpy(dtype=np.float64)
+        low = data["low"].to_numpy(dtype=np.float64)
+        # Extremes of the lookback bars before each bar (rolling(lookback).max/min().shift(1))
+        swing_high = np.full(n, np.nan)
+        swing_low = np.full(n, np.nan)
+        swing_high[1:] = trailing_extreme(high, lookback, "max")[:-1]
+        swing_low[1:] = trailing_extreme(low, lookback, "min")[:-1]
+        # Levels of the previous bar (swing_high/swing_low at i - 1)
+        prev_sh = np.full(n, np.nan)
+        prev_sl = np.full(n, np.nan)
+        prev_sh[1:] = swing_high[:-1]
+        prev_sl[1:] = swing_low[:-1]
+        bull = np.zeros(n, dtype=bool)
+        bear = np.zeros(n, dtype=bool)
+        start = lookback + rev_n
+        if rev_n >= 0 and start < n:
+            # Highest high / lowest low of bars i..i+rev_n (cut off at the end of the data)
+            fwd_high = pd.Series(high[::-1]).rolling(rev_n + 1, min_periods=1).max().to_numpy()[::-1]
+            fwd_low = pd.Series(low[::-1]).rolling(rev_n + 1, min_periods=1).min().to_numpy()[::-1]
+            sh, sl = prev_sh[start:], prev_sl[start:]
+            valid = ~(np.isnan(sh) | np.isnan(sl))
+            h, l_ = high[start:], low[start:]
+            bull[start:] = valid & (l_ <= sl * (1 - thresh)) & (fwd_high[start:] >= sl * (1 + thresh))
+            bear[start:] = valid & (h >= sh * (1 + thresh)) & (fwd_low[start:] <= sh * (1 - thresh))
+        return self._with_columns(data, {
+            "swing_high": swing_high,
+            "swing_low": swing_low,
+            "bullish_sweep": bull,
+            "bearish_sweep": bear,
+            # Swept levels: the exact structure point that was swept (for SL anchoring)
+            "swept_low": np.where(bull, prev_sl, np.nan),
+            "swept_high": np.where(bear, prev_sh, np.nan),
+        }, inplace)
 
     def check_entry_condition(self, data: pd.DataFrame, index: int, config: Dict, direction: str) -> bool:
-        if index >= len(data):
-            return False
-        row = data.iloc[index]
-        if direction == "LONG":
-            return bool(row.get("bullish_sweep", False))
-        if direction == "SHORT":
-            return bool(row.get("bearish_sweep", False))
-        return False
+        return self._flag_at(data, index, direction, "bullish_sweep", "bearish_sweep")
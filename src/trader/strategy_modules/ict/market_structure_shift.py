@@ -4,6 +4,19 @@
 from typing import Dict
 
 from src.trader.strategy_modules.base import BaseModule
+from src.trader.strategy_modules.ict._windows import trailing_extreme
+
+
+def _centered_extreme(values: np.ndarray, lb: int, reduce: str) -> np.ndarray:
+    """
+    Series.rolling(2 * lb + 1, center=True).max()/.min() as a float64 array: the
+    trailing window result moved back by lb bars.
+    """
+    trailing = trailing_extreme(values, 2 * lb + 1, reduce)
+    out = np.full(len(values), np.nan)
+    if lb < len(values):
+        out[: len(values) - lb] = trailing[lb:]
+    return out
 
 
 class MarketStructureShiftModule(BaseModule):
@@ -27,22 +40,24 @@ def get_config_schema(self) -> Dict:
             ]
         }
 
-    def calculate(self, data: pd.DataFrame, config: Dict) -> pd.DataFrame:
-        df = data.copy()
+    def calculate(self, data: pd.DataFrame, config: Dict, *, inplace: bool = False) -> pd.DataFrame:
         lb = config.get("swing_lookback", 5)
         thresh = config.get("break_threshold_pct", 0.2) / 100.0
-        df["swing_high"] = df["high"].rolling(2 * lb + 1, center=True).max()
-        df["swing_low"] = df["low"].rolling(2 * lb + 1, center=True).min()
-        df["bullish_mss"] = (df["high"] >= df["swing_high"].shift(1) * (1 + thresh)) & (df["swing_high"].shift(1).notna())
-        df["bearish_mss"] = (df["low"] <= df["swing_low"].shift(1) * (1 - thresh)) & (df["swing_low"].shift(1).notna())
-        return df
+        high = data["high"].to_numpy(dtype=np.float64)
+        low = data["low"].to_numpy(dtype=np.float64)
+        swing_high = _centered_extreme(high, lb, "max")
+        swing_low = _centered_extreme(low, lb, "min")
+        # Levels of the previous bar
+        prev_sh = np.full(len(data), np.nan)
+        prev_sl = np.full(len(data), np.nan)
+        prev_sh[1:] = swing_high[:-1]
+        prev_sl[1:] = swing_low[:-1]
+        return self._with_columns(data, {
+            "swing_high": swing_high,
+            "swing_low": swing_low,
+            "bullish_mss": (high >= prev_sh * (1 + thresh)) & ~np.isnan(prev_sh),
+            "bearish_mss": (low <= prev_sl * (1 - thresh)) & ~np.isnan(prev_sl),
+        }, inplace)
 
     def check_entry_condition(self, data: pd.DataFrame, index: int, config: Dict, direction: str) -> bool:
-        if index >= len(data):
-            return False
-        row = data.iloc[index]
-        if direction == "LONG":
-            return bool(row.get("bullish_mss", False))
-        if direction == "SHORT":
-            return bool(row.get("bearish_mss", False))
-        return False
+        return self._flag_at(data, index, direction, "bullish_mss", "bearish_mss")
@@ -9,10 +9,11 @@
 import logging
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from src.trader.indicators.ema import ema
-from src.trader.strategy_modules.ict.structure_context import add_structure_context
+from src.trader.strategy_modules.ict.structure_context import add_structure_context, last_structure_label
 
 logger = logging.getLogger(__name__)
 
@@ -30,19 +31,22 @@ def compute_daily_bias(
     if df_daily.empty or len(df_daily) < lookback:
         return pd.Series("NEUTRAL", index=df_daily.index)
 
-    # Daily candle direction
-    daily_dir = (df_daily["close"] > df_daily["open"]).astype(int) - (df_daily["close"] < df_daily["open"]).astype(int)
-    rolling_dir = daily_dir.rolling(lookback).sum()
+    close = df_daily["close"].to_numpy(dtype=np.float64)
 
-    # EMA alignment
-    ema10 = ema(df_daily["close"], 10)
-    ema20 = ema(df_daily["close"], 20)
+    # Daily candle direction: +1 / -1 / 0 (doji or missing price)
+    daily_dir = np.nan_to_num(np.sign(close - df_daily["open"].to_numpy(dtype=np.float64)))
+    rolling_dir = pd.Series(daily_dir).rolling(lookback).sum().to_numpy()
 
-    bias = pd.Series("NEUTRAL", index=df_daily.index)
-    bias[(rolling_dir > 2) & (ema10 > ema20)] = "BULLISH"
-    bias[(rolling_dir < -2) & (ema10 < ema20)] = "BEARISH"
+    # EMA alignment
+    ema10 = ema(df_daily["close"], 10).to_numpy()
+    ema20 = ema(df_daily["close"], 20).to_numpy()
 
-    return bias
+    bias = np.select(
+        [(rolling_dir < -2) & (ema10 < ema20), (rolling_dir > 2) & (ema10 > ema20)],
+        ["BEARISH", "BULLISH"],
+        "NEUTRAL",
+    )
+    return pd.Series(bias, index=df_daily.index)
 
 
 def compute_weekly_levels(
@@ -64,6 +68,9 @@ def compute_weekly_levels(
     }
 
 
+_H4_STRUCTURE_CFG = {"lookback": 20, "pivot_bars": 2}
+
+
 def compute_h4_structure(
     df_h4: pd.DataFrame,
     config: Optional[Dict] = None,
@@ -75,8 +82,8 @@ def compute_h4_structure(
     if df_h4.empty or len(df_h4) < 30:
         return pd.Series("RANGE", index=df_h4.index)
 
-    cfg = config or {"lookback": 20, "pivot_bars": 2}
-    df = add_structure_context(df_h4.copy(), cfg)
+    cfg = config or _H4_STRUCTURE_CFG
+    df = add_structure_context(df_h4, cfg)
     return df["structure_label"]
 
 
@@ -94,14 +101,14 @@ def get_htf_bias(
 
     # H1 structure
     if df_1h is not None and not df_1h.empty and len(df_1h) >= 30:
-        h1_struct = add_structure_context(df_1h.copy(), {"lookback": 30, "pivot_bars": 2})
-        last_struct = h1_struct["structure_label"].iloc[-1]
+        # Only the last label is needed: compute it from the tail of the frame
+        last_struct = last_structure_label(df_1h, lookback=30, pivot_bars=2)
         biases["h1"] = "BULLISH" if "BULLISH" in str(last_struct) else "BEARISH" if "BEARISH" in str(last_struct) else "NEUTRAL"
 
     # H4 structure
     if df_4h is not None and not df_4h.empty and len(df_4h) >= 20:
-        h4_struct = compute_h4_structure(df_4h)
-        last_struct = h4_struct.iloc[-1]
+        # compute_h4_structure(df_4h).iloc[-1], from the tail only
+        last_struct = "RANGE" if len(df_4h) < 30 else last_structure_label(df_4h, **_H4_STRUCTURE_CFG)
         biases["h4"] = "BULLISH" if "BULLISH" in str(last_struct) else "BEARISH" if "BEARISH" in str(last_struct) else "NEUTRAL"
 
     # Daily bias
@@ -111,9 +118,10 @@ def get_htf_bias(
 
     # Consensus
     if biases:
-        bullish_count = sum(1 for v in biases.values() if v == "BULLISH")
-        bearish_count = sum(1 for v in biases.values() if v == "BEARISH")
-        total = len(biases)
+        values = list(biases.values())
+        bullish_count = values.count("BULLISH")
+        bearish_count = values.count("BEARISH")
+        total = len(values)
         if bullish_count > total / 2:
             biases["consensus"] = "BULLISH"
         elif bearish_count > total / 2:
@@ -28,45 +28,38 @@ def get_config_schema(self) -> Dict:
             ]
         }
 
-    def calculate(self, data: pd.DataFrame, config: Dict) -> pd.DataFrame:
-        df = data.copy()
+    def calculate(self, data: pd.DataFrame, config: Dict, *, inplace: bool = False) -> pd.DataFrame:
         n_c = config.get("min_candles", 3)
         move_pct = config.get("min_move_pct", 3.0) / 100.0
         validity = config.get("validity_candles", 20)
-        df["bullish_ob"] = False
-        df["bearish_ob"] = False
-        df["in_bullish_ob"] = False
-        df["in_bearish_ob"] = False
-        for i in range(n_c + 1, len(df) - n_c):
-            # Bearish OB: last bearish candle before strong up move
-            fwd_high = df.iloc[i + 1 : i + 1 + n_c]["high"].max()
-            fwd_low = df.iloc[i + 1 : i + 1 + n_c]["low"].min()
-            if df.iloc[i]["close"] < df.iloc[i]["open"] and fwd_high > df.iloc[i]["high"]:
-                move = (fwd_high - df.iloc[i]["low"]) / df.iloc[i]["low"]
-                if move >= move_pct:
-                    df.iloc[i, df.columns.get_loc("bearish_ob")] = True
-            # Bullish OB: last bullish candle before strong down move
-            if df.iloc[i]["close"] > df.iloc[i]["open"] and fwd_low < df.iloc[i]["low"]:
-                move = (df.iloc[i]["high"] - fwd_low) / df.iloc[i]["high"]
-                if move >= move_pct:
-                    df.iloc[i, df.columns.get_loc("bullish_ob")] = True
-        for i in range(len(df)):
-            for j in range(max(0, i - validity), i + 1):
-                if df.iloc[j].get("bullish_ob", False):
-                    df.iloc[i, df.columns.get_loc("in_bullish_ob")] = True
-                    break
-            for j in range(max(0, i - validity), i + 1):
-                if df.iloc[j].get("bearish_ob", False):
-                    df.iloc[i, df.columns.get_loc("in_bearish_ob")] = True
-                    break
-        return df
+        o = data["open"].to_numpy(dtype=np.float64)
+        h = data["high"].to_numpy(dtype=np.float64)
+        l = data["low"].to_numpy(dtype=np.float64)
+        c = data["close"].to_numpy(dtype=np.float64)
+        n = len(data)
+        bull = np.zeros(n, dtype=bool)
+        bear = np.zeros(n, dtype=bool)
+        if n_c >= 1 and n - n_c > n_c + 1:
+            i = np.arange(n_c + 1, n - n_c)
+            # High/low of the n_c candles after i: the trailing n_c-bar window ending at i + n_c
+            # (O(N) monotonic-deque kernels; NaNs skipped like pandas .max()/.min())
+            fwd_high = pd.Series(h).rolling(n_c, min_periods=1).max().to_numpy()[i + n_c]
+            fwd_low = pd.Series(l).rolling(n_c, min_periods=1).min().to_numpy()[i + n_c]
+            oi, hi, li, ci = o[i], h[i], l[i], c[i]
+            with np.errstate(invalid="ignore", divide="ignore"):
+                # Bearish OB: last bearish candle before strong up move
+                bear[i] = (ci < oi) & (fwd_high > hi) & ((fwd_high - li) / li >= move_pct)
+                # Bullish OB: last bullish candle before strong down move
+                bull[i] = (ci > oi) & (fwd_low < li) & ((hi - fwd_low) / hi >= move_pct)
+        # "In OB": one within the last validity candles (window of validity + 1 incl. current)
+        in_bull, in_bear = (pd.Series(sig).rolling(validity + 1, min_periods=1).max().to_numpy() > 0
+                            for sig in (bull, bear))
+        return self._with_columns(data, {
+            "bullish_ob": bull,
+            "bearish_ob": bear,
+            "in_bullish_ob": in_bull,
+            "in_bearish_ob": in_bear,
+        }, inplace)
 
     def check_entry_condition(self, data: pd.DataFrame, index: int, config: Dict, direction: str) -> bool:
-        if index >= len(data):
-            return False
-        row = data.iloc[index]
-        if direction == "LONG":
-            return bool(row.get("in_bullish_ob", False))
-        if direction == "SHORT":
-            return bool(row.get("in_bearish_ob", False))
-        return False
+        return self._flag_at(data, index, direction, "in_bullish_ob", "in_bearish_ob")
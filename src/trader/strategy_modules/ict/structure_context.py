@@ -2,8 +2,9 @@
 Expliciete marktstructuur: HH/HL (bullish), LH/LL (bearish), of RANGE.
 Alleen trades toestaan in duidelijke structuur; RANGE blokkeren (OCLW_PRINCIPLES).
 """
-from typing import Dict
+from typing import Dict, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from src.trader.strategy_modules.ict.structure_labels import (
@@ -12,19 +13,31 @@
     RANGE,
 )
 
+# Internal int8 label codes; _LABELS[code] is the public label
+_RANGE, _BULL, _BEAR = 0, 1, 2
+_LABELS = (RANGE, BULLISH_STRUCTURE, BEARISH_STRUCTURE)
 
-def compute_structure_labels(
-    data: pd.DataFrame,
-    lookback: int = 30,
-    pivot_bars: int = 2,
-) -> pd.Series:
+
+def _last_two_pivots(
+    values: np.ndarray, is_pivot: np.ndarray, bars: np.ndarray, lookback: int
+) -> Tuple[np.ndarray, Optional[np.ndarray], Optional[np.ndarray]]:
     """
-    Per bar: BULLISH_STRUCTURE (HH/HL), BEARISH_STRUCTURE (LH/LL), of RANGE.
-    - HH/HL: laatste swing high > vorige, laatste swing low > vorige.
-    - LH/LL: laatste swing high < vorige, laatste swing low < vorige.
-    - Anders: RANGE.
+    Per bar in bars: do the window [bar - lookback, bar] hold at least two pivots,
+    and the values of the last (newest) and the one before it.
     """
-    df = data.copy()
+    pos = np.flatnonzero(is_pivot)
+    if len(pos) < 2:
+        return np.zeros(len(bars), dtype=bool), None, None
+    k = np.searchsorted(pos, bars, side="right") - 1  # last pivot at or before the bar
+    ok = k >= 1
+    prev = pos[np.maximum(k - 1, 0)]
+    ok &= prev >= bars - lookback
+    return ok, values[pos[np.maximum(k, 0)]], values[prev]
+
+
+def _structure_codes(data: pd.DataFrame, lookback: int, pivot_bars: int) -> np.ndarray:
+    """Per bar the int8 label code (_RANGE / _BULL / _BEAR); see compute_structure_labels."""
+    df = data  # read only
     n = len(df)
     # Pivot highs/lows: lokaal max/min over (2 * pivot_bars + 1)
     high_roll = df["high"].rolling(2 * pivot_bars + 1, center=True, min_periods=pivot_bars + 1).max()
@@ -32,40 +45,60 @@ def compute_structure_labels(
     is_pivot_high = (df["high"] == high_roll) & high_roll.notna()
     is_pivot_low = (df["low"] == low_roll) & low_roll.notna()
 
-    out = pd.Series(index=df.index, dtype=object)
-    out[:] = RANGE
-
-    for i in range(lookback, n):
-        start = max(0, i - lookback)
-        # Pivot highs/lows in window: waar high resp. low lokaal max/min is
-        window_high = df["high"].iloc[start : i + 1].values
-        window_low = df["low"].iloc[start : i + 1].values
-        is_ph = is_pivot_high.iloc[start : i + 1].values
-        is_pl = is_pivot_low.iloc[start : i + 1].values
+    codes = np.full(n, _RANGE, dtype=np.int8)
+    bars = np.arange(max(lookback, 0), n)
+    if len(bars):
+        # Last two pivot highs/lows within the window [i - lookback, i] of every bar i
+        ok_h, sh2, sh1 = _last_two_pivots(df["high"].to_numpy(dtype=np.float64),
+                                          is_pivot_high.to_numpy(dtype=bool), bars, lookback)
+        ok_l, sl2, sl1 = _last_two_pivots(df["low"].to_numpy(dtype=np.float64),
+                                          is_pivot_low.to_numpy(dtype=bool), bars, lookback)
+        ok = ok_h & ok_l
+        if ok.any():
+            codes[bars[ok & (sh2 > sh1) & (sl2 > sl1)]] = _BULL
+            codes[bars[ok & (sh2 < sh1) & (sl2 < sl1)]] = _BEAR
+            # else blijft RANGE
+    return codes
 
-        ph_vals = window_high[is_ph]
-        pl_vals = window_low[is_pl]
-        if len(ph_vals) < 2 or len(pl_vals) < 2:
-            continue
 
-        sh2, sh1 = ph_vals[-1], ph_vals[-2]
-        sl2, sl1 = pl_vals[-1], pl_vals[-2]
+def compute_structure_labels(
+    data: pd.DataFrame,
+    lookback: int = 30,
+    pivot_bars: int = 2,
+) -> pd.Series:
+    """
+    Per bar: BULLISH_STRUCTURE (HH/HL), BEARISH_STRUCTURE (LH/LL), of RANGE.
+    - HH/HL: laatste swing high > vorige, laatste swing low > vorige.
+    - LH/LL: laatste swing high < vorige, laatste swing low < vorige.
+    - Anders: RANGE.
+    Returned as a categorical Series (int8 codes underneath).
+    """
+    codes = _structure_codes(data, lookback, pivot_bars)
+    return pd.Series(pd.Categorical.from_codes(codes, categories=list(_LABELS)), index=data.index)
 
-        if sh2 > sh1 and sl2 > sl1:
-            out.iloc[i] = BULLISH_STRUCTURE
-        elif sh2 < sh1 and sl2 < sl1:
-            out.iloc[i] = BEARISH_STRUCTURE
-        # else blijft RANGE
 
-    return out
+def last_structure_label(data: pd.DataFrame, lookback: int = 30, pivot_bars: int = 2) -> str:
+    """
+    compute_structure_labels(data, lookback, pivot_bars).iloc[-1] from the tail of
+    data only: the last bar's window plus pivot_bars bars of pivot context before it.
+    """
+    if data.empty:
+        return RANGE
+    tail = data.iloc[-(max(lookback, 0) + pivot_bars + 1):]
+    return _LABELS[_structure_codes(tail, lookback, pivot_bars)[-1]]
 
 
-def add_structure_context(df: pd.DataFrame, config: Dict) -> pd.DataFrame:
-    """Add structure_label column (BULLISH_STRUCTURE, BEARISH_STRUCTURE, RANGE)."""
+def add_structure_context(df: pd.DataFrame, config: Dict, *, inplace: bool = False) -> pd.DataFrame:
+    """
+    Add structure_label column (BULLISH_STRUCTURE, BEARISH_STRUCTURE, RANGE).
+    inplace=True writes the columns into df itself (no copy) and returns it.
+    """
     lookback = config.get("lookback", 30)
     pivot_bars = config.get("pivot_bars", 2)
-    df = df.copy()
-    df["structure_label"] = compute_structure_labels(df, lookback=lookback, pivot_bars=pivot_bars)
-    df["in_bullish_structure"] = df["structure_label"] == BULLISH_STRUCTURE
-    df["in_bearish_structure"] = df["structure_label"] == BEARISH_STRUCTURE
+    if not inplace:
+        df = df.copy()
+    codes = _structure_codes(df, lookback, pivot_bars)
+    df["structure_label"] = pd.Categorical.from_codes(codes, categories=list(_LABELS))
+    df["in_bullish_structure"] = codes == _BULL
+    df["in_bearish_structure"] = codes == _BEAR
     return df
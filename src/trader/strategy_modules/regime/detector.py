@@ -13,6 +13,10 @@
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from src.trader.indicators.atr import true_range
+from src.trader.indicators.ema import ema
 
 
 class Regime(str, Enum):
@@ -42,8 +46,8 @@ class Regime(str, Enum):
 }
 
 
-def _compute_adx(df: pd.DataFrame, period: int = 14) -> pd.Series:
-    """Compute Average Directional Index (ADX)."""
+def _compute_adx(df: pd.DataFrame, period: int = 14, tr: Optional[np.ndarray] = None) -> pd.Series:
+    """Compute Average Directional Index (ADX). tr: precomputed true_range of df."""
     high = df["high"]
     low = df["low"]
     close = df["close"]
@@ -53,12 +57,9 @@ def _compute_adx(df: pd.DataFrame, period: int = 14) -> pd.Series:
     plus_dm = plus_dm.where((plus_dm > minus_dm) & (plus_dm > 0), 0.0)
     minus_dm = minus_dm.where((minus_dm > plus_dm) & (minus_dm > 0), 0.0)
 
-    tr1 = high - low
-    tr2 = (high - close.shift(1)).abs()
-    tr3 = (low - close.shift(1)).abs()
-    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-
-    atr = tr.ewm(alpha=1 / period, adjust=False).mean()
+    if tr is None:
+        tr = true_range(high, low, close)
+    atr = pd.Series(tr, index=df.index).ewm(alpha=1 / period, adjust=False).mean()
     plus_di = 100 * (plus_dm.ewm(alpha=1 / period, adjust=False).mean() / atr)
     minus_di = 100 * (minus_dm.ewm(alpha=1 / period, adjust=False).mean() / atr)
 
@@ -67,13 +68,11 @@ def _compute_adx(df: pd.DataFrame, period: int = 14) -> pd.Series:
     return adx
 
 
-def _compute_atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
-    """Compute ATR."""
-    tr1 = df["high"] - df["low"]
-    tr2 = (df["high"] - df["close"].shift(1)).abs()
-    tr3 = (df["low"] - df["close"].shift(1)).abs()
-    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-    return tr.ewm(alpha=1 / period, adjust=False).mean()
+def _compute_atr(df: pd.DataFrame, period: int = 14, tr: Optional[np.ndarray] = None) -> pd.Series:
+    """Compute ATR. tr: precomputed true_range of df."""
+    if tr is None:
+        tr = true_range(df["high"], df["low"], df["close"])
+    return pd.Series(tr, index=df.index).ewm(alpha=1 / period, adjust=False).mean()
 
 
 def _compute_bb_width(df: pd.DataFrame, period: int = 20, std: float = 2.0) -> pd.Series:
@@ -93,42 +92,39 @@ def _rolling_pct_rank(series: pd.Series, window: int, min_periods: int = 10) ->
 
     For each position *i* the result is the fraction of values in the window
     ``[i-window+1 .. i]`` that are <= the current value (i.e. the percentile
-    rank of the last element within its rolling window).
+    rank of the last element within its rolling window). All windows are
+    compared at once on a sliding_window_view (no per-bar Python loop).
     """
-    arr = series.values.astype(np.float64)
-    n = len(arr)
-    out = np.full(n, np.nan)
-    for i in range(window - 1, n):
-        w = arr[i - window + 1: i + 1]
-        valid_mask = ~np.isnan(w)
-        n_valid = valid_mask.sum()
-        if n_valid >= min_periods:
-            out[i] = np.sum(w[valid_mask] <= w[-1]) / n_valid
+    arr = series.to_numpy(dtype=np.float64)
+    out = np.full(len(arr), np.nan)
+    if window >= 1 and len(arr) >= window:
+        windows = sliding_window_view(arr, window)
+        n_valid = window - np.isnan(windows).sum(axis=1)
+        # NaN compares False, so NaNs never count (and a NaN current value ranks 0)
+        n_le = (windows <= windows[:, -1:]).sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            out[window - 1:] = np.where(n_valid >= min_periods, n_le / n_valid, np.nan)
     return pd.Series(out, index=series.index)
 
 
 def _check_ema_alignment(df: pd.DataFrame, periods: list) -> pd.DataFrame:
     """Check if EMAs are aligned (bullish or bearish trend)."""
-    emas = {}
-    for p in sorted(periods):
-        emas[p] = df["close"].ewm(span=p, adjust=False).mean()
+    close = df["close"]
+    # EMAs from the shortest to the longest period, as float arrays
+    emas = [ema(close, p).to_numpy() for p in sorted(periods)]
 
-    sorted_periods = sorted(periods)
     # Bullish alignment: EMA20 > EMA50 > EMA200
-    bullish = pd.Series(True, index=df.index)
-    bearish = pd.Series(True, index=df.index)
-    for i in range(len(sorted_periods) - 1):
-        short_p = sorted_periods[i]
-        long_p = sorted_periods[i + 1]
-        bullish = bullish & (emas[short_p] > emas[long_p])
-        bearish = bearish & (emas[short_p] < emas[long_p])
+    bullish = np.ones(len(df), dtype=bool)
+    bearish = np.ones(len(df), dtype=bool)
+    for short_ema, long_ema in zip(emas, emas[1:]):
+        bullish &= short_ema > long_ema
+        bearish &= short_ema < long_ema
 
     # aligned = either bullish or bearish alignment
-    aligned = bullish | bearish
     return pd.DataFrame({
         "ema_bullish_aligned": bullish,
         "ema_bearish_aligned": bearish,
-        "ema_aligned": aligned,
+        "ema_aligned": bullish | bearish,
     }, index=df.index)
 
 
@@ -157,11 +153,14 @@ def classify(
         cfg = self.config
         df = df_15m.copy()
 
+        # True range once, shared by ADX and ATR
+        tr = true_range(df["high"], df["low"], df["close"])
+
         # 1. ADX
-        adx = _compute_adx(df, period=cfg["adx_period"])
+        adx = _compute_adx(df, period=cfg["adx_period"], tr=tr)
 
         # 2. ATR + percentile (vectorized — ~50x faster than rolling apply)
-        atr = _compute_atr(df, period=cfg["atr_period"])
+        atr = _compute_atr(df, period=cfg["atr_period"], tr=tr)
         atr_pct = _rolling_pct_rank(atr, window=cfg["lookback"], min_periods=10)
 
         # 3. Bollinger Band width (vectorized)
@@ -176,7 +175,12 @@ def classify(
         if df_1h is not None and not df_1h.empty:
             h1_adx = _compute_adx(df_1h, period=cfg["adx_period"])
             h1_trending_raw = h1_adx > cfg["adx_trending_threshold"]
-            h1_trending = h1_trending_raw.reindex(df.index, method="ffill").fillna(False)
+            if not h1_trending_raw.index.is_monotonic_increasing:
+                h1_trending_raw = h1_trending_raw.sort_index()
+            # As-of lookup (reindex ffill): the last H1 bar at or before each bar, False before the first
+            pos = h1_trending_raw.index.searchsorted(df.index, side="right") - 1
+            raw = h1_trending_raw.to_numpy(dtype=bool)
+            h1_trending = pd.Series(np.where(pos >= 0, raw[np.maximum(pos, 0)], False), index=df.index)
 
         # --- Composite scoring ---
         # Trend score: higher = more trending
@@ -1,6 +1,12 @@
 """Shared pytest fixtures and config."""
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
 import pytest
 
+from src.trader.data.schema import Trade
+
 
 @pytest.fixture
 def sample_config():
@@ -10,3 +16,50 @@ def sample_config():
         "data": {"base_path": "data/market_cache"},
         "backtest": {"default_period_days": 60, "tp_r": 2.0, "sl_r": 1.0},
     }
+
+
+@pytest.fixture(scope="session")
+def synthetic_ohlc():
+    """200 consistent 15m OHLCV bars, built once per session. Read-only: .copy() before mutating."""
+    n = 200
+    rng = np.random.default_rng(42)
+    open_ = 2000 + np.cumsum(rng.standard_normal(n) * 0.5)
+    close = open_ + rng.standard_normal(n) * 1.5
+    # Gapless bars: each bar opens at the previous close
+    open_ = np.concatenate((open_[:1], close[:-1]))
+    return pd.DataFrame({
+        "open": open_,
+        "high": np.maximum(open_, close) + rng.random(n) * 2,
+        "low": np.minimum(open_, close) - rng.random(n) * 2,
+        "close": close,
+        "volume": rng.integers(1000, 10000, n, dtype=np.int32),
+    }, index=pd.date_range("2024-01-01", periods=n, freq="15min"))
+
+
+def _make_trades(n, rng):
+    """n one-hour XAUUSD LONG trades from parallel arrays (one tolist() per column)."""
+    opens = pd.date_range("2024-01-01", periods=n, freq="h").to_pydatetime().tolist()
+    entry = rng.uniform(1990, 2010, n)
+    exit_ = entry + rng.standard_normal(n)
+    return [
+        Trade(
+            timestamp_open=t,
+            timestamp_close=t + timedelta(hours=1),
+            symbol="XAUUSD",
+            direction="LONG",
+            entry_price=e,
+            exit_price=x,
+            sl=e - 10,
+            tp=e + 20,
+            profit_usd=x - e,
+            profit_r=(x - e) / 10,
+            result="WIN" if x > e else "LOSS",
+        )
+        for t, e, x in zip(opens, entry.tolist(), exit_.tolist())
+    ]
+
+
+@pytest.fixture
+def make_trades():
+    """Factory fixture: make_trades(n, rng) -> list of n synthetic Trade objects."""
+    return _make_trades
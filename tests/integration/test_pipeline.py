@@ -1,10 +1,12 @@
 """Integration tests: config load -> data -> backtest path, execution stub."""
 import pytest
 
+from src.trader.backtest.engine import run_backtest
+from src.trader.config import load_config
+from src.trader.execution.broker_stub import OrderRequest, submit_order
+
 
 def test_config_load_and_backtest_engine_import():
-    from src.trader.config import load_config
-    from src.trader.backtest.engine import run_backtest
     cfg = load_config()
     assert "symbol" in cfg or "data" in cfg
     # Korte periode zodat test niet hangt op trage VPS
@@ -14,6 +16,5 @@ def test_config_load_and_backtest_engine_import():
 
 
 def test_broker_stub_accepts_order():
-    from src.trader.execution.broker_stub import submit_order, OrderRequest
     req = OrderRequest(symbol="XAUUSD", direction="BUY", volume=0.01, sl=2000.0, tp=2010.0)
     assert submit_order(req) is True
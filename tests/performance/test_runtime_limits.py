@@ -2,11 +2,12 @@
 import time
 import pytest
 
+from src.trader.backtest.engine import run_backtest
+from src.trader.config import load_config
+
 
 def test_backtest_completes_within_reasonable_time():
     """Backtest should finish within 60s when data is small or missing."""
-    from src.trader.config import load_config
-    from src.trader.backtest.engine import run_backtest
     cfg = load_config()
     start = time.perf_counter()
     trades = run_backtest(cfg)
@@ -2,44 +2,58 @@
 Regression tests: strategy output must stay within guardrails vs baseline.
 Run with fixed dataset/config; compare KPIs to baseline.json.
 """
-import json
-import pytest
 from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
 
+from src.trader.config import load_config
+from src.trader.backtest.engine import run_backtest
+from src.trader.backtest.metrics import compute_metrics
+from src.trader.io.jsonio import loads
 
-def test_regression_winrate_not_below_threshold():
-    """Win rate may not drop more than 2% vs baseline (if baseline exists)."""
-    baseline_path = Path(__file__).resolve().parents[2] / "reports" / "history" / "baseline.json"
-    if not baseline_path.exists():
+BASELINE_PATH = Path(__file__).resolve().parents[2] / "reports" / "history" / "baseline.json"
+
+
+@pytest.fixture(scope="session")
+def baseline_run():
+    """Baseline KPIs and the metrics of one backtest run, shared by all guardrail tests."""
+    if not BASELINE_PATH.exists():
         pytest.skip("No baseline.json yet; create one with make_report.py --baseline")
-    from src.trader.config import load_config
-    from src.trader.backtest.engine import run_backtest
-    from src.trader.backtest.metrics import compute_metrics
-    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
-    kpis_b = baseline.get("kpis", {})
-    baseline_winrate = kpis_b.get("winrate") or (kpis_b.get("win_rate_pct", 0) or kpis_b.get("win_rate", 0)) / 100.0
-    cfg = load_config()
-    trades = run_backtest(cfg)
-    metrics = compute_metrics(trades)
-    current_winrate = metrics.get("win_rate", 0) / 100.0
+    baseline = loads(BASELINE_PATH.read_bytes())
+    trades = run_backtest(load_config())
+    return SimpleNamespace(kpis=baseline.get("kpis", {}), metrics=compute_metrics(trades))
+
+
+def _first(kpis, keys, scale=1.0):
+    """First non-zero KPI among keys, times scale (0.0 if none is set)."""
+    for key in keys:
+        value = kpis.get(key)
+        if value:
+            return value * scale
+    return 0.0
+
+
+def _winrate(kpis):
+    # "winrate" is already a 0-1 fraction (make_report.py); the others are percentages
+    return _first(kpis, ("winrate",)) or _first(kpis, ("win_rate_pct", "win_rate"), scale=0.01)
+
+
+def _trade_count(kpis):
+    return _first(kpis, ("trade_count", "total_trades"))
+
+
+def test_regression_winrate_not_below_threshold(baseline_run):
+    """Win rate may not drop more than 2% vs baseline (if baseline exists)."""
+    baseline_winrate = _winrate(baseline_run.kpis)
+    current_winrate = baseline_run.metrics.get("win_rate", 0) / 100.0
     assert current_winrate >= baseline_winrate - 0.02, "Win rate dropped >2% vs baseline"
 
 
-def test_regression_trade_count_not_exploded():
+def test_regression_trade_count_not_exploded(baseline_run):
     """Trade count may not exceed baseline by >20% (overtrading guard)."""
-    baseline_path = Path(__file__).resolve().parents[2] / "reports" / "history" / "baseline.json"
-    if not baseline_path.exists():
-        pytest.skip("No baseline.json yet")
-    from src.trader.config import load_config
-    from src.trader.backtest.engine import run_backtest
-    from src.trader.backtest.metrics import compute_metrics
-    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
-    cfg = load_config()
-    trades = run_backtest(cfg)
-    metrics = compute_metrics(trades)
-    kpis_b = baseline.get("kpis", {})
-    baseline_count = kpis_b.get("trade_count", 0) or kpis_b.get("total_trades", 0)
+    baseline_count = _trade_count(baseline_run.kpis)
     if baseline_count == 0:
         pytest.skip("Baseline has no trades")
-    current_count = metrics.get("trade_count", 0) or metrics.get("total_trades", 0)
+    current_count = _trade_count(baseline_run.metrics)
     assert current_count <= baseline_count * 1.20, "Trade count >20% above baseline (overtrading)"
@@ -0,0 +1,105 @@
+"""Unit tests for AccountTracker bookkeeping and equity-curve helpers."""
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.trader.execution.account import AccountTracker, build_equity_curve, equity_curve_stats
+
+
+def _run_tracker(**kwargs) -> AccountTracker:
+    acct = AccountTracker(initial_balance=10_000.0, **kwargs)
+    t0 = datetime(2024, 1, 2, 8, 0)
+    ticket = acct.open_position("XAUUSD", "LONG", 2000.0, 1.0, 1990.0, 2020.0, timestamp=t0)
+    short = acct.open_position("XAUUSD", "SHORT", 2001.0, 2.0, 2011.0, 1981.0, timestamp=t0)
+    for k, px in enumerate([2004.0, 1996.0, 2012.0, 2008.0]):
+        acct.update_prices({"XAUUSD": px}, timestamp=t0 + timedelta(minutes=15 * (k + 1)))
+    acct.close_position(ticket, 2008.0, timestamp=t0 + timedelta(hours=2))
+    acct.close_position(short, 2008.0, timestamp=t0 + timedelta(hours=3))
+    return acct
+
+
+def test_close_position_profit_and_daily_tracking():
+    acct = _run_tracker()
+    long_trade, short_trade = acct.closed_trades
+    assert long_trade.profit_usd == 8.0 and abs(long_trade.profit_r - 0.8) < 1e-12
+    assert short_trade.profit_usd == -14.0 and short_trade.result == "LOSS"
+    assert abs(acct.get_daily_pnl_r("2024-01-02") - (0.8 - 0.7)) < 1e-12
+    assert acct.get_daily_trade_count("2024-01-02") == 2
+    assert acct.balance == 10_000.0 - 6.0
+
+
+def test_build_equity_curve_matches_snapshots():
+    acct = _run_tracker()
+    snaps = acct.equity_curve
+    cols = build_equity_curve(
+        np.array([s.balance for s in snaps]),
+        np.array([s.unrealized_pnl for s in snaps]),
+        np.array([s.margin_used for s in snaps]),
+        acct.initial_balance,
+    )
+    np.testing.assert_allclose(cols["equity"], [s.equity for s in snaps])
+    np.testing.assert_allclose(cols["peak_equity"], [s.peak_equity for s in snaps])
+    np.testing.assert_allclose(cols["drawdown_pct"], [s.drawdown_pct for s in snaps])
+    np.testing.assert_allclose(cols["free_margin"], [s.free_margin for s in snaps])
+
+
+def test_record_snapshots_off_keeps_final_state():
+    full = _run_tracker()
+    lean = _run_tracker(record_snapshots=False)
+    assert len(lean.equity_curve) == 0
+    snap = lean.final_snapshot()
+    assert snap.equity == full.equity
+    assert snap.peak_equity == full.peak_equity
+    assert snap.drawdown_pct == full.drawdown_pct
+
+    every3 = _run_tracker(record_every_n=3)
+    assert len(every3.equity_curve) == (len(full.equity_curve) + 2) // 3
+    assert every3.equity_curve[1].equity == full.equity_curve[3].equity
+
+
+def test_equity_curve_stats_matches_loop():
+    eq = np.array([100.0, 110.0, 99.0, 104.5, 120.0, 90.0, 95.0])
+    peak, max_dd = eq[0], 0.0
+    for v in eq:
+        peak = max(peak, v)
+        max_dd = max(max_dd, (peak - v) / peak)
+    stats = equity_curve_stats(eq)
+    assert stats["max_drawdown_pct"] == pytest.approx(max_dd * 100.0)
+    assert stats["return_pct"] == pytest.approx(-5.0)
+    rets = np.diff(eq) / eq[:-1]
+    assert stats["sharpe"] == pytest.approx(rets.mean() / rets.std())
+    assert equity_curve_stats(eq, periods_per_year=4)["sharpe"] == pytest.approx(2 * stats["sharpe"])
+
+    acct = _run_tracker()
+    s = acct.stats()
+    assert s["total_trades"] == 2
+    assert s["win_rate"] == 50.0
+
+
+def test_skip_unchanged_prices():
+    acct = AccountTracker(skip_unchanged_prices=True)
+    t0 = datetime(2024, 1, 2, 8, 0)
+    acct.open_position("XAUUSD", "LONG", 2000.0, 1.0, 1990.0, 2020.0, timestamp=t0)
+    for px in [2001.0, 2001.0, 2001.0, 2002.0, 2002.0]:
+        acct.update_prices({"XAUUSD": px}, timestamp=t0)
+    assert len(acct.equity_curve) == 2
+    assert acct.unrealized_pnl == 2.0
+
+    acct.open_position("XAUUSD", "SHORT", 2002.0, 1.0, 2012.0, 1982.0, timestamp=t0)
+    acct.update_prices({"XAUUSD": 2002.0}, timestamp=t0)
+    assert len(acct.equity_curve) == 3
+
+
+def test_update_prices_keeps_position_objects_current():
+    acct = AccountTracker()
+    t0 = datetime(2024, 1, 2, 8, 0)
+    long_t = acct.open_position("XAUUSD", "LONG", 2000.0, 1.0, 1990.0, 2020.0, timestamp=t0)
+    short_t = acct.open_position("XAUUSD", "SHORT", 2001.0, 2.0, 2011.0, 1981.0, timestamp=t0)
+    acct.update_prices({"XAUUSD": 2004.0}, timestamp=t0)
+    acct.close_position(long_t, 2004.0, timestamp=t0)
+    acct.update_prices({"XAUUSD": 1996.0}, timestamp=t0)
+    short = acct.positions[short_t]
+    assert (short.current_price, short.unrealized_pnl) == (1996.0, 10.0)
+    acct.close_position(short_t, 1995.0, timestamp=t0)
+    assert (short.current_price, short.unrealized_pnl) == (1995.0, 10.0)
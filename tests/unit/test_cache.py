@@ -0,0 +1,69 @@
+"""Unit tests for the in-memory DataFrame cache (LRU caps, TTL, keys)."""
+from datetime import datetime, timezone
+
+import pandas as pd
+import pytest
+
+from src.trader.io import cache
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    cache.clear()
+    yield
+    cache.clear()
+    cache.set_max_entries(128)
+    cache.set_max_bytes(0)
+    cache.set_ttl_hours(24.0)
+
+
+def _frame(n=10):
+    return pd.DataFrame({"close": range(n)}, dtype="float64")
+
+
+def test_lru_entry_cap_evicts_least_recently_used():
+    cache.set_max_entries(2)
+    a, b, c = _frame(), _frame(), _frame()
+    cache.set("xauusd", "15m", a)
+    cache.set("XAUUSD", "1h", b)
+    assert cache.get("XAUUSD", "15m") is a  # a is now most recently used
+    cache.set("XAUUSD", "4h", c)
+    assert cache.get("XAUUSD", "1h") is None
+    assert cache.get("XAUUSD", "15m") is a
+    assert cache.get("XAUUSD", "4h") is c
+
+
+def test_byte_cap_keeps_newest_entry():
+    small, big = _frame(10), _frame(10_000)
+    cache.set_max_bytes(int(small.memory_usage(index=True, deep=True).sum()) * 3)
+    cache.set("XAUUSD", "15m", small)
+    cache.set("XAUUSD", "1h", big)  # over the cap on its own: evicts the rest, stays cached
+    assert cache.get("XAUUSD", "15m") is None
+    assert cache.get("XAUUSD", "1h") is big
+
+
+def test_ttl_expiry(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    cache.set_ttl_hours(1.0)
+    df = _frame()
+    cache.set("XAUUSD", "15m", df)
+    now[0] += 3599.0
+    assert cache.get("XAUUSD", "15m") is df
+    now[0] += 2.0
+    assert cache.get("XAUUSD", "15m") is None
+
+    cache.set_ttl_hours(0)  # 0 = no expiry
+    cache.set("XAUUSD", "15m", df)
+    now[0] += 10 * 86400.0
+    assert cache.get("XAUUSD", "15m") is df
+
+
+def test_naive_and_aware_bounds_are_distinct_keys():
+    naive, aware = _frame(), _frame()
+    start = datetime(2024, 1, 1)
+    cache.set("XAUUSD", "15m", naive, start=start)
+    cache.set("XAUUSD", "15m", aware, start=start.replace(tzinfo=timezone.utc))
+    assert cache.get("XAUUSD", "15m", start=start) is naive
+    assert cache.get("XAUUSD", "15m", start=pd.Timestamp(start)) is naive
+    assert cache.get("XAUUSD", "15m", start=pd.Timestamp(start, tz="UTC")) is aware
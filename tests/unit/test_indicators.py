@@ -3,20 +3,27 @@
 import numpy as np
 import pytest
 
+from src.trader.data.schema import calculate_rr
+from src.trader.execution.risk import check_max_daily_loss_r
+from src.trader.execution.sizing import size_from_r
+from src.trader.indicators.adx import adx_batch, adx_full
+from src.trader.indicators.atr import atr
+from src.trader.indicators.bollinger import _rolling_last_pct_rank, bb_width
+from src.trader.indicators.ema import EMAState, ema
+
 
 def test_atr_output_shape():
-    from src.trader.indicators.atr import atr
     n = 50
-    high = pd.Series(2000 + np.random.rand(n) * 10)
-    low = pd.Series(2000 - np.random.rand(n) * 10)
-    close = pd.Series(2000 + np.random.randn(n) * 2)
+    rng = np.random.default_rng(42)
+    high = pd.Series(2000 + rng.random(n) * 10)
+    low = pd.Series(2000 - rng.random(n) * 10)
+    close = pd.Series(2000 + rng.standard_normal(n) * 2)
     result = atr(high, low, close, period=14)
     assert len(result) == n
     assert result.iloc[-1] >= 0
 
 
 def test_ema_output():
-    from src.trader.indicators.ema import ema
     s = pd.Series([100, 102, 101, 105, 104])
     out = ema(s, 3)
     assert len(out) == len(s)
@@ -24,19 +31,44 @@ def test_ema_output():
 
 
 def test_calculate_rr_long_win():
-    from src.trader.data.schema import calculate_rr
     # entry 100, sl 98, exit 104 -> risk 2, profit 4 -> R = 2
     r = calculate_rr(100.0, 104.0, 98.0, "LONG")
     assert abs(r - 2.0) < 1e-6
 
 
 def test_risk_check_max_daily_loss():
-    from src.trader.execution.risk import check_max_daily_loss_r
     assert check_max_daily_loss_r(-2.0, 3.0) is True
     assert check_max_daily_loss_r(-4.0, 3.0) is False
 
 
 def test_sizing_from_r():
-    from src.trader.execution.sizing import size_from_r
     frac = size_from_r(10000.0, risk_r=1.0, risk_pct_per_r=0.01)
     assert frac == 0.01
+
+
+def test_bb_squeeze_percentile_matches_rolling_rank():
+    close = pd.Series(2000 + np.round(np.random.default_rng(0).normal(size=200).cumsum()))
+    width = bb_width(close)
+    expected = width.rolling(50, min_periods=10).apply(
+        lambda x: pd.Series(x).rank(pct=True).iloc[-1], raw=False
+    )
+    pd.testing.assert_series_equal(_rolling_last_pct_rank(width, 50, min_periods=10), expected)
+
+
+def test_ema_state_matches_full_recompute():
+    close = pd.Series(2000 + np.random.default_rng(1).normal(size=120).cumsum())
+    state = EMAState(20, seed=close.iloc[:100])
+    incremental = [state.update(px) for px in close.iloc[100:]]
+    assert incremental == ema(close, 20).iloc[100:].tolist()
+
+
+def test_adx_batch_matches_per_instrument():
+    rng = np.random.default_rng(3)
+    close = pd.DataFrame(2000 + rng.normal(size=(300, 3)).cumsum(axis=0), columns=["XAU", "XAG", "EUR"])
+    high = close + rng.random((300, 3))
+    low = close - rng.random((300, 3))
+    batch = adx_batch(high, low, close)
+    for col in close.columns:
+        single = adx_full(high[col], low[col], close[col])
+        for key, values in single.items():
+            np.testing.assert_array_equal(batch[key][col].to_numpy(), values.to_numpy())
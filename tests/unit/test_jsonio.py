@@ -0,0 +1,19 @@
+"""Unit tests for the shared JSON bytes helpers (numpy values, indent, round-trip)."""
+import numpy as np
+
+from src.trader.io.jsonio import dumps, loads
+
+
+def test_dumps_numpy_scalars_round_trip():
+    data = {"price": np.float64(2000.5), "units": np.int64(10), "tag": "XAU_USD"}
+    raw = dumps(data)
+    assert isinstance(raw, bytes)
+    assert b"\n" not in raw
+    assert loads(raw) == {"price": 2000.5, "units": 10, "tag": "XAU_USD"}
+
+
+def test_dumps_indent_is_readable_and_equivalent():
+    data = {"configs": [{"reward": 1.25}], "n": 1}
+    raw = dumps(data, indent=True)
+    assert raw.startswith(b"{\n  ")
+    assert loads(raw) == loads(dumps(data)) == data
@@ -3,20 +3,22 @@
 import pandas as pd
 import pytest
 
-from src.trader.ml.config_space import get_default_config_space, sample_config, config_to_backtest_cfg
+from src.trader.ml.config_space import get_default_config_space, sample_config, sample_configs, config_to_backtest_cfg
 from src.trader.ml.rewards import calculate_reward, calculate_reward_from_trades
 from src.trader.ml.features.pipeline import FeatureExtractionPipeline
 from src.trader.ml.strategy_optimizer import StrategyOptimizer
+from src.trader.ml.ucb_sampler import UCBConfigSampler
+from src.trader.ml.knowledge_base import StrategyKnowledgeBase
 from src.trader.data.schema import Trade
 from datetime import datetime, timedelta
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def config_space():
     return get_default_config_space()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_metrics():
     return {
         "total_profit_r": 2.0,
@@ -37,6 +39,23 @@ def test_sample_config(config_space):
     assert c["strategy"]["use_mss"] in (True, False)
 
 
+def test_sample_configs_batch(config_space):
+    rng = np.random.default_rng(42)
+    base = {"symbol": "XAUUSD", "strategy": {"displacement": {"min_candles": 2.6, "extra": 1}}}
+    batch = sample_configs(config_space, 50, base_config=base, rng=rng)
+    assert len(batch) == 50
+    single = sample_config(config_space, base_config=base, rng=np.random.default_rng(0))
+    for c in batch:
+        assert c.keys() == single.keys()
+        assert c["symbol"] == "XAUUSD"
+        assert c["strategy"]["displacement"]["extra"] == 1
+        assert 1.5 <= c["backtest"]["tp_r"] <= 3.0
+        assert 0.05 <= c["strategy"]["market_structure_shift"]["break_threshold_pct"] <= 0.5
+        assert isinstance(c["strategy"]["liquidity_sweep"]["lookback_candles"], int)
+        assert c["strategy"]["use_mss"] in (True, False)
+    assert len({c["backtest"]["tp_r"] for c in batch}) == 50
+
+
 def test_config_to_backtest_cfg(config_space):
     base = {"symbol": "XAUUSD", "timeframes": ["15m"], "data": {"base_path": "data/market_cache"}}
     sampled = sample_config(config_space, rng=np.random.default_rng(1))
@@ -54,39 +73,14 @@ def test_calculate_reward(sample_metrics):
     assert r2 == 0.0
 
 
-def test_calculate_reward_from_trades():
-    trades = [
-        Trade(
-            timestamp_open=datetime.now(),
-            timestamp_close=datetime.now() + timedelta(hours=1),
-            symbol="XAUUSD",
-            direction="LONG",
-            entry_price=2000.0,
-            exit_price=2010.0,
-            sl=1990.0,
-            tp=2020.0,
-            profit_usd=10.0,
-            profit_r=0.5,
-            result="WIN",
-        ),
-    ]
+def test_calculate_reward_from_trades(make_trades):
+    trades = make_trades(1, np.random.default_rng(0))
     r = calculate_reward_from_trades(trades)
     assert isinstance(r, (float, np.floating))
 
 
-def test_feature_pipeline():
-    n = 100
-    idx = pd.date_range("2024-01-01", periods=n, freq="15min")
-    df = pd.DataFrame(
-        {
-            "open": 2000 + np.cumsum(np.random.randn(n) * 2),
-            "high": 2000 + np.cumsum(np.random.randn(n) * 2) + np.abs(np.random.randn(n)) * 5,
-            "low": 2000 + np.cumsum(np.random.randn(n) * 2) - np.abs(np.random.randn(n)) * 5,
-            "close": 2000 + np.cumsum(np.random.randn(n) * 2),
-            "volume": np.random.randint(1000, 10000, n),
-        },
-        index=idx,
-    )
+def test_feature_pipeline(synthetic_ohlc):
+    df = synthetic_ohlc
     pipeline = FeatureExtractionPipeline()
     out = pipeline.fit_transform(df)
     assert "feat_atr_pct" in out.columns
@@ -95,6 +89,44 @@ def test_feature_pipeline():
     assert len(pipeline.feature_columns) >= 10
 
 
+def test_feature_pipeline_fused_matches_modules():
+    n = 300
+    rng = np.random.default_rng(7)
+    close = 2000 + np.cumsum(rng.normal(size=n))
+    df = pd.DataFrame(
+        {
+            "open": close,
+            "high": close + rng.random(n) * 3,
+            "low": close - rng.random(n) * 3,
+            "close": close,
+            "volume": rng.integers(0, 1000, n),
+        },
+        index=pd.date_range("2024-01-01", periods=n, freq="15min"),
+    )
+    fused = FeatureExtractionPipeline().fit_transform(df)
+    chained = FeatureExtractionPipeline(fused=False).fit_transform(df)
+    pd.testing.assert_frame_equal(fused, chained)
+
+
+def test_feature_pipeline_disk_cache(tmp_path):
+    n = 300
+    rng = np.random.default_rng(3)
+    close = 2000 + np.cumsum(rng.normal(size=n))
+    df = pd.DataFrame(
+        {"open": close, "high": close + 1, "low": close - 1, "close": close, "volume": rng.integers(0, 1000, n)},
+        index=pd.date_range("2024-01-01", periods=n, freq="15min"),
+    )
+    fresh = FeatureExtractionPipeline(cache_dir=tmp_path).fit_transform(df)
+    assert len(list(tmp_path.glob("*.parquet"))) == 1
+    pipe = FeatureExtractionPipeline(cache_dir=tmp_path)
+    pd.testing.assert_frame_equal(pipe.fit_transform(df), fresh)
+    assert pipe.feature_columns == [c for c in fresh.columns if c.startswith("feat_")]
+
+    # Different data -> different key, no stale hit
+    FeatureExtractionPipeline(cache_dir=tmp_path).fit_transform(df.assign(close=df["close"] + 1))
+    assert len(list(tmp_path.glob("*.parquet"))) == 2
+
+
 def test_strategy_optimizer_generate_and_evaluate(sample_config):
     """Test that optimizer generates configs and can evaluate via mock backtest."""
     base = {**sample_config, "backtest": {**sample_config.get("backtest", {}), "default_period_days": 30}}
@@ -111,3 +143,86 @@ def mock_backtest(_cfg):
     opt.update_strategy(c, reward)
     assert opt.historical_performance
     assert opt.get_best_config() is not None
+
+
+def _tp_trades_backtest(cfg):
+    """Module-level (picklable) mock: one winning trade sized by tp_r."""
+    tp = cfg["backtest"]["tp_r"]
+    t0 = datetime(2024, 1, 1)
+    return [
+        Trade(
+            timestamp_open=t0,
+            timestamp_close=t0 + timedelta(hours=1),
+            symbol="XAUUSD",
+            direction="LONG",
+            entry_price=2000.0,
+            exit_price=2000.0 + tp,
+            sl=1999.0,
+            tp=2000.0 + tp,
+            profit_usd=tp,
+            profit_r=tp,
+            result="WIN",
+        ),
+    ]
+
+
+def test_ucb_sampler_concentrates_on_best_bin(config_space):
+    space = config_space
+    sampler = UCBConfigSampler(space, n_bins=5)
+    rng = np.random.default_rng(0)
+    for _ in range(300):
+        cfg = sampler.sample(rng)
+        # Best reward for tp_r in the top cell [2.7, 3.0)
+        sampler.update(cfg, -abs(cfg["backtest"]["tp_r"] - 2.9) + rng.normal(scale=0.05))
+    tp_row = list(space["backtest"]).index("tp_r")
+    assert int(np.argmax(sampler.pulls[tp_row])) == 4
+    assert sampler.bins_of({"backtest": {"tp_r": 2.95}})[tp_row] == 4
+
+
+def test_optimizer_ucb1_sampler(sample_config):
+    base = {**sample_config, "backtest": {**sample_config.get("backtest", {}), "default_period_days": 30}}
+    opt = StrategyOptimizer(base_config=base, backtest_fn=lambda cfg: [], seed=1, sampler="ucb1")
+    rewards = opt.run_n_steps(6)
+    assert len(rewards) == 6
+    assert opt._ucb.total_pulls == 6
+    with pytest.raises(ValueError):
+        StrategyOptimizer(sampler="bogus")
+
+
+def test_spawn_rngs_independent_and_reproducible():
+    a = StrategyOptimizer(seed=5).spawn_rngs(3)
+    b = StrategyOptimizer(seed=5).spawn_rngs(3)
+    draws_a = [g.uniform(size=4).tolist() for g in a]
+    assert draws_a == [g.uniform(size=4).tolist() for g in b]
+    assert len({tuple(d) for d in draws_a}) == 3
+
+
+def test_knowledge_base_save_load_roundtrip(tmp_path):
+    kb = StrategyKnowledgeBase(storage_path=tmp_path / "kb.json")
+    kb.record_evaluation({"backtest": {"tp_r": np.float64(2.5)}}, 1.5, {"trades": np.int64(12)}, regime="trend")
+    kb.save()
+    loaded = StrategyKnowledgeBase(storage_path=tmp_path / "kb.json")
+    loaded.load()
+    assert loaded.get_top_configs(1) == [{"backtest": {"tp_r": 2.5}}]
+    assert loaded.successful_configs[0]["metrics"] == {"trades": 12}
+
+
+def test_knowledge_base_ids_unique_across_sessions(tmp_path):
+    path = tmp_path / "kb.json"
+    first = StrategyKnowledgeBase(storage_path=path)
+    ids = [first.record_evaluation({"n": i}, 1.0, {}) for i in range(3)]
+    first.save()
+    second = StrategyKnowledgeBase(storage_path=path)
+    second.load()
+    ids += [second.record_evaluation({"n": i}, 1.0, {}) for i in range(3)]
+    assert len(set(ids)) == 6
+    assert len({e["id"] for e in second.genealogy}) == len(second.genealogy)
+
+
+def test_evaluate_configs_parallel_matches_sequential(sample_config):
+    seq = StrategyOptimizer(base_config=sample_config, backtest_fn=_tp_trades_backtest, seed=5)
+    par = StrategyOptimizer(base_config=sample_config, backtest_fn=_tp_trades_backtest, seed=5)
+    configs = [seq.generate_candidate_config() for _ in range(4)]
+    expected = [seq.evaluate_config(c) for c in configs]
+    assert par.evaluate_configs(configs, max_workers=2) == expected
+    assert [h["metrics"] for h in par.historical_performance] == [h["metrics"] for h in seq.historical_performance]
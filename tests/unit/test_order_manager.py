@@ -0,0 +1,143 @@
+"""Unit tests for OrderManager state persistence."""
+import threading
+import time
+
+from src.trader.execution.order_manager import OrderManager
+
+
+def test_wal_replay_and_snapshot(tmp_path):
+    state_file = tmp_path / "state.json"
+    om = OrderManager(state_file=state_file)
+    om.register_trade("1", "XAU_USD", "LONG", 2000.0, 10, 1990.0, 2020.0)
+    om.register_trade("2", "XAU_USD", "SHORT", 2001.0, 5, 2011.0, 1981.0)
+    om.update_price("2", 1990.0)  # break-even + partial close, logged to the WAL
+    om.unregister_trade("1")
+    assert not state_file.exists()  # no snapshot yet, only WAL lines
+
+    restored = OrderManager(state_file=state_file)
+    assert restored.load_state() == 1
+    order = restored.managed_orders["2"]
+    assert order.break_even_set and order.partial_closed and order.units == om.managed_orders["2"].units
+
+    om.save_state()
+    assert state_file.exists() and om.wal_file.read_bytes() == b""
+    again = OrderManager(state_file=state_file)
+    assert again.load_state() == 1
+
+
+def test_snapshots_coalesce(tmp_path):
+    state_file = tmp_path / "state.json"
+    om = OrderManager(state_file=state_file, save_interval=0.2, snapshot_every=1)
+    om.register_trade("1", "XAU_USD", "LONG", 2000.0, 10, 1990.0, 2020.0)
+    assert state_file.exists()  # first snapshot is immediate
+    om.register_trade("2", "XAU_USD", "SHORT", 2001.0, 5, 2011.0, 1981.0)
+    om.unregister_trade("1")
+
+    deadline = time.monotonic() + 5.0  # pending snapshot flushed by the timer
+    while om.wal_file.read_bytes() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert om.wal_file.read_bytes() == b""
+    restored = OrderManager(state_file=state_file)
+    assert restored.load_state() == 1
+    assert restored.managed_orders["2"].direction == "SHORT"
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_update_prices_matches_per_trade_updates(tmp_path):
+    def run(batch):
+        om = OrderManager(state_file=tmp_path / ("b.json" if batch else "s.json"))
+        om.register_trade("L", "XAU_USD", "LONG", 2000.0, 10, 1990.0, 2030.0)
+        om.register_trade("S", "XAU_USD", "SHORT", 2000.0, 10, 2010.0, 1970.0)
+        om.register_trade("G", "XAG_USD", "LONG", 25.0, 100, 24.5, 26.0)
+        for xau, xag in [(2004.0, 25.1), (1995.0, 25.3), (2012.0, 24.9), (2021.0, 25.8), (2016.0, 25.6)]:
+            prices = {"XAU_USD": xau, "XAG_USD": xag}
+            if batch:
+                om.update_prices(prices)
+            else:
+                for tid, o in list(om.managed_orders.items()):
+                    om.update_price(tid, prices[o.instrument])
+        return [(o.current_sl, o.units, o.peak_price, o.break_even_set, o.partial_closed, o.trailing_active)
+                for o in om.managed_orders.values()]
+
+    assert run(batch=True) == run(batch=False)
+
+
+def test_async_callbacks_deliver_in_order(tmp_path):
+    om = OrderManager(state_file=tmp_path / "state.json", async_callbacks=True)
+    seen = []
+    om.add_callback(lambda event, order, details: seen.append((event, order.trade_id, order.break_even_set)))
+    om.register_trade("1", "XAU_USD", "LONG", 2000.0, 10, 1990.0, 2020.0)
+    om.update_price("1", 2010.0)
+    om.unregister_trade("1")
+    om.stop_callbacks()
+    assert seen == [
+        ("REGISTERED", "1", False),
+        ("BREAK_EVEN", "1", True),
+        ("PARTIAL_CLOSE", "1", True),
+        ("UNREGISTERED", "1", True),
+    ]
+
+
+def _stalled_dispatcher(om, seen):
+    """Callback that blocks the dispatcher in its first event until gate is set."""
+    started, gate = threading.Event(), threading.Event()
+
+    def slow(event, order, details):
+        started.set()
+        gate.wait()
+        seen.append((event, order.trade_id, order.current_sl))
+
+    om.add_callback(slow)
+    return started, gate
+
+
+def test_full_callback_buffer_keeps_latest_sl_update_per_trade(tmp_path, monkeypatch):
+    import src.trader.execution.order_manager as om_mod
+    monkeypatch.setattr(om_mod, "CALLBACK_QUEUE_SIZE", 4)
+    om = OrderManager(state_file=tmp_path / "state.json", async_callbacks=True)
+    seen = []
+    started, gate = _stalled_dispatcher(om, seen)
+    om.register_trade("1", "XAU_USD", "LONG", 2000.0, 10, 1990.0, 2020.0)
+    assert started.wait(5)  # the dispatcher is now stuck in the first callback
+    om.register_trade("2", "XAU_USD", "LONG", 2000.0, 10, 1990.0, 2050.0)
+    om.update_price("2", 2010.0)  # BREAK_EVEN, PARTIAL_CLOSE
+    om.update_price("2", 2030.0)  # TRAILING_STOP -> buffer full
+    tick = threading.Thread(target=lambda: [om.update_price("2", px) for px in (2040.0, 2045.0)])
+    tick.start()
+    tick.join(5)
+    blocked = tick.is_alive()
+    gate.set()
+    tick.join()
+    om.stop_callbacks()
+    assert not blocked
+    assert [e[:2] for e in seen] == [
+        ("REGISTERED", "1"), ("REGISTERED", "2"), ("PARTIAL_CLOSE", "2"),
+        ("TRAILING_STOP", "2"), ("TRAILING_STOP", "2"),
+    ]
+    assert seen[-1][2] == om.managed_orders["2"].current_sl == 2035.0
+    assert om.coalesced_events == 2
+
+
+def test_full_callback_buffer_waits_instead_of_dropping(tmp_path, monkeypatch):
+    import src.trader.execution.order_manager as om_mod
+    monkeypatch.setattr(om_mod, "CALLBACK_QUEUE_SIZE", 2)
+    om = OrderManager(state_file=tmp_path / "state.json", async_callbacks=True)
+    seen = []
+    started, gate = _stalled_dispatcher(om, seen)
+    om.register_trade("1", "XAU_USD", "LONG", 2000.0, 10, 1990.0, 2020.0)
+    assert started.wait(5)
+    om.register_trade("2", "XAU_USD", "LONG", 2000.0, 10, 1990.0, 2020.0)
+    om.register_trade("3", "XAU_USD", "LONG", 2000.0, 10, 1990.0, 2020.0)  # buffer full, nothing to supersede
+    tick = threading.Thread(target=om.update_price, args=("1", 2010.0))
+    tick.start()
+    tick.join(0.2)
+    waited = tick.is_alive()
+    gate.set()
+    tick.join(5)
+    om.stop_callbacks()
+    assert waited and not tick.is_alive()
+    assert [e[:2] for e in seen] == [
+        ("REGISTERED", "1"), ("REGISTERED", "2"), ("REGISTERED", "3"),
+        ("BREAK_EVEN", "1"), ("PARTIAL_CLOSE", "1"),
+    ]
+    assert om.coalesced_events == 0
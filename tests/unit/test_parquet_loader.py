@@ -0,0 +1,34 @@
+"""Unit tests for Parquet load/save."""
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from src.trader.io import parquet_loader
+from src.trader.io.parquet_loader import _footer_row_bounds, load_parquet, path_for, save_parquet
+
+
+def test_load_range_and_columns(tmp_path):
+    idx = pd.date_range("2024-01-01", periods=2000, freq="15min", tz="UTC")
+    df = pd.DataFrame({"open": np.arange(2000.0), "close": np.arange(2000.0) + 0.5}, index=idx)
+    save_parquet(tmp_path, "xauusd", "15m", df)
+
+    start, end = datetime(2024, 1, 5), datetime(2024, 1, 6)
+    out = load_parquet(tmp_path, "XAUUSD", "15m", start=start, end=end, columns=["close"])
+    expected = df.loc[pd.Timestamp(start, tz="UTC"):pd.Timestamp(end, tz="UTC"), ["close"]]
+    pd.testing.assert_frame_equal(out, expected, check_freq=False)
+
+
+def test_footer_row_bounds(tmp_path, monkeypatch):
+    monkeypatch.setattr(parquet_loader, "ROW_GROUP_SIZE", 100)
+    idx = pd.date_range("2024-01-01", periods=1000, freq="15min", tz="UTC")
+    save_parquet(tmp_path, "XAUUSD", "15m", pd.DataFrame({"close": np.arange(1000.0)}, index=idx))
+    p = path_for(tmp_path, "XAUUSD", "15m")
+
+    start, end = datetime(2024, 1, 2), datetime(2024, 1, 5)
+    at_least, at_most = _footer_row_bounds(p, start, end)
+    n = len(load_parquet(tmp_path, "XAUUSD", "15m", start=start, end=end))
+    assert at_least <= n <= at_most
+    assert at_most - at_least <= 2 * 100
+    assert _footer_row_bounds(p, None, None) == (1000, 1000)
+    assert _footer_row_bounds(p, datetime(2025, 1, 1), None) == (0, 0)
@@ -0,0 +1,43 @@
+"""Unit tests for the sentiment engine (no network)."""
+import numpy as np
+
+from src.trader.data.sentiment import (
+    SentimentEngine,
+    SentimentReading,
+    _normalize_direct,
+    _normalize_inverse,
+    composite_score_batch,
+    normalize_batch,
+)
+
+
+def test_composite_score_batch_matches_scalar():
+    engine = SentimentEngine()
+    sources = list(engine.weights)
+    weights = np.array([engine.weights[s] for s in sources])
+    rng = np.random.default_rng(7)
+    normalized = rng.uniform(-1.0, 1.0, size=(20, len(sources)))
+    stale = rng.random((20, len(sources))) < 0.3
+    stale[0] = True  # all stale -> score 0
+
+    scores, confidences = composite_score_batch(normalized, weights, stale)
+
+    for i in range(len(normalized)):
+        readings = [
+            SentimentReading(s, 0.0, normalized[i, k], weights[k], stale=bool(stale[i, k]))
+            for k, s in enumerate(sources)
+        ]
+        c = engine.composite_score(readings)
+        assert abs(scores[i] - c.score) < 1e-12
+        assert abs(confidences[i] - c.confidence) < 1e-12
+
+
+def test_normalize_batch_matches_scalar():
+    values = np.array([101.0, 99.0, 100.0, 250.0])
+    mean = np.array([100.0, 100.0, 100.0, 100.0])
+    std = np.array([2.0, 0.5, 0.0, 3.0])
+    direct = normalize_batch(values, mean, std)
+    inverse = normalize_batch(values, mean, std, inverse=True)
+    for i in range(len(values)):
+        assert abs(direct[i] - _normalize_direct(values[i], mean[i], std[i])) < 1e-12
+        assert abs(inverse[i] - _normalize_inverse(values[i], mean[i], std[i])) < 1e-12
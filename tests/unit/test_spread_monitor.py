@@ -0,0 +1,61 @@
+"""Unit tests for the spread monitor ring buffer."""
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from src.trader.data.spread_monitor import SpreadMonitor, SpreadStatus
+
+
+def _brute_force(ticks, minutes, history_size):
+    """(avg, max) over the last history_size ticks newer than now - minutes."""
+    cutoff = datetime.utcnow() - timedelta(minutes=minutes)
+    recent = [pips for ts, pips in ticks[-history_size:] if ts >= cutoff]
+    return (float(np.mean(recent)), float(max(recent))) if recent else (0.0, 0.0)
+
+
+def _feed(monitor, offsets_sec, rng):
+    now = datetime.utcnow()
+    ticks = []
+    for off in offsets_sec:
+        ts = now - timedelta(seconds=float(off))
+        spread = float(rng.uniform(0.01, 0.5))
+        status = monitor.update(2000.0, 2000.0 + spread, timestamp=ts)
+        ticks.append((ts, status.spread_pips))
+    return ticks
+
+
+def test_update_returns_status():
+    monitor = SpreadMonitor(max_spread_pips=40.0, warning_spread_pips=25.0)
+    status = monitor.update(2000.0, 2000.30)
+    assert isinstance(status, SpreadStatus)
+    assert status.spread_pips == pytest.approx(30.0)
+    assert status.warning and status.ok and not status.blocked
+    assert monitor.update(2000.0, 2000.50).blocked
+    assert monitor.blocked_count == 1 and monitor.warning_count == 1
+
+
+@pytest.mark.parametrize("shuffle", [False, True])
+def test_recent_spreads_match_brute_force_after_wraparound(shuffle):
+    rng = np.random.default_rng(0)
+    monitor = SpreadMonitor(history_size=64)
+    offsets = np.linspace(3600, 0, 250)  # one hour of ticks, oldest first; wraps the ring
+    if shuffle:
+        offsets[[100, 200, 240]] = offsets[[240, 100, 200]]  # backfilled ticks
+    ticks = _feed(monitor, offsets, rng)
+    for minutes in (1, 5, 15, 120):
+        avg, mx = _brute_force(ticks, minutes, 64)
+        assert monitor.get_average_spread(minutes) == pytest.approx(avg)
+        assert monitor.get_max_spread(minutes) == pytest.approx(mx)
+
+
+def test_out_of_order_tick_ages_out_of_the_buffer():
+    rng = np.random.default_rng(1)
+    monitor = SpreadMonitor(history_size=8)
+    _feed(monitor, [60, 120, 50], rng)
+    assert monitor._ticks <= monitor._unsorted_until
+    ticks = _feed(monitor, np.linspace(40, 0, 8), rng)
+    assert monitor._ticks > monitor._unsorted_until
+    avg, mx = _brute_force(ticks, 1, 8)
+    assert monitor.get_average_spread(1) == pytest.approx(avg)
+    assert monitor.get_max_spread(1) == pytest.approx(mx)
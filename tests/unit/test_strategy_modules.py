@@ -0,0 +1,28 @@
+"""Unit tests for strategy modules (ICT)."""
+import gc
+
+from src.trader.strategy_modules.ict.displacement import DisplacementModule
+
+
+def _entries(module, df, direction="LONG"):
+    return sum(module.check_entry_condition(df, i, {}, direction) for i in range(len(df)))
+
+
+def test_flag_cache_refreshes_after_inplace_recalculate(synthetic_ohlc):
+    module = DisplacementModule()
+    df = synthetic_ohlc.copy()
+    loose = {"min_body_pct": 50, "min_candles": 1}
+    strict = {"min_body_pct": 90, "min_candles": 10}
+    module.calculate(df, loose, inplace=True)
+    assert _entries(module, df) == df["bullish_disp"].sum() > 0
+    module.calculate(df, strict, inplace=True)
+    assert _entries(module, df) == df["bullish_disp"].sum() == 0
+
+
+def test_flag_cache_does_not_keep_frame_alive(synthetic_ohlc):
+    module = DisplacementModule()
+    df = module.calculate(synthetic_ohlc, {"min_body_pct": 50, "min_candles": 1})
+    module.check_entry_condition(df, 0, {}, "LONG")
+    del df
+    gc.collect()
+    assert module._flag_cache is None